@@ -0,0 +1,226 @@
+# backfill.py - 히스토리 캔들 백필 모듈
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import Config
+from data_collector import BybitAPI, TIMEFRAME_MS, decode_klines
+from candle_store import CandleArchive, HistoryStore, ARCHIVE_DTYPE, CANDLE_COLUMNS
+
+class HistoryBackfiller:
+    """과거 캔들 백필 (end 기준 역방향 페이지 조회, 중단 후 이어받기)"""
+    
+    # 바이비트 K-라인 요청당 최대 캔들 수
+    PAGE_LIMIT = 1000
+    
+    def __init__(self, api: BybitAPI, data_dir: str = 'data/history', max_concurrency: int = 4):
+        self.api = api
+        self.store = HistoryStore(data_dir)
+        self.logger = logging.getLogger(__name__)
+        
+        # 동시 진행 (심볼, 시간대) 수 제한 (요청 속도는 RateLimiter가 제한)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        
+        # 통계
+        self.stats = {'pages': 0, 'candles': 0, 'resumed': 0, 'failed': 0}
+    
+    def get_archive(self, symbol: str, timeframe: str) -> CandleArchive:
+        """(심볼, 시간대) 아카이브"""
+        return self.store.get_archive(symbol, timeframe)
+    
+    async def backfill(self, symbols: List[str], timeframes: List[str],
+                       days: int) -> Dict[Tuple[str, str], int]:
+        """심볼 x 시간대 동시 백필, (심볼, 시간대)별 추가 캔들 수 반환"""
+        start_ms = int((time.time() - days * 86400) * 1000)
+        jobs = [(symbol, timeframe) for symbol in symbols for timeframe in timeframes]
+        
+        self.logger.info(f"📥 히스토리 백필 시작 ({len(jobs)}개 작업, {days}일)")
+        
+        results = await asyncio.gather(
+            *(self._run_job(symbol, timeframe, start_ms) for symbol, timeframe in jobs),
+            return_exceptions=True
+        )
+        
+        # 한 작업의 실패가 다른 작업을 중단시키지 않음 (체크포인트로 재시도 가능)
+        added = {}
+        for job, result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                self.stats['failed'] += 1
+                self.logger.error(f"❌ {job[0]} {job[1]} 백필 실패: {str(result)}")
+            else:
+                added[job] = result
+        
+        self.logger.info(
+            f"✅ 히스토리 백필 완료 (페이지 {self.stats['pages']}개, "
+            f"캔들 {self.stats['candles']}개, 실패 {self.stats['failed']}개)"
+        )
+        return added
+    
+    async def _run_job(self, symbol: str, timeframe: str, start_ms: int) -> int:
+        """동시 실행 수 제한 하에 작업 1개 실행"""
+        async with self._semaphore:
+            return await self.backfill_one(symbol, timeframe, start_ms)
+    
+    async def backfill_one(self, symbol: str, timeframe: str, start_ms: int) -> int:
+        """(심볼, 시간대) 1개 백필 - 아카이브 마지막 캔들 이후(또는 start_ms)부터 현재까지"""
+        archive = self.get_archive(symbol, timeframe)
+        part_path = archive.path + '.part'
+        checkpoint_path = archive.path + '.checkpoint.json'
+        interval_ms = TIMEFRAME_MS[timeframe]
+        
+        # 이전 실행이 남긴 체크포인트가 있으면 이어받기
+        checkpoint = self._load_checkpoint(checkpoint_path)
+        if checkpoint and os.path.exists(part_path):
+            target_ms = checkpoint['target']
+            end = checkpoint['end']
+            self.stats['resumed'] += 1
+            self.logger.info(f"🔄 {symbol} {timeframe} 백필 이어받기")
+        else:
+            last_ts = archive.last_timestamp()
+            target_ms = start_ms if last_ts is None else last_ts + interval_ms
+            
+            # 진행 중 캔들은 저장하지 않음 (마감된 캔들만 아카이브)
+            now_ms = int(time.time() * 1000)
+            current_bar = now_ms // interval_ms * interval_ms
+            if target_ms >= current_bar:
+                return 0
+            end = current_bar - 1
+            
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            self._save_checkpoint(checkpoint_path, {'target': target_ms, 'end': end})
+        
+        # 최신 -> 과거 방향으로 페이지 조회, 페이지마다 .part에 추가 후 체크포인트 갱신
+        while end is not None and end >= target_ms:
+            page = await self.api.get_kline_data(symbol, timeframe, limit=self.PAGE_LIMIT, end=end)
+            self.stats['pages'] += 1
+            
+            columns = decode_klines(page)
+            timestamps = columns['timestamp']
+            keep = timestamps >= target_ms
+            self._append_part(part_path, {name: values[keep] for name, values in columns.items()})
+            
+            # 응답이 모자라거나 목표 시각에 도달하면 종료 (상장 이전 구간)
+            if len(page) < self.PAGE_LIMIT or not keep.all():
+                end = None
+            else:
+                end = int(timestamps[0]) - 1
+            self._save_checkpoint(checkpoint_path, {'target': target_ms, 'end': end})
+        
+        added = self._finalize(archive, part_path)
+        os.remove(checkpoint_path)
+        
+        self.stats['candles'] += added
+        self.logger.debug(f"✅ {symbol} {timeframe} 백필 {added}개 추가")
+        return added
+    
+    def _append_part(self, part_path: str, columns: Dict[str, np.ndarray]):
+        """페이지 캔들을 임시 파일에 레코드로 추가"""
+        records = np.empty(len(columns['timestamp']), dtype=ARCHIVE_DTYPE)
+        for name in CANDLE_COLUMNS:
+            records[name] = columns[name]
+        
+        with open(part_path, 'ab') as f:
+            f.write(records.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def _finalize(self, archive: CandleArchive, part_path: str) -> int:
+        """임시 파일을 시간순 정렬/중복 제거 후 아카이브에 추가"""
+        if not os.path.exists(part_path):
+            return 0
+        
+        # 체크포인트 직전에 중단되면 같은 페이지가 두 번 기록될 수 있음
+        size = os.path.getsize(part_path) // ARCHIVE_DTYPE.itemsize * ARCHIVE_DTYPE.itemsize
+        with open(part_path, 'rb') as f:
+            records = np.frombuffer(f.read(size), dtype=ARCHIVE_DTYPE)
+        
+        _, first = np.unique(records['timestamp'], return_index=True)
+        records = records[first]
+        
+        added = archive.append({name: records[name] for name in CANDLE_COLUMNS})
+        os.remove(part_path)
+        return added
+    
+    def _load_checkpoint(self, path: str) -> Optional[Dict]:
+        """체크포인트 로드"""
+        if not os.path.exists(path):
+            return None
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_checkpoint(self, path: str, checkpoint: Dict):
+        """체크포인트 원자적 저장"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+        os.replace(temp_path, path)
+
+async def run_backfill(symbols: List[str], timeframes: List[str], days: int,
+                       data_dir: str, concurrency: int):
+    """설정 기반 백필 실행"""
+    config = Config()
+    api = BybitAPI(
+        config.BYBIT_API_KEY,
+        config.BYBIT_SECRET,
+        config.BYBIT_TESTNET,
+        request_timeout=config.REQUEST_TIMEOUT,
+        pool_size=config.HTTP_POOL_SIZE,
+        keepalive_timeout=config.HTTP_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl=config.HTTP_DNS_CACHE_TTL,
+        public_rate_limit=config.API_RATE_LIMIT,
+        private_rate_limit=config.API_PRIVATE_RATE_LIMIT,
+        rate_burst=config.API_RATE_BURST,
+        cache_ttl=config.API_CACHE_TTL,
+        max_retries=config.API_MAX_RETRIES,
+        retry_base_delay=config.API_RETRY_BASE_DELAY,
+        retry_max_delay=config.API_RETRY_MAX_DELAY,
+        circuit_failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+        circuit_recovery_timeout=config.CIRCUIT_RECOVERY_TIMEOUT,
+        recv_window=config.API_RECV_WINDOW,
+        clock_sync_interval=config.CLOCK_SYNC_INTERVAL
+    )
+    
+    await api.open()
+    try:
+        backfiller = HistoryBackfiller(api, data_dir or config.HISTORY_DATA_DIR, concurrency)
+        await backfiller.backfill(
+            symbols or config.SYMBOLS,
+            timeframes or config.TIMEFRAMES,
+            days or config.BACKTEST_DAYS
+        )
+    finally:
+        await api.close()
+
+def main():
+    """명령행 실행"""
+    parser = argparse.ArgumentParser(description="바이비트 히스토리 캔들 백필")
+    parser.add_argument('--symbols', nargs='*', help="심볼 목록 (기본: Config.SYMBOLS)")
+    parser.add_argument('--timeframes', nargs='*', help="시간대 목록 (기본: Config.TIMEFRAMES)")
+    parser.add_argument('--days', type=int, help="백필 기간 일수 (기본: Config.BACKTEST_DAYS)")
+    parser.add_argument('--data-dir', help="아카이브 디렉토리 (기본: Config.HISTORY_DATA_DIR)")
+    parser.add_argument('--concurrency', type=int, default=4, help="동시 진행 작업 수")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    asyncio.run(run_backfill(args.symbols, args.timeframes, args.days, args.data_dir, args.concurrency))
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n백필이 중단되었습니다. 다시 실행하면 이어받습니다.")
@@ -0,0 +1,366 @@
+# candle_store.py - 캔들 저장소 모듈
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+
+# 캔들 컬럼 (시간 오름차순 저장)
+CANDLE_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover']
+VALUE_COLUMNS = CANDLE_COLUMNS[1:]
+
+class CandleBuffer:
+    """고정 용량 컬럼형 링 버퍼 (미러링으로 항상 연속된 뷰 제공)"""
+    
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다!")
+            
+        self.capacity = capacity
+        
+        # 각 원소를 i, i + capacity 두 위치에 기록해 랩어라운드 없이 슬라이스 가능
+        self._columns: Dict[str, np.ndarray] = {
+            'timestamp': np.zeros(capacity * 2, dtype=np.int64)
+        }
+        for name in VALUE_COLUMNS:
+            self._columns[name] = np.zeros(capacity * 2, dtype=np.float64)
+            
+        self._start = 0  # 가장 오래된 캔들 위치 (0 <= start < capacity)
+        self._size = 0
+        self.version = 0  # 기록할 때마다 증가 (과거 캔들 보정도 감지, 지표 재사용 판단용)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @property
+    def empty(self) -> bool:
+        return self._size == 0
+    
+    def first_timestamp(self) -> Optional[int]:
+        """가장 오래된 캔들 시작 시각"""
+        if self._size == 0:
+            return None
+        return int(self._columns['timestamp'][self._start])
+    
+    def last_timestamp(self) -> Optional[int]:
+        """가장 최근 캔들 시작 시각"""
+        if self._size == 0:
+            return None
+        return int(self._columns['timestamp'][self._start + self._size - 1])
+    
+    def _write(self, position: int, timestamp: int, values) -> None:
+        """물리 위치(0 <= position < capacity)와 미러 위치에 동시 기록"""
+        mirror = position + self.capacity
+        self.version += 1
+        self._columns['timestamp'][position] = timestamp
+        self._columns['timestamp'][mirror] = timestamp
+        for name, value in zip(VALUE_COLUMNS, values):
+            column = self._columns[name]
+            column[position] = value
+            column[mirror] = value
+    
+    def append(self, timestamp: int, open_: float, high: float, low: float,
+               close: float, volume: float, turnover: float) -> None:
+        """캔들 추가 - O(1) (가득 차면 가장 오래된 캔들 제거)"""
+        values = (open_, high, low, close, volume, turnover)
+        
+        if self._size < self.capacity:
+            position = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            position = self._start
+            self._start = (self._start + 1) % self.capacity
+            
+        self._write(position, timestamp, values)
+    
+    def update_last(self, open_: float, high: float, low: float,
+                    close: float, volume: float, turnover: float) -> None:
+        """진행 중 캔들 덮어쓰기 - O(1)"""
+        if self._size == 0:
+            raise IndexError("빈 버퍼입니다.")
+            
+        position = (self._start + self._size - 1) % self.capacity
+        timestamp = int(self._columns['timestamp'][position])
+        self._write(position, timestamp, (open_, high, low, close, volume, turnover))
+    
+    def upsert(self, timestamp: int, open_: float, high: float, low: float,
+               close: float, volume: float, turnover: float) -> None:
+        """캔들 1개 반영 (같은 시각이면 덮어쓰기, 이후면 추가)"""
+        last = self.last_timestamp()
+        
+        if last == timestamp:
+            self.update_last(open_, high, low, close, volume, turnover)
+        elif last is None or timestamp > last:
+            self.append(timestamp, open_, high, low, close, volume, turnover)
+        else:
+            self.merge({
+                'timestamp': np.array([timestamp], dtype=np.int64),
+                'open': np.array([open_]), 'high': np.array([high]),
+                'low': np.array([low]), 'close': np.array([close]),
+                'volume': np.array([volume]), 'turnover': np.array([turnover])
+            })
+    
+    def merge(self, columns: Dict[str, np.ndarray]) -> None:
+        """시간 오름차순 캔들 컬럼 병합 (같은 시각은 새 값 우선)"""
+        timestamps = columns['timestamp']
+        count = len(timestamps)
+        if count == 0:
+            return
+            
+        last = self.last_timestamp()
+        
+        # 기존 구간과 겹치는 캔들은 제자리 덮어쓰기, 이후 캔들은 추가
+        if last is None:
+            overlap = 0
+        else:
+            overlap = int(np.searchsorted(timestamps, last, side='right'))
+            
+        if overlap:
+            existing = self.view('timestamp')
+            head = timestamps[:overlap]
+            indices = np.searchsorted(existing, head)
+            found = existing[indices] == head
+            
+            if not found.all():
+                # 여유 공간이 있거나 보관 구간 안의 빈 자리면 정렬 병합 (드묾)
+                if self._size < self.capacity or head[~found].max() > existing[0]:
+                    self._rebuild(columns)
+                    return
+                # 보관 구간보다 오래된 캔들은 무시
+                
+            self._overwrite(indices[found], {name: values[:overlap][found] for name, values in columns.items()})
+            
+        if overlap < count:
+            self._append_many({name: values[overlap:] for name, values in columns.items()})
+    
+    def _overwrite(self, logical_indices: np.ndarray, columns: Dict[str, np.ndarray]) -> None:
+        """논리 인덱스 위치의 캔들 값 덮어쓰기"""
+        positions = (self._start + logical_indices) % self.capacity
+        self.version += 1
+        for name in VALUE_COLUMNS:
+            column = self._columns[name]
+            column[positions] = columns[name]
+            column[positions + self.capacity] = columns[name]
+    
+    def _append_many(self, columns: Dict[str, np.ndarray]) -> None:
+        """캔들 여러 개 추가 (용량 초과분은 오래된 순으로 제거)"""
+        count = len(columns['timestamp'])
+        if count > self.capacity:
+            columns = {name: values[-self.capacity:] for name, values in columns.items()}
+            count = self.capacity
+            
+        positions = (self._start + self._size + np.arange(count)) % self.capacity
+        self.version += 1
+        for name in CANDLE_COLUMNS:
+            column = self._columns[name]
+            column[positions] = columns[name]
+            column[positions + self.capacity] = columns[name]
+            
+        overflow = self._size + count - self.capacity
+        if overflow > 0:
+            self._start = (self._start + overflow) % self.capacity
+            self._size = self.capacity
+        else:
+            self._size += count
+    
+    def _rebuild(self, columns: Dict[str, np.ndarray]) -> None:
+        """기존 캔들과 새 캔들을 정렬 병합해 다시 채움"""
+        existing = self.columns()
+        combined = {name: np.concatenate([existing[name], columns[name]]) for name in CANDLE_COLUMNS}
+        
+        # 같은 시각은 나중 값(새 캔들) 우선
+        order = np.argsort(combined['timestamp'], kind='stable')
+        timestamps = combined['timestamp'][order]
+        keep = np.append(timestamps[1:] != timestamps[:-1], True)
+        merged = {name: values[order][keep] for name, values in combined.items()}
+        
+        self.clear()
+        self._append_many(merged)
+    
+    def clear(self) -> None:
+        """버퍼 비우기"""
+        self._start = 0
+        self._size = 0
+        self.version += 1
+    
+    def view(self, name: str) -> np.ndarray:
+        """컬럼의 읽기 전용 연속 뷰 (복사 없음, 다음 기록 전까지 유효)"""
+        values = self._columns[name][self._start:self._start + self._size]
+        values.flags.writeable = False
+        return values
+    
+    def columns(self) -> Dict[str, np.ndarray]:
+        """전체 컬럼 뷰"""
+        return {name: self.view(name) for name in CANDLE_COLUMNS}
+    
+    def tail(self, count: int) -> Dict[str, np.ndarray]:
+        """최근 count개 캔들 컬럼 뷰"""
+        start = max(self._size - count, 0)
+        return {name: values[start:] for name, values in self.columns().items()}
+    
+    def since(self, timestamp: int) -> Dict[str, np.ndarray]:
+        """timestamp 이후(포함) 캔들 컬럼 뷰"""
+        columns = self.columns()
+        start = int(np.searchsorted(columns['timestamp'], timestamp, side='left'))
+        return {name: values[start:] for name, values in columns.items()}
+    
+    def save(self, path: str) -> None:
+        """전체 캔들을 디스크 캐시로 저장"""
+        save_columns(path, self.columns())
+    
+    def load(self, path: str) -> int:
+        """디스크 캐시를 버퍼에 병합 (없거나 손상되면 0 반환)"""
+        columns = load_columns(path)
+        if columns is None:
+            return 0
+            
+        self.merge(columns)
+        return len(columns['timestamp'])
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """지표 엔진용 DataFrame (컬럼 배열을 복사하지 않음, attrs['version']에 버퍼 버전)"""
+        df = pd.DataFrame(self.columns(), copy=False)
+        df.attrs['version'] = self.version
+        return df
+
+def save_columns(path: str, columns: Dict[str, np.ndarray]) -> None:
+    """캔들 컬럼을 (컬럼 수 x 캔들 수) float64 .npy 파일로 원자적 저장"""
+    data = np.empty((len(CANDLE_COLUMNS), len(columns['timestamp'])), dtype=np.float64)
+    for row, name in enumerate(CANDLE_COLUMNS):
+        data[row] = columns[name]
+        
+    # 임시 파일에 쓴 뒤 교체 (저장 중 종료돼도 이전 캐시 유지)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        np.save(f, data)
+    os.replace(temp_path, path)
+
+def load_columns(path: str) -> Optional[Dict[str, np.ndarray]]:
+    """캐시 파일을 메모리 매핑으로 열어 컬럼 뷰 반환 (타임스탬프만 int64 변환)"""
+    if not os.path.exists(path):
+        return None
+        
+    try:
+        data = np.load(path, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+        
+    if data.ndim != 2 or data.shape[0] != len(CANDLE_COLUMNS):
+        return None
+        
+    columns = {name: data[row] for row, name in enumerate(CANDLE_COLUMNS)}
+    columns['timestamp'] = columns['timestamp'].astype(np.int64)
+    return columns
+
+# 히스토리 아카이브 레코드 (고정 폭 56바이트, 시간 오름차순 추가 전용)
+ARCHIVE_DTYPE = np.dtype([('timestamp', '<i8')] + [(name, '<f8') for name in VALUE_COLUMNS])
+
+class CandleArchive:
+    """(심볼, 시간대) 히스토리 아카이브 파일 (추가 전용 고정 폭 레코드)"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._records: Optional[np.memmap] = None
+    
+    def __len__(self) -> int:
+        if not os.path.exists(self.path):
+            return 0
+        return os.path.getsize(self.path) // ARCHIVE_DTYPE.itemsize
+    
+    def last_timestamp(self) -> Optional[int]:
+        """마지막 레코드 시작 시각 (파일 끝 레코드 1개만 읽음)"""
+        count = len(self)
+        if count == 0:
+            return None
+            
+        with open(self.path, 'rb') as f:
+            f.seek((count - 1) * ARCHIVE_DTYPE.itemsize)
+            record = np.frombuffer(f.read(ARCHIVE_DTYPE.itemsize), dtype=ARCHIVE_DTYPE)
+        return int(record['timestamp'][0])
+    
+    def append(self, columns: Dict[str, np.ndarray]) -> int:
+        """마지막 레코드 이후 캔들만 추가 (시간 오름차순 입력), 추가 개수 반환"""
+        timestamps = columns['timestamp']
+        last = self.last_timestamp()
+        start = 0 if last is None else int(np.searchsorted(timestamps, last, side='right'))
+        count = len(timestamps) - start
+        if count <= 0:
+            return 0
+            
+        records = np.empty(count, dtype=ARCHIVE_DTYPE)
+        for name in CANDLE_COLUMNS:
+            records[name] = columns[name][start:]
+            
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            
+        # 끝이 잘린 레코드가 있으면 레코드 경계로 되돌린 뒤 추가
+        valid_size = len(self) * ARCHIVE_DTYPE.itemsize
+        with open(self.path, 'ab') as f:
+            if f.tell() != valid_size:
+                f.truncate(valid_size)
+            f.write(records.tobytes())
+        return count
+    
+    def records(self) -> np.ndarray:
+        """전체 레코드 메모리 매핑 (파일이 늘어나면 다시 매핑)"""
+        count = len(self)
+        if count == 0:
+            return np.empty(0, dtype=ARCHIVE_DTYPE)
+            
+        if self._records is None or len(self._records) != count:
+            self._records = np.memmap(self.path, dtype=ARCHIVE_DTYPE, mode='r', shape=(count,))
+        return self._records
+    
+    def range(self, start: Optional[int] = None, end: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """start <= 시각 <= end 구간 컬럼 뷰 (이진 탐색, 복사 없음)"""
+        records = self.records()
+        timestamps = records['timestamp']
+        
+        first = 0 if start is None else int(np.searchsorted(timestamps, start, side='left'))
+        last = len(records) if end is None else int(np.searchsorted(timestamps, end, side='right'))
+        
+        selected = records[first:last]
+        return {name: selected[name] for name in CANDLE_COLUMNS}
+
+class HistoryStore:
+    """히스토리 아카이브 조회 (DataCollector.get_symbol_data와 같은 형태)"""
+    
+    def __init__(self, data_dir: str = 'data/history'):
+        self.data_dir = data_dir
+        self._archives: Dict[str, CandleArchive] = {}
+    
+    def archive_path(self, symbol: str, timeframe: str) -> str:
+        """아카이브 파일 경로"""
+        return os.path.join(self.data_dir, f"{symbol}_{timeframe}.bin")
+    
+    def get_archive(self, symbol: str, timeframe: str) -> CandleArchive:
+        """(심볼, 시간대) 아카이브 (매핑 재사용을 위해 캐시)"""
+        path = self.archive_path(symbol, timeframe)
+        archive = self._archives.get(path)
+        if archive is None:
+            archive = CandleArchive(path)
+            self._archives[path] = archive
+        return archive
+    
+    def get_candle_arrays(self, symbol: str, timeframe: str = '1', start: Optional[int] = None,
+                          end: Optional[int] = None) -> Optional[Dict[str, np.ndarray]]:
+        """구간 캔들 컬럼 배열 (메모리 매핑 뷰, 밀리초 시각 기준)"""
+        archive = self.get_archive(symbol, timeframe)
+        if len(archive) == 0:
+            return None
+            
+        return archive.range(start, end)
+    
+    def get_symbol_data(self, symbol: str, timeframe: str = None, start: Optional[int] = None,
+                        end: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """구간 캔들 DataFrame (필요한 구간만 읽음)"""
+        columns = self.get_candle_arrays(symbol, timeframe or '1', start, end)
+        if columns is None:
+            return None
+            
+        return pd.DataFrame(columns, copy=False)
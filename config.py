@@ -22,9 +22,18 @@ class Config:
     # =============================================================================
     SYMBOLS: List[str] = [
         'BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'BNBUSDT', 'XRPUSDT',
-        'DOGEUSDT', 'LINKUSDT', 'ADAUSDT', 'MATICUSDT', 'SHIBUSDT'
+        'DOGEUSDT', 'LINKUSDT', 'ADAUSDT', 'POLUSDT', 'SHIBUSDT'
     ]
     
+    # 심볼 유니버스 설정 (활성화 시 SYMBOLS는 시작 구성, 이후 순위로 추가/제외)
+    UNIVERSE_ENABLED: bool = False
+    UNIVERSE_SIZE: int = 50  # 유지할 심볼 수 (수백 개면 WS_ENABLED 권장)
+    UNIVERSE_MIN_TURNOVER: float = 5_000_000.0  # 최소 24시간 거래대금 (USDT)
+    UNIVERSE_VOLATILITY_WEIGHT: float = 0.3  # 순위 점수 중 24시간 변동폭 비중 (나머지는 거래대금)
+    UNIVERSE_RETIRE_BUFFER: float = 0.2  # 기존 심볼은 UNIVERSE_SIZE의 120% 순위까지 유지
+    UNIVERSE_PINNED: List[str] = ['BTCUSDT', 'ETHUSDT']  # 순위와 무관하게 항상 유지
+    UNIVERSE_REFRESH_INTERVAL: float = 3600.0  # 재구성 주기 (초)
+    
     # 계좌 설정
     TOTAL_CAPITAL: float = 3000.0  # 총 자본금 (USD)
     MAX_POSITION_RATIO: float = 0.2  # 단일 포지션 최대 비중 (20%)
@@ -124,9 +133,76 @@ class Config:
     TIMEFRAMES: List[str] = ['1', '3', '5', '15', '30', '60', '240', 'D']
     DATA_LIMIT: int = 200  # 캔들 수집 개수
     
+    # 진행 중 캔들까지 매 주기 갱신할 시간대 (나머지는 캔들 마감 직후 1회, 마감된 캔들만 사용)
+    # 신호 점수 가중치가 있는 시간대(signal_generator 1/3/5/15/30/60)는 모두 포함
+    INTRABAR_TIMEFRAMES: List[str] = ['1', '3', '5', '15', '30', '60']
+    CANDLE_CLOSE_DELAY: float = 2.0  # 캔들 마감 후 갱신까지 대기 (초)
+    
+    # 상위 시간대 로컬 집계 (1분봉만 수집해 3/5/15/30/60/240/D 생성)
+    RESAMPLE_ENABLED: bool = False
+    RESAMPLE_BASE_TIMEFRAME: str = '1'
+    RESAMPLE_RECONCILE_INTERVAL: int = 60  # 거래소 캔들과 대조 주기 (분, 0이면 비활성)
+    RESAMPLE_RECONCILE_BARS: int = 5  # 대조 시 조회할 최근 캔들 수
+    
     # API 호출 제한
-    API_RATE_LIMIT: int = 120  # 분당 API 호출 제한
+    API_RATE_LIMIT: int = 120  # 분당 API 호출 제한 (퍼블릭)
+    API_PRIVATE_RATE_LIMIT: int = 120  # 분당 API 호출 제한 (프라이빗, 서명 요청)
+    API_RATE_BURST: int = 30  # 순간 최대 호출 수 (토큰 버킷 용량)
     REQUEST_TIMEOUT: int = 30   # 요청 타임아웃 (초)
+    API_RECV_WINDOW: int = 5000  # 서명 요청 허용 시각 오차 (ms)
+    CLOCK_SYNC_INTERVAL: float = 600.0  # 서버 시각 재동기화 주기 (초)
+    API_MAX_RETRIES: int = 2  # 일시 오류 재시도 횟수 (GET 요청만)
+    API_RETRY_BASE_DELAY: float = 0.5  # 재시도 백오프 시작 값 (초, 지터 적용)
+    API_RETRY_MAX_DELAY: float = 8.0  # 재시도 백오프 상한 (초)
+    CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패 시 엔드포인트 차단 기준
+    CIRCUIT_RECOVERY_TIMEOUT: float = 30.0  # 차단 후 시험 요청까지 대기 (초)
+    
+    # API 상태 판단 (최근 요청 결과 기반, 유휴 시에만 점검 요청)
+    HEALTH_WINDOW: int = 50  # 판단에 쓰는 최근 요청 수
+    HEALTH_MAX_ERROR_RATE: float = 0.5  # 허용 오류율
+    HEALTH_MAX_LATENCY_MS: float = 5000.0  # 허용 p95 지연 (ms)
+    HEALTH_PROBE_IDLE: float = 120.0  # 이 시간(초) 동안 요청이 없으면 점검 요청 전송
+    API_CACHE_TTL: float = 1.0  # 동일 퍼블릭 GET 결과 재사용 시간 (초, 0이면 진행 중 요청 병합만)
+    METADATA_CACHE_SIZE: int = 256  # 메타데이터 캐시 최대 항목 수 (LRU)
+    METADATA_CACHE_FILE: str = 'data/metadata_cache.json'  # 비워두면 파일 저장 안 함
+    MAX_CONCURRENT_REQUESTS: int = 10  # 데이터 갱신 시 최대 동시 요청 수
+    KLINE_MAX_QUEUE_WAIT: float = 10.0  # K-라인 갱신 요청의 속도 제한 대기 한도 (초과 시 다음 주기로 연기)
+    
+    # 웹소켓 캔들 스트림 설정
+    WS_ENABLED: bool = False  # 캔들을 웹소켓으로 수신 (REST 폴링 대체)
+    WS_PUBLIC_URL: str = ''  # 비워두면 테스트넷 여부에 따라 자동 선택
+    WS_PING_INTERVAL: float = 20.0  # 하트비트 주기 (초)
+    
+    # 호가창 스트림 설정
+    ORDERBOOK_ENABLED: bool = False  # orderbook.{depth}.{symbol} 구독
+    ORDERBOOK_DEPTH: int = 50  # 구독 깊이 (1, 50, 200, 500)
+    ORDERBOOK_TOP_LEVELS: int = 10  # 스프레드/불균형 계산에 쓰는 상위 레벨 수
+    
+    # 체결 테이프 설정 (publicTrade 주문 흐름 집계)
+    TRADES_ENABLED: bool = False  # publicTrade.{symbol} 구독
+    TRADE_FLOW_CAPACITY: int = 1440  # 심볼별 보관 바 수 (기본 시간대 기준)
+    TRADE_LARGE_NOTIONAL: float = 100_000.0  # 대량 체결 기준 금액 (USDT)
+    
+    # 파생 지표 설정 (펀딩비/미결제약정/롱숏 비율, 메인 루프와 별도 주기)
+    DERIVATIVES_ENABLED: bool = False
+    OPEN_INTEREST_INTERVAL: str = '5min'  # 미결제약정 표본 간격 (티커 스냅샷에서 기록)
+    LONG_SHORT_PERIOD: str = '5min'  # 롱/숏 비율 조회 주기
+    DERIVATIVES_HISTORY_LIMIT: int = 200  # 시작 시 적재할 이력 개수
+    DERIVATIVES_CAPACITY: int = 2000  # 심볼/지표별 보관 개수
+    
+    # 캔들 디스크 캐시 설정 (재시작 시 누락 구간만 조회)
+    CANDLE_CACHE_ENABLED: bool = True
+    CANDLE_CACHE_DIR: str = 'data/candles'
+    CANDLE_CACHE_SAVE_INTERVAL: int = 300  # 주기적 저장 간격 (초)
+    
+    # HTTP 커넥션 풀 설정
+    HTTP_POOL_SIZE: int = 100  # 최대 동시 커넥션 수
+    HTTP_KEEPALIVE_TIMEOUT: float = 75.0  # 유휴 커넥션 유지 시간 (초)
+    HTTP_DNS_CACHE_TTL: int = 300  # DNS 캐시 유지 시간 (초)
+    
+    # 심볼 샤딩 설정 (수집 + 지표 계산을 워커 프로세스로 분산, 신호/포지션/텔레그램은 메인 프로세스)
+    SHARD_WORKERS: int = 0  # 워커 프로세스 수 (0이면 단일 프로세스)
+    SHARD_REPLY_TIMEOUT: float = 120.0  # 워커 응답 대기 시간 (초, 초과 시 워커 재시작)
     
     # =============================================================================
     # 텔레그램 설정
@@ -154,6 +230,7 @@ class Config:
     BACKTEST_ENABLED: bool = True
     BACKTEST_DAYS: int = 30  # 백테스팅 기간
     BACKTEST_MIN_TRADES: int = 10  # 최소 거래 수
+    HISTORY_DATA_DIR: str = 'data/history'  # 백필 아카이브 디렉토리 (backfill.py)
     
     # =============================================================================
     # 유튜브 학습 설정 (추후 구현)
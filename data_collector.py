@@ -2,15 +2,83 @@
 import asyncio
 import aiohttp
 import pandas as pd
+import numpy as np
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import time
+from collections import deque, OrderedDict
+import heapq
 from dataclasses import dataclass
 import hmac
+import json
+import os
+import random
 import hashlib
+from decimal import Decimal, ROUND_HALF_UP, ROUND_DOWN
 from urllib.parse import urlencode
 
+from market_stream import BybitPublicStream, MAINNET_PUBLIC_URL, TESTNET_PUBLIC_URL
+from candle_store import CandleBuffer, HistoryStore, CANDLE_COLUMNS
+from order_book import OrderBook
+from trade_tape import TradeTape
+from derivatives_collector import DerivativesCollector
+from universe import UniverseManager
+
+# 시간대별 캔들 길이 (밀리초)
+TIMEFRAME_MS: Dict[str, int] = {
+    '1': 60_000,
+    '3': 180_000,
+    '5': 300_000,
+    '15': 900_000,
+    '30': 1_800_000,
+    '60': 3_600_000,
+    '120': 7_200_000,
+    '240': 14_400_000,
+    '360': 21_600_000,
+    '720': 43_200_000,
+    'D': 86_400_000,
+    'W': 604_800_000
+}
+
+def decode_klines(kline_data: List[List[str]]) -> Dict[str, np.ndarray]:
+    """바이비트 K-라인(최신순 문자열 배열)을 시간 오름차순 컬럼 배열로 변환"""
+    # 바이비트 K-라인 형식: [startTime, openPrice, highPrice, lowPrice, closePrice, volume, turnover]
+    if not kline_data:
+        return {
+            name: np.empty(0, dtype=np.int64 if name == 'timestamp' else np.float64)
+            for name in CANDLE_COLUMNS
+        }
+    
+    # 문자열 → float64 일괄 변환 후 오름차순으로 뒤집어 컬럼별 연속 배열로 전치
+    # (밀리초 타임스탬프는 2^53 미만이라 float64로 정확히 표현됨)
+    values = np.ascontiguousarray(np.array(kline_data, dtype=np.float64)[::-1, :7].T)
+    
+    columns = dict(zip(CANDLE_COLUMNS[1:], values[1:]))
+    columns['timestamp'] = values[0].astype(np.int64)
+    return columns
+
+def resample_candles(columns: Dict[str, np.ndarray], interval_ms: int) -> Dict[str, np.ndarray]:
+    """시간 오름차순 캔들 컬럼을 상위 시간대 캔들로 집계"""
+    timestamps = columns['timestamp']
+    if len(timestamps) == 0:
+        return {name: values[:0] for name, values in columns.items()}
+    
+    # 버킷 경계 위치 (정렬되어 있으므로 값이 바뀌는 지점)
+    buckets = timestamps // interval_ms * interval_ms
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+    ends = np.append(starts[1:], len(timestamps)) - 1
+    
+    return {
+        'timestamp': buckets[starts],
+        'open': columns['open'][starts],
+        'high': np.maximum.reduceat(columns['high'], starts),
+        'low': np.minimum.reduceat(columns['low'], starts),
+        'close': columns['close'][ends],
+        'volume': np.add.reduceat(columns['volume'], starts),
+        'turnover': np.add.reduceat(columns['turnover'], starts)
+    }
+
 @dataclass
 class CandleData:
     """캔들 데이터 구조체"""
@@ -23,10 +91,209 @@ class CandleData:
     symbol: str
     timeframe: str
 
+# 요청 우선순위 클래스 (숫자가 작을수록 우선)
+PRIORITY_ORDER = 0
+PRIORITY_POSITION = 1
+PRIORITY_TICKER = 2
+PRIORITY_KLINE = 3
+
+PRIORITY_NAMES: Dict[int, str] = {
+    PRIORITY_ORDER: 'order',
+    PRIORITY_POSITION: 'position',
+    PRIORITY_TICKER: 'ticker',
+    PRIORITY_KLINE: 'kline'
+}
+
+class BybitAPIError(Exception):
+    """바이비트 API 오류 응답 (retryable: 재시도로 회복 가능한 일시 오류)"""
+    
+    # 서버 타임아웃 / 요청 시각 초과 / 요청 과다 / 서버 내부 오류
+    RETRYABLE_CODES = {10000, 10002, 10006, 10016}
+    
+    def __init__(self, ret_code: Optional[int], message: str, retryable: Optional[bool] = None):
+        super().__init__(f"API 오류: {message}")
+        self.ret_code = ret_code
+        self.retryable = ret_code in self.RETRYABLE_CODES if retryable is None else retryable
+
+class RequestDroppedError(Exception):
+    """우선순위가 낮아 대기 한도 안에 토큰을 받지 못한 요청"""
+    
+    def __init__(self, priority_name: str):
+        super().__init__(f"{priority_name} 요청 대기 한도 초과로 제외")
+        self.priority_name = priority_name
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커 차단 중 요청 거부"""
+    
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"{endpoint} 서킷 차단 중 ({retry_after:.0f}초 후 재시도)")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+class CircuitBreaker:
+    """엔드포인트별 서킷 브레이커 (연속 실패 시 차단, 복구 대기 후 시험 요청 허용)"""
+    
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        
+        self.state = 'closed'  # closed / open / half_open
+        self.failures = 0
+        self.opened_at = 0.0
+        self.stats = {'opened': 0, 'rejected': 0}
+    
+    def allow_request(self) -> bool:
+        """요청 허용 여부 (복구 대기가 끝나면 half_open으로 전환)"""
+        if self.state == 'open':
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                self.stats['rejected'] += 1
+                return False
+            self.state = 'half_open'
+        return True
+    
+    def retry_after(self) -> float:
+        """차단 해제까지 남은 시간 (초)"""
+        if self.state != 'open':
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+    
+    def record_success(self):
+        """성공 기록 (차단 해제)"""
+        self.state = 'closed'
+        self.failures = 0
+    
+    def record_failure(self):
+        """실패 기록 (임계치 도달 또는 시험 요청 실패 시 차단)"""
+        self.failures += 1
+        
+        if self.state == 'half_open' or self.failures >= self.failure_threshold:
+            if self.state != 'open':
+                self.stats['opened'] += 1
+            self.state = 'open'
+            self.opened_at = time.monotonic()
+    
+    def get_status(self) -> Dict[str, Any]:
+        """서킷 상태 반환"""
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'retry_after': self.retry_after(),
+            **self.stats
+        }
+
+class LatencyHistogram:
+    """고정 로그 구간 히스토그램 (기록은 64개 구간 이진 탐색 - 표본 수와 무관한 상수 시간, 메모리 고정)"""
+    
+    # 구간 상한 (밀리초, 10µs ~ 60초, 구간당 약 28% 간격)
+    BOUNDS = np.geomspace(0.01, 60000.0, 64)
+    
+    def __init__(self):
+        self.counts = np.zeros(len(self.BOUNDS) + 1, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def record(self, value_ms: float):
+        """값 1개 기록"""
+        self.counts[int(np.searchsorted(self.BOUNDS, value_ms))] += 1
+        self.count += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+    
+    def percentile(self, q: float) -> float:
+        """백분위 추정값 (해당 구간 상한, 최댓값을 넘지 않음)"""
+        if self.count == 0:
+            return 0.0
+        
+        index = int(np.searchsorted(np.cumsum(self.counts), q / 100 * self.count))
+        bound = self.BOUNDS[index] if index < len(self.BOUNDS) else self.max
+        return float(min(bound, self.max))
+    
+    def summary(self) -> Dict[str, float]:
+        """요약 통계"""
+        return {
+            'avg': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max
+        }
+
+class EndpointMetrics:
+    """엔드포인트별 요청 계측 (지연, 응답 크기, 디코딩, 속도 제한 대기, 오류)"""
+    
+    def __init__(self):
+        self.requests = 0
+        self.errors: Dict[str, int] = {}  # 오류 종류 -> 횟수
+        self.bytes = 0
+        self.latency = LatencyHistogram()
+        self.decode = LatencyHistogram()
+        self.rate_wait = LatencyHistogram()
+    
+    def record(self, latency_ms: float, size: int, decode_ms: float, wait_ms: float):
+        """성공 요청 1회 기록"""
+        self.requests += 1
+        self.bytes += size
+        self.latency.record(latency_ms)
+        self.decode.record(decode_ms)
+        self.rate_wait.record(wait_ms)
+    
+    def record_error(self, error: Exception):
+        """실패 요청 1회 기록"""
+        kind = type(error).__name__
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+    
+    def summary(self) -> Dict[str, Any]:
+        """요약 통계 (시간 단위: 밀리초)"""
+        return {
+            'requests': self.requests,
+            'errors': dict(self.errors),
+            'bytes': self.bytes,
+            'avg_bytes': self.bytes / self.requests if self.requests else 0.0,
+            'latency_ms': self.latency.summary(),
+            'decode_ms': self.decode.summary(),
+            'rate_wait_ms': self.rate_wait.summary()
+        }
+
 class BybitAPI:
     """바이비트 API 클라이언트"""
     
-    def __init__(self, api_key: str, secret: str, testnet: bool = True):
+    # 엔드포인트별 요청 가중치 (명시되지 않은 엔드포인트는 1)
+    ENDPOINT_WEIGHTS: Dict[str, float] = {
+        '/v5/market/kline': 1.0,
+        '/v5/market/tickers': 1.0,
+        '/v5/market/time': 1.0,
+        '/v5/position/list': 1.0
+    }
+    
+    # 엔드포인트 접두사별 우선순위 (없으면 티커 등급)
+    ENDPOINT_PRIORITIES: Dict[str, int] = {
+        '/v5/order/': PRIORITY_ORDER,
+        '/v5/position/': PRIORITY_POSITION,
+        '/v5/account/': PRIORITY_POSITION,
+        '/v5/market/kline': PRIORITY_KLINE,
+        '/v5/market/funding/history': PRIORITY_KLINE,
+        '/v5/market/open-interest': PRIORITY_KLINE,
+        '/v5/market/account-ratio': PRIORITY_KLINE
+    }
+    
+    # 거의 바뀌지 않는 메타데이터 캐시 유지 시간 (초)
+    METADATA_TTLS: Dict[str, float] = {
+        '/v5/market/instruments-info': 3600.0,
+        '/v5/market/risk-limit': 3600.0
+    }
+    
+    def __init__(self, api_key: str, secret: str, testnet: bool = True,
+                 request_timeout: int = 30, pool_size: int = 100,
+                 keepalive_timeout: float = 75.0, dns_cache_ttl: int = 300,
+                 public_rate_limit: int = 120, private_rate_limit: int = 120,
+                 rate_burst: Optional[int] = None, cache_ttl: float = 0.0,
+                 metadata_cache_size: int = 256, metadata_cache_path: Optional[str] = None,
+                 max_retries: int = 2, retry_base_delay: float = 0.5, retry_max_delay: float = 8.0,
+                 circuit_failure_threshold: int = 5, circuit_recovery_timeout: float = 30.0,
+                 health_window: int = 50, health_max_error_rate: float = 0.5,
+                 health_max_latency_ms: float = 5000.0, recv_window: int = 5000,
+                 clock_sync_interval: float = 600.0):
         self.api_key = api_key
         self.secret = secret
         self.testnet = testnet
@@ -39,27 +306,161 @@ class BybitAPI:
         
         # 세션 및 제한 설정
         self.session = None
-        self.rate_limiter = RateLimiter(120)  # 분당 120 요청
+        self._persistent = False  # open()으로 만든 장기 세션 여부
+        self.request_timeout = request_timeout
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        # 퍼블릭/프라이빗 요청은 별도 예산 사용
+        self.rate_limiters = {
+            # 퍼블릭은 티커/메타데이터 몫을, 프라이빗은 주문 몫을 K-라인/포지션 조회와 분리해 예약
+            'public': RateLimiter(public_rate_limit, rate_burst, {PRIORITY_TICKER: 0.2}),
+            'private': RateLimiter(private_rate_limit, rate_burst, {PRIORITY_ORDER: 0.3})
+        }
         self.logger = logging.getLogger(__name__)
+        
+        # 커넥션 재사용 통계 (새 연결 = TCP/TLS 핸드셰이크 1회)
+        self.connection_stats = {
+            'requests': 0,
+            'handshakes': 0,
+            'reused': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0
+        }
+        
+        # 동일 GET 요청 병합 (진행 중 요청 공유 + 짧은 TTL 결과 캐시)
+        self.cache_ttl = cache_ttl
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        self._response_cache: Dict[Tuple, Tuple[float, Dict]] = {}
+        self.coalesce_stats = {
+            'upstream': 0,
+            'coalesced': 0,
+            'cache_hits': 0
+        }
+        
+        # 일시 오류 재시도 (지터 지수 백오프) 및 엔드포인트별 서킷 브레이커
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.circuit_failure_threshold = circuit_failure_threshold
+        self.circuit_recovery_timeout = circuit_recovery_timeout
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.retry_stats = {'retries': 0, 'recovered': 0, 'failed': 0}
+        
+        # 엔드포인트별 계측
+        self.metrics: Dict[str, EndpointMetrics] = {}
+        
+        # 서버 시각 동기화 (서명 타임스탬프, 캔들 경계 계산)
+        self.clock = ClockSync(sync_interval=clock_sync_interval)
+        self.recv_window = recv_window
+        
+        # 요청 결과 기반 수동 상태 판단
+        self.health = HealthMonitor(health_window, health_max_error_rate, health_max_latency_ms)
+        
+        # 메타데이터 캐시 (심볼 규격, 리스크 한도, 서버 시간 오프셋)
+        self.metadata = MetadataCache(metadata_cache_size, metadata_cache_path)
+        self.metadata.load()
+        
+        # 마지막으로 받은 심볼 규격 (TTL이 지나도 갱신 전까지 반올림에 사용)
+        self.instruments: Dict[str, Dict] = {}
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """keep-alive 및 DNS 캐시가 설정된 세션 생성"""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_size,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl
+        )
+        
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            connector=connector,
+            trace_configs=[trace_config]
+        )
+    
+    async def _on_request_start(self, session, ctx, params):
+        self.connection_stats['requests'] += 1
+    
+    async def _on_connection_create(self, session, ctx, params):
+        self.connection_stats['handshakes'] += 1
+    
+    async def _on_connection_reuse(self, session, ctx, params):
+        self.connection_stats['reused'] += 1
+    
+    async def _on_dns_cache_hit(self, session, ctx, params):
+        self.connection_stats['dns_cache_hits'] += 1
+    
+    async def _on_dns_cache_miss(self, session, ctx, params):
+        self.connection_stats['dns_cache_misses'] += 1
+    
+    async def open(self):
+        """장기 세션 열기 (봇 수명 동안 커넥션 풀 유지)"""
+        if self.session and not self.session.closed:
+            self._persistent = True
+            return self
+        
+        self.session = self._create_session()
+        self._persistent = True
+        self.logger.info("🔌 바이비트 HTTP 세션 생성 (keep-alive)")
+        return self
+    
+    async def close(self):
+        """장기 세션 닫기"""
+        try:
+            self.metadata.save()
+        except OSError as e:
+            self.logger.warning(f"⚠️ 메타데이터 캐시 저장 실패: {str(e)}")
+        
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self._persistent = False
+    
+    @property
+    def is_open(self) -> bool:
+        """세션 사용 가능 여부"""
+        return self.session is not None and not self.session.closed
+    
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """커넥션 재사용 통계 반환"""
+        stats = dict(self.connection_stats)
+        total = stats['handshakes'] + stats['reused']
+        stats['reuse_ratio'] = stats['reused'] / total if total > 0 else 0.0
+        return stats
     
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            connector=aiohttp.TCPConnector(limit=100)
-        )
+        # 장기 세션이 열려 있으면 그대로 재사용
+        if self._persistent and self.is_open:
+            return self
+        
+        self.session = self._create_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료"""
+        # 장기 세션은 close()에서만 닫음
+        if self._persistent:
+            return
+        
         if self.session:
             await self.session.close()
+            self.session = None
     
     def _generate_signature(self, params: Dict[str, Any]) -> str:
         """API 서명 생성"""
-        # 타임스탬프 추가
+        # 타임스탬프 추가 (서버 시각 기준, 허용 오차는 recv_window)
         params['api_key'] = self.api_key
-        params['timestamp'] = str(int(time.time() * 1000))
+        params['timestamp'] = str(self.clock.now_ms())
+        params['recv_window'] = str(self.recv_window)
         
         # 매개변수 정렬 및 쿼리 스트링 생성
         query_string = urlencode(sorted(params.items()))
@@ -75,46 +476,209 @@ class BybitAPI:
         return params
     
     async def _make_request(self, method: str, endpoint: str, params: Dict = None, 
-                          sign_required: bool = False) -> Dict:
-        """API 요청 실행"""
+                          sign_required: bool = False, max_wait: Optional[float] = None) -> Dict:
+        """API 요청 실행 (동일 GET은 진행 중 요청/캐시 결과 공유, 결과는 수정 금지)
+        
+        max_wait: 속도 제한 대기 한도 (초과 시 RequestDroppedError)
+        """
+        if method.upper() != 'GET':
+            return await self._send_request(method, endpoint, params, sign_required)
+        
+        key = (endpoint, sign_required, tuple(sorted((params or {}).items())))
+        
+        # 짧은 TTL 캐시 (주문/포지션 상태가 늦게 보이지 않도록 퍼블릭 요청만)
+        if self.cache_ttl > 0 and not sign_required:
+            cached = self._response_cache.get(key)
+            if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                self.coalesce_stats['cache_hits'] += 1
+                return cached[1]
+        
+        # 같은 요청이 진행 중이면 그 결과를 함께 기다림 (대기 한도가 같은 요청끼리만, 한도 없는 요청이 버려지지 않도록)
+        inflight_key = key + (max_wait,)
+        task = self._inflight.get(inflight_key)
+        if task is not None:
+            self.coalesce_stats['coalesced'] += 1
+        else:
+            self.coalesce_stats['upstream'] += 1
+            task = asyncio.ensure_future(
+                self._send_request(method, endpoint, dict(params or {}), sign_required, max_wait)
+            )
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda t: self._on_request_done(key, inflight_key, t, sign_required))
+        
+        # 대기자 하나가 취소돼도 공유 요청은 계속 진행
+        return await asyncio.shield(task)
+    
+    def _on_request_done(self, key: Tuple, inflight_key: Tuple, task: asyncio.Task, sign_required: bool):
+        """공유 요청 완료 처리 (성공 결과만 캐시)"""
+        self._inflight.pop(inflight_key, None)
+        
+        if task.cancelled() or task.exception() is not None:
+            return
+        
+        if self.cache_ttl > 0 and not sign_required:
+            now = time.monotonic()
+            self._response_cache[key] = (now, task.result())
+            
+            # 만료 항목 정리 (캐시 크기는 요청 종류 수로 제한됨)
+            expired = [k for k, (at, _) in self._response_cache.items() if now - at >= self.cache_ttl]
+            for k in expired:
+                del self._response_cache[k]
+    
+    def get_coalesce_stats(self) -> Dict[str, Any]:
+        """요청 병합 통계 반환 (saved = 업스트림 호출을 아낀 횟수)"""
+        stats = dict(self.coalesce_stats)
+        stats['saved'] = stats['coalesced'] + stats['cache_hits']
+        stats['inflight'] = len(self._inflight)
+        return stats
+    
+    async def _send_request(self, method: str, endpoint: str, params: Dict = None,
+                            sign_required: bool = False, max_wait: Optional[float] = None) -> Dict:
+        """업스트림 요청 실행 (일시 오류는 지터 백오프로 재시도, 서킷 차단 중이면 즉시 거부)"""
+        breaker = self._get_breaker(endpoint)
+        if not breaker.allow_request():
+            raise CircuitOpenError(endpoint, breaker.retry_after())
+        
+        # 주문 등 비멱등 요청은 중복 실행 위험이 있어 재시도하지 않음
+        attempts = self.max_retries + 1 if method.upper() == 'GET' else 1
+        
+        for attempt in range(attempts):
+            try:
+                result = await self._send_once(method, endpoint, dict(params or {}), sign_required, max_wait)
+                breaker.record_success()
+                if attempt > 0:
+                    self.retry_stats['recovered'] += 1
+                return result
+                
+            except RequestDroppedError as e:
+                # 보내지 않은 요청이므로 서킷 판단에서 제외
+                self._get_metrics(endpoint).record_error(e)
+                raise
+                
+            except Exception as e:
+                self._get_metrics(endpoint).record_error(e)
+                
+                if not self._is_retryable(e):
+                    # 요청 자체의 오류는 엔드포인트 장애로 보지 않음
+                    breaker.record_success()
+                    self.logger.error(f"API 요청 처리 실패: {str(e)}")
+                    raise
+                
+                breaker.record_failure()
+                self.health.record(False)
+                if attempt + 1 >= attempts or breaker.state == 'open':
+                    self.retry_stats['failed'] += 1
+                    self.logger.error(f"HTTP 요청 실패 ({endpoint}, {attempt + 1}회 시도): {str(e) or type(e).__name__}")
+                    raise
+                
+                # 전체 지터: 0 ~ 지수 백오프 상한 사이 임의 대기 (동시 재시도 분산)
+                delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt))
+                self.retry_stats['retries'] += 1
+                self.logger.warning(f"⚠️ {endpoint} 일시 오류, {delay:.2f}초 후 재시도: {str(e) or type(e).__name__}")
+                await asyncio.sleep(delay)
+    
+    def _is_retryable(self, error: Exception) -> bool:
+        """재시도로 회복 가능한 오류 여부 (네트워크/타임아웃/서버 일시 오류)"""
+        if isinstance(error, BybitAPIError):
+            return error.retryable
+        return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+    
+    def get_priority(self, endpoint: str) -> int:
+        """엔드포인트 우선순위 클래스"""
+        for prefix, priority in self.ENDPOINT_PRIORITIES.items():
+            if endpoint.startswith(prefix):
+                return priority
+        return PRIORITY_TICKER
+    
+    def _get_metrics(self, endpoint: str) -> EndpointMetrics:
+        """엔드포인트 계측 조회 (없으면 생성)"""
+        metrics = self.metrics.get(endpoint)
+        if metrics is None:
+            metrics = EndpointMetrics()
+            self.metrics[endpoint] = metrics
+        return metrics
+    
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """엔드포인트별 계측 요약 반환"""
+        return {endpoint: metrics.summary() for endpoint, metrics in self.metrics.items()}
+    
+    def _get_breaker(self, endpoint: str) -> CircuitBreaker:
+        """엔드포인트 서킷 브레이커 조회 (없으면 생성)"""
+        breaker = self.circuit_breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(self.circuit_failure_threshold, self.circuit_recovery_timeout)
+            self.circuit_breakers[endpoint] = breaker
+        return breaker
+    
+    def is_circuit_open(self, endpoint: str) -> bool:
+        """엔드포인트 차단 여부"""
+        breaker = self.circuit_breakers.get(endpoint)
+        return breaker is not None and breaker.state == 'open' and breaker.retry_after() > 0
+    
+    def get_circuit_status(self) -> Dict[str, Any]:
+        """엔드포인트별 서킷 상태 및 재시도 통계 반환"""
+        return {
+            'retry_stats': dict(self.retry_stats),
+            'circuits': {
+                endpoint: breaker.get_status()
+                for endpoint, breaker in self.circuit_breakers.items()
+            }
+        }
+    
+    async def _send_once(self, method: str, endpoint: str, params: Dict,
+                         sign_required: bool, max_wait: Optional[float] = None) -> Dict:
+        """업스트림 요청 1회 실행"""
         if not self.session:
             raise RuntimeError("API 클라이언트가 초기화되지 않았습니다.")
         
-        # 요청 제한 대기
-        await self.rate_limiter.wait()
+        # 요청 제한 대기 (우선순위 클래스별 예약 예산)
+        rate_limiter = self.rate_limiters['private' if sign_required else 'public']
+        waited = await rate_limiter.acquire(
+            self.ENDPOINT_WEIGHTS.get(endpoint, 1.0), self.get_priority(endpoint), max_wait
+        )
         
         url = f"{self.base_url}{endpoint}"
         
-        if params is None:
-            params = {}
-        
         # 서명이 필요한 경우
         if sign_required:
             params = self._generate_signature(params)
         
-        try:
-            if method.upper() == 'GET':
-                async with self.session.get(url, params=params) as response:
-                    data = await response.json()
-            else:
-                async with self.session.request(method, url, json=params) as response:
-                    data = await response.json()
-            
-            # API 응답 검증
-            if data.get('retCode') != 0:
-                raise Exception(f"API 오류: {data.get('retMsg', 'Unknown error')}")
-            
-            return data.get('result', {})
-            
-        except aiohttp.ClientError as e:
-            self.logger.error(f"HTTP 요청 실패: {str(e)}")
-            raise
-        except Exception as e:
-            self.logger.error(f"API 요청 처리 실패: {str(e)}")
-            raise
+        started = time.perf_counter()
+        if method.upper() == 'GET':
+            async with self.session.get(url, params=params) as response:
+                rate_limiter.update_from_headers(response.headers)
+                self._check_status(response)
+                body = await response.read()
+        else:
+            async with self.session.request(method, url, json=params) as response:
+                rate_limiter.update_from_headers(response.headers)
+                self._check_status(response)
+                body = await response.read()
+        received = time.perf_counter()
+        
+        data = json.loads(body)
+        decoded = time.perf_counter()
+        
+        self._get_metrics(endpoint).record(
+            (received - started) * 1000, len(body), (decoded - received) * 1000, waited * 1000
+        )
+        self.health.record(True, (received - started) * 1000)
+        
+        # API 응답 검증
+        if data.get('retCode') != 0:
+            raise BybitAPIError(data.get('retCode'), data.get('retMsg', 'Unknown error'))
+        
+        return data.get('result', {})
+    
+    def _check_status(self, response: aiohttp.ClientResponse):
+        """HTTP 상태 검증 (5xx/429는 재시도 대상)"""
+        if response.status >= 500 or response.status == 429:
+            raise BybitAPIError(None, f"HTTP {response.status}", retryable=True)
     
-    async def get_kline_data(self, symbol: str, interval: str, limit: int = 200) -> List[Dict]:
-        """K-라인(캔들) 데이터 조회"""
+    async def get_kline_data(self, symbol: str, interval: str, limit: int = 200,
+                             start: Optional[int] = None, end: Optional[int] = None,
+                             max_wait: Optional[float] = None) -> List[Dict]:
+        """K-라인(캔들) 데이터 조회 (start/end: 밀리초 타임스탬프, max_wait: 대기 한도 초)"""
         params = {
             'category': 'linear',  # USDT Perpetual
             'symbol': symbol,
@@ -122,7 +686,49 @@ class BybitAPI:
             'limit': limit
         }
         
-        data = await self._make_request('GET', '/v5/market/kline', params)
+        if start is not None:
+            params['start'] = start
+        if end is not None:
+            params['end'] = end
+        
+        data = await self._make_request('GET', '/v5/market/kline', params, max_wait=max_wait)
+        return data.get('list', [])
+    
+    async def get_funding_history(self, symbol: str, limit: int = 1) -> List[Dict]:
+        """펀딩비 정산 이력 조회 (최신순, 요청당 최대 200개)"""
+        params = {
+            'category': 'linear',
+            'symbol': symbol,
+            'limit': limit
+        }
+        
+        data = await self._make_request('GET', '/v5/market/funding/history', params)
+        return data.get('list', [])
+    
+    async def get_open_interest(self, symbol: str, interval_time: str = '5min',
+                                limit: int = 1) -> List[Dict]:
+        """미결제약정 이력 조회 (최신순, 요청당 최대 200개)"""
+        params = {
+            'category': 'linear',
+            'symbol': symbol,
+            'intervalTime': interval_time,
+            'limit': limit
+        }
+        
+        data = await self._make_request('GET', '/v5/market/open-interest', params)
+        return data.get('list', [])
+    
+    async def get_long_short_ratio(self, symbol: str, period: str = '5min',
+                                   limit: int = 1) -> List[Dict]:
+        """계정 롱/숏 비율 조회 (최신순, 요청당 최대 500개)"""
+        params = {
+            'category': 'linear',
+            'symbol': symbol,
+            'period': period,
+            'limit': limit
+        }
+        
+        data = await self._make_request('GET', '/v5/market/account-ratio', params)
         return data.get('list', [])
     
     async def get_ticker_info(self, symbol: str) -> Dict:
@@ -136,6 +742,130 @@ class BybitAPI:
         tickers = data.get('list', [])
         return tickers[0] if tickers else {}
     
+    async def get_all_tickers(self) -> List[Dict]:
+        """전체 USDT 무기한 티커 일괄 조회 (요청 1회)"""
+        data = await self._make_request('GET', '/v5/market/tickers', {'category': 'linear'})
+        return data.get('list', [])
+    
+    async def get_instruments(self) -> Dict[str, Dict]:
+        """전체 USDT 무기한 심볼 규격 (심볼 -> 규격, 커서 페이지 일괄 조회 후 캐시)"""
+        endpoint = '/v5/market/instruments-info'
+        instruments = self.metadata.get(endpoint)
+        if instruments is not None:
+            self.instruments = instruments
+            return instruments
+        
+        instruments = {}
+        cursor = None
+        while True:
+            params = {'category': 'linear', 'limit': 1000}
+            if cursor:
+                params['cursor'] = cursor
+            
+            data = await self._make_request('GET', endpoint, params)
+            for item in data.get('list', []):
+                instruments[item['symbol']] = item
+            
+            cursor = data.get('nextPageCursor')
+            if not cursor:
+                break
+        
+        self.metadata.set(endpoint, instruments, self.METADATA_TTLS[endpoint])
+        self.instruments = instruments
+        return instruments
+    
+    def instruments_due(self) -> bool:
+        """심볼 규격 재조회 필요 여부 (캐시 TTL 만료)"""
+        expires_at = self.metadata.expires_at('/v5/market/instruments-info')
+        return expires_at is None or expires_at <= time.time()
+    
+    async def get_risk_limits(self, symbol: str) -> List[Dict]:
+        """심볼 리스크 한도(레버리지 구간) 조회 (캐시)"""
+        endpoint = '/v5/market/risk-limit'
+        key = f"{endpoint}:{symbol}"
+        risk_limits = self.metadata.get(key)
+        if risk_limits is not None:
+            return risk_limits
+        
+        data = await self._make_request('GET', endpoint, {'category': 'linear', 'symbol': symbol})
+        risk_limits = data.get('list', [])
+        
+        self.metadata.set(key, risk_limits, self.METADATA_TTLS[endpoint])
+        return risk_limits
+    
+    async def get_server_time_offset(self) -> float:
+        """서버 시각 - 로컬 시각 (밀리초, 동기화 주기가 지났으면 재동기화)"""
+        if self.clock.needs_sync():
+            await self.sync_clock()
+        return self.clock.offset_at(time.time() * 1000)
+    
+    async def sync_clock(self, samples: int = 5) -> bool:
+        """서버 시각 샘플 수집 (캐시/요청 병합 없이 연속 왕복 측정, 모두 실패하면 백오프)"""
+        if not self.session:
+            raise RuntimeError("API 클라이언트가 초기화되지 않았습니다.")
+        
+        endpoint = '/v5/market/time'
+        collected = 0
+        
+        for _ in range(samples):
+            # 속도 제한 대기는 왕복 시간에서 제외
+            await self.rate_limiters['public'].acquire(1.0, self.get_priority(endpoint))
+            try:
+                sent_ms = time.time() * 1000
+                async with self.session.get(f"{self.base_url}{endpoint}") as response:
+                    data = await response.json()
+                received_ms = time.time() * 1000
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning(f"⚠️ 서버 시각 조회 실패: {str(e) or type(e).__name__}")
+                continue
+            
+            if data.get('retCode') != 0:
+                continue
+            
+            self.clock.add_sample(sent_ms, received_ms, int(data['result']['timeNano']) / 1e6)
+            collected += 1
+        
+        if collected:
+            status = self.clock.get_status()
+            self.logger.debug(
+                f"🕒 서버 시각 동기화: 오프셋 {status['offset_ms']:.1f}ms, 최소 왕복 {status['min_rtt_ms']:.1f}ms"
+            )
+        else:
+            self.clock.record_failure()
+            self.logger.warning(f"⚠️ 서버 시각 동기화 실패, {self.clock.retry_after():.0f}초 후 재시도")
+        return collected > 0
+    
+    def get_instrument(self, symbol: str) -> Optional[Dict]:
+        """캐시된 심볼 규격 조회 (get_instruments 호출 이후 사용 가능, 만료 후에도 갱신 전까지 마지막 규격)"""
+        instruments = self.metadata.get('/v5/market/instruments-info')
+        if instruments is not None:
+            self.instruments = instruments
+        return self.instruments.get(symbol)
+    
+    def round_price(self, symbol: str, price: float) -> Optional[float]:
+        """호가 단위(tickSize)로 반올림 (규격이 없으면 None)"""
+        instrument = self.get_instrument(symbol)
+        if instrument is None:
+            return None
+        
+        tick = Decimal(instrument['priceFilter']['tickSize'])
+        steps = (Decimal(repr(price)) / tick).to_integral_value(rounding=ROUND_HALF_UP)
+        return float(steps * tick)
+    
+    def round_qty(self, symbol: str, qty: float) -> Optional[float]:
+        """수량 단위(qtyStep)로 내림, 최소 주문 수량 미만이면 0 (규격이 없으면 None)"""
+        instrument = self.get_instrument(symbol)
+        if instrument is None:
+            return None
+        
+        lot = instrument['lotSizeFilter']
+        step = Decimal(lot['qtyStep'])
+        rounded = (Decimal(repr(qty)) / step).to_integral_value(rounding=ROUND_DOWN) * step
+        
+        if rounded < Decimal(lot['minOrderQty']):
+            return 0.0
+        return float(rounded)
+    
     async def get_positions(self) -> List[Dict]:
         """현재 포지션 조회"""
         params = {
@@ -147,7 +877,7 @@ class BybitAPI:
         return data.get('list', [])
     
     async def test_connection(self) -> bool:
-        """연결 테스트"""
+        """연결 테스트 (능동 점검 요청)"""
         try:
             await self._make_request('GET', '/v5/market/time')
             return True
@@ -156,31 +886,508 @@ class BybitAPI:
             return False
 
 class RateLimiter:
-    """API 호출 속도 제한"""
+    """토큰 버킷 기반 API 호출 속도 제한 (우선순위 클래스별 예약 예산, 높은 우선순위부터 깨움)"""
     
-    def __init__(self, max_requests_per_minute: int):
+    # 클래스별 예약 비율 (용량 대비) - 낮은 우선순위는 상위 클래스 예약분을 쓰지 못함
+    DEFAULT_RESERVES: Dict[int, float] = {
+        PRIORITY_ORDER: 0.2,
+        PRIORITY_POSITION: 0.1,
+        PRIORITY_TICKER: 0.1
+    }
+    
+    def __init__(self, max_requests_per_minute: int, burst: Optional[int] = None,
+                 reserves: Optional[Dict[int, float]] = None):
         self.max_requests = max_requests_per_minute
-        self.requests = []
-        self.lock = asyncio.Lock()
+        self.rate = max_requests_per_minute / 60.0  # 초당 토큰 충전량
+        self.capacity = float(burst or max(1, max_requests_per_minute // 4))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        
+        # 우선순위별 하한 (토큰이 하한 아래로 내려가는 요청은 대기)
+        reserves = self.DEFAULT_RESERVES if reserves is None else reserves
+        self.floors = {
+            priority: self.capacity * sum(reserves.get(higher, 0.0) for higher in PRIORITY_NAMES if higher < priority)
+            for priority in PRIORITY_NAMES
+        }
+        
+        # 서버가 알려준 차단 해제 시각 (monotonic 기준)
+        self.blocked_until = 0.0
+        
+        # 대기열 힙 (우선순위, 순번, 가중치, future) - 락 없이 단일 깨우기 태스크가 처리
+        self._waiters: List[Tuple[int, int, float, asyncio.Future]] = []
+        self._sequence = 0
+        self._waker: Optional[asyncio.Task] = None
+        
+        self.stats = {'acquired': 0, 'waited': 0, 'wait_time': 0.0, 'dropped': 0, 'server_throttled': 0}
+        self.class_stats = {
+            name: {'acquired': 0, 'wait_time': 0.0, 'max_wait': 0.0, 'dropped': 0}
+            for name in PRIORITY_NAMES.values()
+        }
+    
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 충전 - O(1)"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    async def acquire(self, weight: float = 1.0, priority: int = PRIORITY_TICKER,
+                      max_wait: Optional[float] = None) -> float:
+        """요청 전 토큰 확보 (대기한 시간(초) 반환, max_wait 초과 시 RequestDroppedError)"""
+        now = time.monotonic()
+        self._refill(now)
+        self.stats['acquired'] += 1
+        class_stats = self.class_stats[PRIORITY_NAMES[priority]]
+        class_stats['acquired'] += 1
+        
+        # 같거나 높은 우선순위 대기자가 없고 예약분을 침범하지 않으면 즉시 통과
+        ahead = self._waiters and self._waiters[0][0] <= priority
+        if not ahead and now >= self.blocked_until and self.tokens >= self._required(priority, weight):
+            self.tokens -= weight
+            return 0.0
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._sequence += 1
+        heapq.heappush(self._waiters, (priority, self._sequence, weight, future))
+        
+        # 오래 기다린 낮은 우선순위 요청은 버림 (다음 주기에 새로 요청)
+        if max_wait is not None:
+            loop.call_later(max_wait, self._drop_waiter, future, priority)
+        
+        # 새 대기자가 선두가 되면 깨우기 태스크를 다시 시작해 대기 시간 재계산
+        if self._waker is None or self._waker.done():
+            self._waker = asyncio.create_task(self._wake_waiters())
+        elif self._waiters[0][3] is future:
+            self._waker.cancel()
+            self._waker = asyncio.create_task(self._wake_waiters())
+        
+        await future
+        
+        waited = time.monotonic() - now
+        self.stats['waited'] += 1
+        self.stats['wait_time'] += waited
+        class_stats['wait_time'] += waited
+        class_stats['max_wait'] = max(class_stats['max_wait'], waited)
+        return waited
+    
+    def _required(self, priority: int, weight: float) -> float:
+        """통과에 필요한 토큰 수 (예약 하한 + 가중치, 버킷이 가득 차면 항상 통과)"""
+        return max(weight, min(self.floors[priority] + weight, self.capacity))
+    
+    def _drop_waiter(self, future: asyncio.Future, priority: int):
+        """대기 한도를 넘긴 요청 제거 (힙에서는 다음 확인 시 정리)"""
+        if future.done():
+            return
+        
+        future.set_exception(RequestDroppedError(PRIORITY_NAMES[priority]))
+        self.stats['dropped'] += 1
+        self.class_stats[PRIORITY_NAMES[priority]]['dropped'] += 1
     
     async def wait(self):
-        """요청 전 대기"""
-        async with self.lock:
-            now = time.time()
-            
-            # 1분 이전 요청 제거
-            self.requests = [req_time for req_time in self.requests 
-                           if now - req_time < 60]
-            
-            # 제한 초과 시 대기
-            if len(self.requests) >= self.max_requests:
-                sleep_time = 60 - (now - self.requests[0])
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
-                    self.requests = self.requests[1:]
-            
-            # 현재 요청 시간 기록
-            self.requests.append(now)
+        """요청 전 대기 (가중치 1)"""
+        await self.acquire(1.0)
+    
+    async def _wake_waiters(self):
+        """우선순위가 가장 높은 대기자부터 토큰이 채워지는 대로 깨움 (락을 잡고 자지 않음)"""
+        while self._waiters:
+            priority, _, weight, future = self._waiters[0]
+            
+            # 취소/제거된 대기자는 건너뜀
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            
+            now = time.monotonic()
+            self._refill(now)
+            
+            if now < self.blocked_until:
+                await asyncio.sleep(self.blocked_until - now)
+                continue
+            
+            needed = self._required(priority, weight)
+            if self.tokens >= needed:
+                self.tokens -= weight
+                heapq.heappop(self._waiters)
+                future.set_result(None)
+                continue
+            
+            await asyncio.sleep((needed - self.tokens) / self.rate)
+    
+    def update_from_headers(self, headers):
+        """바이비트 응답 헤더로 남은 한도 보정"""
+        remaining = headers.get('X-Bapi-Limit-Status')
+        if remaining is None:
+            return
+        
+        try:
+            remaining = float(remaining)
+        except ValueError:
+            return
+        
+        now = time.monotonic()
+        self._refill(now)
+        
+        # 서버 기준 남은 요청 수가 더 적으면 맞춤
+        self.tokens = min(self.tokens, remaining)
+        
+        # 한도 소진 시 리셋 시각까지 차단
+        if remaining <= 0:
+            try:
+                reset_ts = int(headers.get('X-Bapi-Limit-Reset-Timestamp') or 0)
+            except ValueError:
+                return
+            if reset_ts:
+                block_seconds = reset_ts / 1000 - time.time()
+                self.blocked_until = max(self.blocked_until, now + max(0.0, block_seconds))
+                self.stats['server_throttled'] += 1
+    
+    def get_status(self) -> Dict[str, Any]:
+        """제한기 상태 반환"""
+        self._refill(time.monotonic())
+        return {
+            'tokens': round(self.tokens, 2),
+            'capacity': self.capacity,
+            'rate_per_minute': self.max_requests,
+            'waiting': sum(1 for waiter in self._waiters if not waiter[3].done()),
+            **self.stats,
+            'classes': {name: dict(stats) for name, stats in self.class_stats.items()}
+        }
+
+class HealthMonitor:
+    """최근 요청 결과 기반 수동 상태 판단 (별도 점검 요청 없음)"""
+    
+    def __init__(self, window: int = 50, max_error_rate: float = 0.5,
+                 max_latency_ms: float = 5000.0):
+        self.max_error_rate = max_error_rate
+        self.max_latency_ms = max_latency_ms
+        
+        # 최근 요청 결과 (성공 여부, 지연 ms)
+        self._outcomes: deque = deque(maxlen=window)
+        self.last_request_at = 0.0  # monotonic
+        self.last_success_at = 0.0
+        self.stats = {'probes': 0}
+    
+    def record(self, success: bool, latency_ms: float = 0.0):
+        """요청 결과 1건 기록 - O(1)"""
+        now = time.monotonic()
+        self._outcomes.append((success, latency_ms))
+        self.last_request_at = now
+        if success:
+            self.last_success_at = now
+    
+    def idle_seconds(self) -> float:
+        """마지막 요청 이후 경과 시간 (요청이 없었으면 무한대)"""
+        if self.last_request_at == 0.0:
+            return float('inf')
+        return time.monotonic() - self.last_request_at
+    
+    def error_rate(self) -> float:
+        """최근 요청 오류율"""
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for success, _ in self._outcomes if not success) / len(self._outcomes)
+    
+    def p95_latency(self) -> float:
+        """최근 성공 요청 지연 p95 (ms)"""
+        latencies = [latency for success, latency in self._outcomes if success]
+        if not latencies:
+            return 0.0
+        return float(np.percentile(latencies, 95))
+    
+    def is_healthy(self) -> bool:
+        """최근 요청 기준 정상 여부 (오류율/지연 한도 이내)"""
+        if not self._outcomes:
+            return True
+        return self.error_rate() <= self.max_error_rate and self.p95_latency() <= self.max_latency_ms
+    
+    def get_status(self) -> Dict[str, Any]:
+        """상태 반환"""
+        idle = self.idle_seconds()
+        return {
+            'healthy': self.is_healthy(),
+            'samples': len(self._outcomes),
+            'error_rate': round(self.error_rate(), 3),
+            'p95_latency_ms': round(self.p95_latency(), 1),
+            'idle_seconds': None if idle == float('inf') else round(idle, 1),
+            **self.stats
+        }
+
+class ClockSync:
+    """서버 시각 오프셋/드리프트 추정 (NTP 방식, 왕복 시간이 가장 짧은 샘플 우선)"""
+    
+    def __init__(self, window: int = 32, sync_interval: float = 600.0, retry_delay: float = 30.0):
+        self.sync_interval = sync_interval
+        self.retry_delay = retry_delay  # 동기화 실패 후 재시도 대기 시작 값 (연속 실패마다 2배, 최대 sync_interval)
+        
+        # (로컬 중간 시각 ms, 오프셋 ms, 왕복 시간 ms)
+        self._samples: deque = deque(maxlen=window)
+        self.offset = 0.0  # 서버 - 로컬 (ms)
+        self.drift = 0.0  # 로컬 1ms당 오프셋 변화량
+        self.reference_ms = 0.0  # 오프셋 기준 로컬 시각
+        self.min_rtt = None
+        self.synced_at = 0.0  # monotonic
+        self.failed_at = 0.0  # monotonic, 마지막 실패 시각
+        self.failures = 0  # 연속 실패 횟수
+    
+    @property
+    def is_synced(self) -> bool:
+        return bool(self._samples)
+    
+    def needs_sync(self) -> bool:
+        """재동기화 필요 여부 (실패 직후에는 백오프 동안 재시도하지 않음)"""
+        now = time.monotonic()
+        if self.failures and now - self.failed_at < self.retry_after():
+            return False
+        return not self._samples or now - self.synced_at >= self.sync_interval
+    
+    def retry_after(self) -> float:
+        """현재 실패 백오프 (초)"""
+        return min(self.retry_delay * 2 ** (self.failures - 1), self.sync_interval)
+    
+    def record_failure(self):
+        """동기화 실패 기록 (샘플이 있으면 기존 오프셋 계속 사용)"""
+        self.failures += 1
+        self.failed_at = time.monotonic()
+    
+    def add_sample(self, sent_ms: float, received_ms: float, server_ms: float):
+        """왕복 1회 샘플 추가 (서버 시각은 왕복 중간 시점으로 간주)"""
+        local_mid = (sent_ms + received_ms) / 2
+        self._samples.append((local_mid, server_ms - local_mid, received_ms - sent_ms))
+        self.synced_at = time.monotonic()
+        self.failures = 0
+        self._estimate()
+    
+    def _estimate(self):
+        """최소 왕복 샘플로 오프셋, 왕복이 짧은 샘플들의 추세로 드리프트 추정"""
+        samples = np.array(self._samples)
+        local, offsets, rtts = samples[:, 0], samples[:, 1], samples[:, 2]
+        
+        # 왕복이 짧을수록 비대칭 지연 오차가 작음
+        best = int(np.argmin(rtts))
+        self.min_rtt = float(rtts[best])
+        self.offset = float(offsets[best])
+        self.reference_ms = float(local[best])
+        
+        # 최소 왕복의 1.5배 이내 샘플이 10분 이상 걸쳐 있으면 기울기로 드리프트 추정
+        good = rtts <= max(self.min_rtt * 1.5, self.min_rtt + 1.0)
+        if good.sum() >= 3 and local[good].max() - local[good].min() >= 600_000:
+            self.drift = float(np.polyfit(local[good], offsets[good], 1)[0])
+        else:
+            self.drift = 0.0
+    
+    def offset_at(self, local_ms: float) -> float:
+        """로컬 시각의 서버 오프셋 (ms)"""
+        return self.offset + self.drift * (local_ms - self.reference_ms)
+    
+    def now_ms(self) -> int:
+        """현재 서버 시각 추정값 (ms)"""
+        local_ms = time.time() * 1000
+        return int(local_ms + self.offset_at(local_ms))
+    
+    def get_status(self) -> Dict[str, Any]:
+        """상태 반환"""
+        return {
+            'synced': self.is_synced,
+            'offset_ms': round(self.offset_at(time.time() * 1000), 2),
+            'drift_ppm': round(self.drift * 1e6, 3),
+            'min_rtt_ms': None if self.min_rtt is None else round(self.min_rtt, 2),
+            'samples': len(self._samples),
+            'failures': self.failures
+        }
+
+class MetadataCache:
+    """거래소 메타데이터 캐시 (항목별 TTL + LRU 제거, 선택적 파일 저장)"""
+    
+    def __init__(self, max_entries: int = 256, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.path = path
+        self._entries: OrderedDict = OrderedDict()  # 키 -> (만료 시각, 값)
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str) -> Any:
+        """캐시 값 조회 (없거나 만료되면 None)"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self._entries[key]
+            self.stats['misses'] += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.stats['hits'] += 1
+        return entry[1]
+    
+    def expires_at(self, key: str) -> Optional[float]:
+        """항목 만료 시각 (없으면 None, 통계/LRU 순서에 영향 없음)"""
+        entry = self._entries.get(key)
+        return None if entry is None else entry[0]
+    
+    def set(self, key: str, value: Any, ttl: float):
+        """캐시 값 저장 (용량 초과 시 가장 오래 안 쓴 항목 제거)"""
+        self._entries[key] = (time.time() + ttl, value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats['evictions'] += 1
+    
+    def load(self):
+        """저장 파일에서 만료되지 않은 항목 로드"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        now = time.time()
+        for key, (expires_at, value) in entries.items():
+            if expires_at > now:
+                self._entries[key] = (expires_at, value)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def save(self):
+        """만료되지 않은 항목을 파일로 원자적 저장"""
+        if not self.path:
+            return
+        
+        now = time.time()
+        entries = {key: entry for key, entry in self._entries.items() if entry[0] > now}
+        
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(temp_path, self.path)
+
+class TickerTable:
+    """티커 스냅샷 테이블 (심볼 인덱스 + 컬럼형 float64 배열)"""
+    
+    # 필드명 -> 바이비트 응답 키
+    FIELDS: Dict[str, str] = {
+        'last_price': 'lastPrice',
+        'mark_price': 'markPrice',
+        'price_change_pct': 'price24hPcnt',
+        'high_24h': 'highPrice24h',
+        'low_24h': 'lowPrice24h',
+        'volume_24h': 'volume24h',
+        'turnover_24h': 'turnover24h',
+        'funding_rate': 'fundingRate',
+        'next_funding_time': 'nextFundingTime',
+        'open_interest': 'openInterest',
+        'open_interest_value': 'openInterestValue',
+        'bid_price': 'bid1Price',
+        'ask_price': 'ask1Price'
+    }
+    
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.columns: Dict[str, np.ndarray] = {
+            field: np.empty(0, dtype=np.float64) for field in self.FIELDS
+        }
+        self.raw: Dict[str, Dict] = {}
+        self.updated_at: Optional[float] = None
+    
+    def __len__(self) -> int:
+        return len(self.index)
+    
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.index
+    
+    def load(self, tickers: List[Dict]):
+        """티커 목록으로 테이블 재구성 (문자열 파싱은 컬럼별 1회)"""
+        self.index = {ticker['symbol']: i for i, ticker in enumerate(tickers)}
+        self.columns = {
+            field: np.array([ticker.get(key) or 'nan' for ticker in tickers], dtype=np.float64)
+            for field, key in self.FIELDS.items()
+        }
+        self.raw = {ticker['symbol']: ticker for ticker in tickers}
+        self.updated_at = time.time()
+    
+    def get(self, symbol: str, field: str) -> Optional[float]:
+        """필드 값 조회 - O(1)"""
+        i = self.index.get(symbol)
+        if i is None:
+            return None
+        
+        value = self.columns[field][i]
+        return None if np.isnan(value) else float(value)
+    
+    def symbols(self) -> List[str]:
+        """테이블에 있는 심볼 목록"""
+        return list(self.index)
+
+class RefreshScheduler:
+    """캔들 마감 시각 기반 시간대별 갱신 스케줄러"""
+    
+    def __init__(self, timeframes: List[str], intrabar_timeframes: List[str],
+                 close_delay: float = 2.0, clock: Optional[ClockSync] = None):
+        self.timeframes = list(timeframes)
+        self.intrabar_timeframes = set(intrabar_timeframes)
+        self.close_delay_ms = int(close_delay * 1000)
+        self.clock = clock  # 있으면 서버 시각 기준으로 캔들 경계 계산
+        
+        # (심볼, 시간대)별 마지막으로 반영한 캔들 마감 경계
+        self.refreshed_boundary: Dict[Tuple[str, str], int] = {}
+    
+    def _now_ms(self) -> int:
+        """현재 시각 (ms, 서버 시각 우선)"""
+        if self.clock is not None:
+            return self.clock.now_ms()
+        return int(time.time() * 1000)
+    
+    @staticmethod
+    def bar_start(timeframe: str, now_ms: int) -> int:
+        """현재 진행 중인 캔들의 시작 시각 (UTC 기준 정렬)"""
+        interval_ms = TIMEFRAME_MS[timeframe]
+        return now_ms // interval_ms * interval_ms
+    
+    def due_timeframes(self, symbol: str, timeframes: List[str] = None,
+                       now_ms: Optional[int] = None) -> List[str]:
+        """이번 주기에 갱신이 필요한 시간대 목록"""
+        now_ms = now_ms if now_ms is not None else self._now_ms()
+        due = []
+        
+        for timeframe in timeframes if timeframes is not None else self.timeframes:
+            # 진행 중 캔들을 사용하는 시간대는 매 주기 갱신
+            if timeframe in self.intrabar_timeframes:
+                due.append(timeframe)
+                continue
+            
+            # 그 외 시간대는 캔들 마감 직후 한 번만 갱신
+            boundary = self.bar_start(timeframe, now_ms)
+            if self.refreshed_boundary.get((symbol, timeframe), -1) < boundary and \
+               now_ms - boundary >= self.close_delay_ms:
+                due.append(timeframe)
+        
+        return due
+    
+    def mark_refreshed(self, symbol: str, timeframe: str, now_ms: Optional[int] = None):
+        """갱신 완료 기록 (현재 캔들 경계까지 반영됨)"""
+        now_ms = now_ms if now_ms is not None else self._now_ms()
+        self.refreshed_boundary[(symbol, timeframe)] = self.bar_start(timeframe, now_ms)
+    
+    def seconds_until_next_close(self, timeframe: str = None, now_ms: Optional[int] = None) -> float:
+        """다음 캔들 마감(+지연)까지 남은 시간 (초)"""
+        now_ms = now_ms if now_ms is not None else self._now_ms()
+        timeframe = timeframe or min(self.timeframes, key=lambda tf: TIMEFRAME_MS[tf])
+        
+        next_close = self.bar_start(timeframe, now_ms) + TIMEFRAME_MS[timeframe] + self.close_delay_ms
+        return (next_close - now_ms) / 1000
+    
+    def forget(self, symbol: str):
+        """심볼 스케줄 상태 제거"""
+        for key in [key for key in self.refreshed_boundary if key[0] == symbol]:
+            del self.refreshed_boundary[key]
 
 class DataCollector:
     """데이터 수집 및 관리 클래스"""
@@ -193,16 +1400,117 @@ class DataCollector:
         self.api = BybitAPI(
             config.BYBIT_API_KEY,
             config.BYBIT_SECRET,
-            config.BYBIT_TESTNET
+            config.BYBIT_TESTNET,
+            request_timeout=config.REQUEST_TIMEOUT,
+            pool_size=config.HTTP_POOL_SIZE,
+            keepalive_timeout=config.HTTP_KEEPALIVE_TIMEOUT,
+            dns_cache_ttl=config.HTTP_DNS_CACHE_TTL,
+            public_rate_limit=config.API_RATE_LIMIT,
+            private_rate_limit=config.API_PRIVATE_RATE_LIMIT,
+            rate_burst=config.API_RATE_BURST,
+            cache_ttl=config.API_CACHE_TTL,
+            metadata_cache_size=config.METADATA_CACHE_SIZE,
+            metadata_cache_path=config.METADATA_CACHE_FILE or None,
+            max_retries=config.API_MAX_RETRIES,
+            retry_base_delay=config.API_RETRY_BASE_DELAY,
+            retry_max_delay=config.API_RETRY_MAX_DELAY,
+            circuit_failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+            circuit_recovery_timeout=config.CIRCUIT_RECOVERY_TIMEOUT,
+            health_window=config.HEALTH_WINDOW,
+            health_max_error_rate=config.HEALTH_MAX_ERROR_RATE,
+            health_max_latency_ms=config.HEALTH_MAX_LATENCY_MS,
+            recv_window=config.API_RECV_WINDOW,
+            clock_sync_interval=config.CLOCK_SYNC_INTERVAL
         )
         
+        # 수집 심볼 (유니버스 관리 시 실행 중 추가/제외)
+        self.symbols: List[str] = list(config.SYMBOLS)
+        self._warming: Dict[str, asyncio.Task] = {}
+        self.universe: Optional[UniverseManager] = None
+        if config.UNIVERSE_ENABLED:
+            self.universe = UniverseManager(
+                config.UNIVERSE_SIZE,
+                config.UNIVERSE_MIN_TURNOVER,
+                config.UNIVERSE_VOLATILITY_WEIGHT,
+                config.UNIVERSE_RETIRE_BUFFER,
+                config.UNIVERSE_PINNED
+            )
+            self.universe.members = list(self.symbols)
+        
         # 데이터 저장소
-        self.symbol_data: Dict[str, Dict[str, pd.DataFrame]] = {}
+        self.symbol_data: Dict[str, Dict[str, CandleBuffer]] = {}
         self.ticker_data: Dict[str, Dict] = {}
+        self.tickers = TickerTable()
         
         # 상태 관리
         self.last_update: Dict[str, datetime] = {}
+        self.stale_since: Dict[str, float] = {}  # 갱신 실패로 마지막 정상 데이터를 제공 중인 심볼
+        self.tickers_stale = False
         self.is_initialized = False
+        
+        # (심볼, 시간대)별 마지막 저장 캔들 시작 시각 (델타 조회 기준)
+        self.last_candle_ts: Dict[Tuple[str, str], int] = {}
+        self.refreshed_at: Dict[Tuple[str, str], float] = {}  # 신선도 인덱스 (마지막 반영 시각)
+        self.fetch_stats = {'delta': 0, 'full': 0, 'gaps': 0}
+        
+        # 1분봉 기반 상위 시간대 로컬 집계 (활성화 시 상위 시간대는 주기적 대조만 REST 조회)
+        self.base_timeframe = config.RESAMPLE_BASE_TIMEFRAME
+        self.derived_timeframes: List[str] = []
+        if config.RESAMPLE_ENABLED:
+            base_ms = TIMEFRAME_MS[self.base_timeframe]
+            self.derived_timeframes = [
+                tf for tf in config.TIMEFRAMES
+                if tf != self.base_timeframe and TIMEFRAME_MS[tf] % base_ms == 0
+            ]
+        self.last_reconcile: Dict[str, float] = {}
+        self.resample_stats = {'resampled': 0, 'reconciled': 0, 'mismatches': 0}
+        
+        # 캔들 마감 기반 갱신 스케줄러 (서버 시각 기준 경계)
+        self.scheduler = RefreshScheduler(
+            config.TIMEFRAMES,
+            config.INTRABAR_TIMEFRAMES,
+            config.CANDLE_CLOSE_DELAY,
+            self.api.clock
+        )
+        
+        # 동시 요청 수 제한 (RateLimiter와 별개로 동시 실행 개수만 제한)
+        self._request_semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_REQUESTS)
+        
+        # 캔들 디스크 캐시 (재시작 시 누락 구간만 델타 조회)
+        self.cache_dir: Optional[str] = config.CANDLE_CACHE_DIR if config.CANDLE_CACHE_ENABLED else None
+        self.last_cache_save = time.time()
+        self.cache_stats = {'loaded': 0, 'saved': 0}
+        
+        # 백필 히스토리 아카이브 (메모리 매핑 조회)
+        self.history = HistoryStore(config.HISTORY_DATA_DIR)
+        
+        # 웹소켓 캔들 스트림 (start_streaming 호출 시 생성)
+        self.stream: Optional[BybitPublicStream] = None
+        self.streamed_timeframes: List[str] = []
+        
+        # 호가창 (start_order_books 호출 시 스트림으로 갱신)
+        self.order_books: Dict[str, OrderBook] = {}
+        self._resyncing: set = set()
+        
+        # 백그라운드 작업 (완료 전 가비지 컬렉션 방지, 종료 시 취소)
+        self._background_tasks: set = set()
+        
+        # 체결 테이프 (캔들 기본 시간대 경계로 주문 흐름 바 마감)
+        self.trade_tape = TradeTape(
+            TIMEFRAME_MS[self.base_timeframe],
+            config.TRADE_FLOW_CAPACITY,
+            config.TRADE_LARGE_NOTIONAL
+        )
+        
+        # 파생 지표 (미결제약정은 티커 스냅샷, 펀딩비/롱숏 비율은 백그라운드 조회)
+        self.derivatives = DerivativesCollector(
+            self.api,
+            self.symbols,
+            config.OPEN_INTEREST_INTERVAL,
+            config.LONG_SHORT_PERIOD,
+            config.DERIVATIVES_HISTORY_LIMIT,
+            config.DERIVATIVES_CAPACITY
+        )
     
     async def initialize(self):
         """데이터 수집기 초기화"""
@@ -221,6 +1529,19 @@ class DataCollector:
             self.logger.error(f"데이터 수집기 초기화 실패: {str(e)}")
             raise
     
+    async def open_session(self):
+        """장기 HTTP 세션 열기 및 서버 시각 동기화"""
+        await self.api.open()
+        await self.sync_clock()
+    
+    async def sync_clock(self) -> bool:
+        """서버 시각 동기화 (실패해도 로컬 시각으로 계속 동작)"""
+        try:
+            return await self.api.sync_clock()
+        except Exception as e:
+            self.logger.warning(f"⚠️ 서버 시각 동기화 실패: {str(e)}")
+            return False
+    
     async def test_connection(self) -> bool:
         """연결 상태 확인"""
         try:
@@ -230,124 +1551,816 @@ class DataCollector:
             return False
     
     async def fetch_initial_data(self):
-        """초기 데이터 수집"""
+        """초기 데이터 수집 (디스크 캐시 로드 후 누락 구간만 조회, 심볼 동시 처리)"""
         self.logger.info("📥 초기 데이터 수집 시작...")
+        started = time.time()
         
         try:
             async with self.api as api:
-                for symbol in self.config.SYMBOLS:
-                    self.logger.info(f"📊 {symbol} 데이터 수집 중...")
-                    
-                    # 심볼별 데이터 저장소 초기화
-                    self.symbol_data[symbol] = {}
-                    
-                    # 각 시간대별 데이터 수집
-                    for timeframe in self.config.TIMEFRAMES:
-                        try:
-                            kline_data = await api.get_kline_data(
-                                symbol, timeframe, self.config.DATA_LIMIT
-                            )
-                            
-                            # DataFrame으로 변환
-                            df = self._convert_to_dataframe(kline_data, symbol, timeframe)
-                            self.symbol_data[symbol][timeframe] = df
-                            
-                            self.logger.debug(f"✅ {symbol} {timeframe} 데이터 수집 완료 ({len(df)}개)")
-                            
-                        except Exception as e:
-                            self.logger.error(f"❌ {symbol} {timeframe} 데이터 수집 실패: {str(e)}")
-                    
-                    # 티커 데이터 수집
-                    ticker = await api.get_ticker_info(symbol)
-                    self.ticker_data[symbol] = ticker
-                    
-                    # 업데이트 시간 기록
-                    self.last_update[symbol] = datetime.now()
-                    
-                    # API 제한을 위한 짧은 대기
-                    await asyncio.sleep(0.1)
+                # 요청 수는 세마포어와 RateLimiter가 제한
+                await asyncio.gather(
+                    *(self._fetch_initial_symbol(api, symbol) for symbol in self.symbols)
+                )
+            
+            # 티커는 전체 스냅샷 1회로 수집, 심볼 규격은 캐시에 미리 적재
+            await asyncio.gather(self.refresh_tickers(), self.load_instruments())
             
-            self.logger.info("✅ 초기 데이터 수집 완료")
+            self.logger.info(
+                f"✅ 초기 데이터 수집 완료 ({time.time() - started:.1f}초, "
+                f"캐시 {self.cache_stats['loaded']}개, 델타 {self.fetch_stats['delta']}회, "
+                f"전체 {self.fetch_stats['full']}회)"
+            )
             
         except Exception as e:
             self.logger.error(f"❌ 초기 데이터 수집 실패: {str(e)}")
             raise
     
+    async def refresh_instruments(self) -> bool:
+        """심볼 규격 캐시가 만료됐으면 재조회 (조회 중/실패 시에는 마지막 규격 사용)"""
+        if not self.api.instruments_due():
+            return True
+        return await self.load_instruments()
+    
+    async def load_instruments(self) -> bool:
+        """심볼 규격 캐시 적재 (가격/수량 반올림용)"""
+        try:
+            async with self.api as api:
+                instruments = await api.get_instruments()
+            
+            missing = [symbol for symbol in self.symbols if symbol not in instruments]
+            if missing:
+                self.logger.warning(f"⚠️ 심볼 규격 없음: {', '.join(missing)}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"❌ 심볼 규격 조회 실패: {str(e)}")
+            return False
+    
+    async def _fetch_initial_symbol(self, api: BybitAPI, symbol: str):
+        """심볼 1개 초기 수집 (캐시가 있으면 델타, 없으면 전체 조회)"""
+        self.logger.info(f"📊 {symbol} 데이터 수집 중...")
+        
+        # 심볼별 데이터 저장소 초기화
+        self.symbol_data[symbol] = {}
+        self._load_cached_candles(symbol)
+        
+        async def fetch(timeframe: str):
+            kline_data = await self._fetch_klines_delta(api, symbol, timeframe)
+            
+            # 링 버퍼에 저장 (마감 후 1회 갱신 시간대는 마감된 캔들만)
+            columns = decode_klines(kline_data)
+            if self._closed_only(timeframe):
+                columns = self._drop_open_bar(timeframe, columns)
+            self._merge_candles(symbol, timeframe, columns)
+            self.scheduler.mark_refreshed(symbol, timeframe)
+            
+            self.logger.debug(f"✅ {symbol} {timeframe} 데이터 수집 완료 ({len(kline_data)}개)")
+        
+        # 캐시된 상위 시간대 중 기준 시간대 보관 구간으로 재집계 가능한 것은 조회 생략
+        timeframes = [
+            timeframe for timeframe in self.config.TIMEFRAMES
+            if not self._covered_by_resample(symbol, timeframe)
+        ]
+        results = await asyncio.gather(
+            *(fetch(timeframe) for timeframe in timeframes),
+            return_exceptions=True
+        )
+        for timeframe, result in zip(timeframes, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"❌ {symbol} {timeframe} 데이터 수집 실패: {str(result)}")
+        
+        # 기준 시간대가 덮는 구간은 로컬 집계로 맞춤 (시간대 간 일관성)
+        if self.derived_timeframes:
+            self._resample_derived(symbol, 0)
+            self.last_reconcile[symbol] = time.time()
+        
+        # 업데이트 시간 기록
+        self.last_update[symbol] = datetime.now()
+    
+    def _covered_by_resample(self, symbol: str, timeframe: str) -> bool:
+        """캐시 이후 구간을 기준 시간대 캔들로 모두 재집계할 수 있는지 여부"""
+        if timeframe not in self.derived_timeframes:
+            return False
+        
+        last_ts = self.last_candle_ts.get((symbol, timeframe))
+        if last_ts is None:
+            return False
+        
+        # 기준 시간대 전체 조회가 덮는 가장 오래된 시각
+        base_ms = TIMEFRAME_MS[self.base_timeframe]
+        now_ms = self.api.clock.now_ms()
+        base_start = (now_ms // base_ms - self._candle_limit(self.base_timeframe) + 1) * base_ms
+        return last_ts >= base_start
+    
+    def _cache_path(self, symbol: str, timeframe: str) -> str:
+        """(심볼, 시간대) 캐시 파일 경로"""
+        return os.path.join(self.cache_dir, f"{symbol}_{timeframe}.npy")
+    
+    def _load_cached_candles(self, symbol: str):
+        """디스크 캐시를 링 버퍼로 로드"""
+        if not self.cache_dir:
+            return
+        
+        for timeframe in self.config.TIMEFRAMES:
+            path = self._cache_path(symbol, timeframe)
+            if not os.path.exists(path):
+                continue
+            
+            buffer = self._get_buffer(symbol, timeframe)
+            loaded = buffer.load(path)
+            if loaded == 0:
+                self.logger.warning(f"⚠️ {symbol} {timeframe} 캐시 파일 손상, 전체 조회")
+                continue
+            
+            self.last_candle_ts[(symbol, timeframe)] = buffer.last_timestamp()
+            self.cache_stats['loaded'] += 1
+    
+    def save_candle_cache(self):
+        """전체 링 버퍼를 디스크 캐시로 저장"""
+        if not self.cache_dir:
+            return
+        
+        for symbol, buffers in self.symbol_data.items():
+            for timeframe, buffer in buffers.items():
+                if buffer.empty:
+                    continue
+                try:
+                    buffer.save(self._cache_path(symbol, timeframe))
+                    self.cache_stats['saved'] += 1
+                except OSError as e:
+                    self.logger.error(f"❌ {symbol} {timeframe} 캐시 저장 실패: {str(e)}")
+        
+        self.last_cache_save = time.time()
+    
+    async def update_all_symbols(self, symbols: List[str] = None) -> Dict[str, bool]:
+        """전체 심볼 데이터 동시 업데이트 (심볼 단위 실패 격리)"""
+        symbols = symbols or self.active_symbols()
+        
+        # 티커 스냅샷 1회 + (만료 시) 심볼 규격 + 심볼별 캔들 갱신을 동시에 실행
+        results = await asyncio.gather(
+            self.refresh_tickers(),
+            self.refresh_instruments(),
+            *(self.update_symbol_data(symbol) for symbol in symbols),
+            return_exceptions=True
+        )
+        results = results[2:]
+        
+        # 시계 드리프트 보정을 위한 주기적 재동기화
+        if self.api.clock.needs_sync():
+            await self.sync_clock()
+        
+        # 방금 받은 티커 스냅샷으로 유니버스 재구성 (추가 요청 없음)
+        if self.universe and not self.tickers_stale and \
+           self.universe.is_due(self.config.UNIVERSE_REFRESH_INTERVAL):
+            await self.refresh_universe()
+        
+        # 비정상 종료 대비 주기적 캐시 저장
+        if self.cache_dir and time.time() - self.last_cache_save >= self.config.CANDLE_CACHE_SAVE_INTERVAL:
+            self.save_candle_cache()
+        
+        # 한 심볼의 실패가 전체 사이클을 중단시키지 않음
+        status = {}
+        for symbol, result in zip(symbols, results):
+            status[symbol] = not isinstance(result, BaseException)
+        
+        failed = [symbol for symbol, ok in status.items() if not ok]
+        if failed:
+            self.logger.warning(f"⚠️ 데이터 업데이트 실패 심볼 {len(failed)}개: {', '.join(failed)}")
+        
+        return status
+    
+    def active_symbols(self) -> List[str]:
+        """초기 수집이 끝난 심볼 목록 (지표/신호 계산 대상)"""
+        return [symbol for symbol in self.symbols if symbol not in self._warming]
+    
+    async def refresh_universe(self, hot_add: bool = True) -> Tuple[List[str], List[str]]:
+        """거래대금/변동성 순위로 심볼 구성 갱신 (hot_add=False면 목록만 갱신, 샤드 워커가 수집 담당)"""
+        try:
+            instruments = await self.api.get_instruments()
+        except Exception as e:
+            self.logger.error(f"❌ 유니버스 갱신용 심볼 규격 조회 실패: {str(e)}")
+            return [], []
+        
+        added, retired = self.universe.refresh(self.tickers, instruments)
+        if not hot_add:
+            self.symbols = [symbol for symbol in self.symbols if symbol not in retired] + added
+        else:
+            for symbol in retired:
+                await self.remove_symbol(symbol)
+            for symbol in added:
+                self.add_symbol(symbol)
+        
+        if added or retired:
+            self.logger.info(
+                f"🌐 유니버스 갱신: {len(self.symbols)}개 심볼 "
+                f"(추가 {', '.join(added) or '-'} / 제외 {', '.join(retired) or '-'})"
+            )
+        return added, retired
+    
+    def add_symbol(self, symbol: str):
+        """심볼 추가 (초기 수집이 끝날 때까지 갱신/지표 대상에서 제외)"""
+        if symbol in self.symbols:
+            return
+        
+        self.symbols.append(symbol)
+        self.derivatives.add_symbol(symbol)
+        self._warming[symbol] = self._spawn(self._warm_up_symbol(symbol))
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        """백그라운드 작업 생성 (완료 시 참조 해제, 처리되지 않은 예외는 로그)"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_done)
+        return task
+    
+    def _on_background_done(self, task: asyncio.Task):
+        """백그라운드 작업 완료 처리"""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"❌ 백그라운드 작업 실패: {str(task.exception())}")
+    
+    async def _warm_up_symbol(self, symbol: str):
+        """추가 심볼 초기 수집 (디스크 캐시 + 델타) 후 스트림 구독"""
+        try:
+            # 실패해도 다음 갱신 주기의 전체 조회로 이어받음 (스트림 구독은 그대로 진행)
+            try:
+                async with self.api as api:
+                    await self._fetch_initial_symbol(api, symbol)
+            except Exception as e:
+                self.logger.error(f"❌ {symbol} 초기 수집 실패: {str(e)}")
+            
+            try:
+                await self._subscribe_symbol(symbol)
+            except Exception as e:
+                self.logger.error(f"❌ {symbol} 스트림 구독 실패: {str(e)}")
+        finally:
+            self._warming.pop(symbol, None)
+    
+    async def _subscribe_symbol(self, symbol: str):
+        """실행 중인 스트림에 심볼 토픽 추가"""
+        if self.stream is None:
+            return
+        
+        topics = [f"kline.{timeframe}.{symbol}" for timeframe in self.streamed_timeframes]
+        if self.order_books:
+            self.order_books[symbol] = OrderBook(symbol, self.config.ORDERBOOK_TOP_LEVELS)
+            topics.append(f"orderbook.{self.config.ORDERBOOK_DEPTH}.{symbol}")
+        if self.trade_tape.accumulators:
+            self.trade_tape.add_symbol(symbol)
+            topics.append(f"publicTrade.{symbol}")
+        await self.stream.subscribe(topics)
+    
+    async def remove_symbol(self, symbol: str):
+        """심볼 제외 (스트림 구독 해제, 캐시 저장 후 메모리 정리)"""
+        if symbol not in self.symbols:
+            return
+        
+        self.symbols.remove(symbol)
+        task = self._warming.pop(symbol, None)
+        if task:
+            task.cancel()
+        
+        if self.stream is not None:
+            await self.stream.unsubscribe([
+                topic for topic in self.stream.topics if topic.endswith(f".{symbol}")
+            ])
+        
+        # 다시 편입되면 캐시에서 델타만 조회하도록 저장
+        if self.cache_dir:
+            for timeframe, buffer in self.symbol_data.get(symbol, {}).items():
+                if not buffer.empty:
+                    try:
+                        buffer.save(self._cache_path(symbol, timeframe))
+                    except OSError as e:
+                        self.logger.error(f"❌ {symbol} {timeframe} 캐시 저장 실패: {str(e)}")
+        
+        self.symbol_data.pop(symbol, None)
+        self.last_update.pop(symbol, None)
+        self.stale_since.pop(symbol, None)
+        self.last_reconcile.pop(symbol, None)
+        for key in [key for key in self.last_candle_ts if key[0] == symbol]:
+            del self.last_candle_ts[key]
+        for key in [key for key in self.refreshed_at if key[0] == symbol]:
+            del self.refreshed_at[key]
+        self.scheduler.forget(symbol)
+        self.order_books.pop(symbol, None)
+        self.trade_tape.accumulators.pop(symbol, None)
+        self.derivatives.remove_symbol(symbol)
+    
     async def update_symbol_data(self, symbol: str):
         """특정 심볼 데이터 업데이트"""
         try:
             async with self.api as api:
-                # 최신 캔들 데이터 수집 (최근 50개만)
-                for timeframe in self.config.TIMEFRAMES:
-                    kline_data = await api.get_kline_data(symbol, timeframe, 50)
-                    new_df = self._convert_to_dataframe(kline_data, symbol, timeframe)
+                # 스트림으로 받는 시간대는 폴링 제외, 마감 전 캔들은 스케줄러가 거름
+                timeframes = self.scheduler.due_timeframes(symbol, self._polled_timeframes())
+                
+                # 시간대별 캔들을 동시에 수집 (마지막 저장 캔들 이후만)
+                kline_results = await asyncio.gather(
+                    *(self._fetch_klines_delta(api, symbol, timeframe, self.config.KLINE_MAX_QUEUE_WAIT)
+                      for timeframe in timeframes),
+                    return_exceptions=True
+                )
+                
+                failed_timeframes = []
+                circuit_open = False
+                for timeframe, result in zip(timeframes, kline_results):
+                    # 속도 제한 대기 한도를 넘긴 갱신은 다음 주기로 미룸 (실패 아님)
+                    if isinstance(result, RequestDroppedError):
+                        self.logger.debug(f"⏭️ {symbol} {timeframe} 갱신 연기 (요청 대기 한도 초과)")
+                        continue
+                    
+                    if isinstance(result, BaseException):
+                        failed_timeframes.append(timeframe)
+                        if isinstance(result, CircuitOpenError):
+                            circuit_open = True
+                        else:
+                            self.logger.error(f"❌ {symbol} {timeframe} 데이터 업데이트 실패: {str(result)}")
+                        continue
+                    
+                    self._apply_klines(symbol, timeframe, result)
                     
-                    # 기존 데이터와 병합
-                    if symbol in self.symbol_data and timeframe in self.symbol_data[symbol]:
-                        existing_df = self.symbol_data[symbol][timeframe]
-                        
-                        # 중복 제거 후 병합
-                        combined_df = pd.concat([existing_df, new_df]).drop_duplicates(
-                            subset=['timestamp'], keep='last'
-                        ).sort_values('timestamp')
-                        
-                        # 최대 길이 제한
-                        if len(combined_df) > self.config.DATA_LIMIT:
-                            combined_df = combined_df.tail(self.config.DATA_LIMIT)
-                        
-                        self.symbol_data[symbol][timeframe] = combined_df
-                    else:
-                        if symbol not in self.symbol_data:
-                            self.symbol_data[symbol] = {}
-                        self.symbol_data[symbol][timeframe] = new_df
+                    # 방금 마감된 캔들이 아직 응답에 없으면 다음 주기에 다시 조회
+                    if not self._closed_only(timeframe) or self._has_closed_bar(symbol, timeframe):
+                        self.scheduler.mark_refreshed(symbol, timeframe)
                 
-                # 티커 데이터 업데이트
-                ticker = await api.get_ticker_info(symbol)
-                self.ticker_data[symbol] = ticker
+                # 상위 시간대 주기적 거래소 대조
+                if self._reconcile_due(symbol):
+                    await self._reconcile_derived(api, symbol)
+                
+                if failed_timeframes:
+                    self.stale_since.setdefault(symbol, time.time())
+                    
+                    # 서킷 차단 중에는 마지막 정상 데이터를 stale로 제공 (사이클 실패로 보지 않음)
+                    if circuit_open and self.symbol_data.get(symbol):
+                        self.logger.warning(f"⚠️ {symbol} K-라인 서킷 차단 중, 마지막 정상 데이터 사용")
+                        return
+                    raise Exception(f"시간대 {', '.join(failed_timeframes)} 수집 실패")
                 
                 # 업데이트 시간 기록
                 self.last_update[symbol] = datetime.now()
+                self.stale_since.pop(symbol, None)
                 
         except Exception as e:
             self.logger.error(f"❌ {symbol} 데이터 업데이트 실패: {str(e)}")
             raise
     
-    def _convert_to_dataframe(self, kline_data: List[List], symbol: str, timeframe: str) -> pd.DataFrame:
-        """K-라인 데이터를 DataFrame으로 변환"""
-        if not kline_data:
-            return pd.DataFrame()
-        
-        # 바이비트 K-라인 형식: [startTime, openPrice, highPrice, lowPrice, closePrice, volume, turnover]
-        df_data = []
-        for kline in kline_data:
-            df_data.append({
-                'timestamp': int(kline[0]),
-                'open': float(kline[1]),
-                'high': float(kline[2]),
-                'low': float(kline[3]),
-                'close': float(kline[4]),
-                'volume': float(kline[5]),
-                'turnover': float(kline[6]),
-                'symbol': symbol,
-                'timeframe': timeframe
-            })
-        
-        df = pd.DataFrame(df_data)
-        df['datetime'] = pd.to_datetime(df['timestamp'], unit='ms')
-        df = df.sort_values('timestamp').reset_index(drop=True)
-        
-        return df
+    async def refresh_tickers(self) -> bool:
+        """전체 티커 스냅샷 갱신 (실패 시 이전 스냅샷 유지)"""
+        try:
+            # K-라인 요청에 동시 실행 슬롯이 묶여 있어도 밀리지 않도록 세마포어 밖에서 조회
+            async with self.api as api:
+                tickers = await api.get_all_tickers()
+            
+            self.tickers.load(tickers)
+            self.ticker_data = self.tickers.raw
+            self.tickers_stale = False
+            self.derivatives.on_tickers(self.tickers, self.api.clock.now_ms())
+            return True
+            
+        except Exception as e:
+            self.tickers_stale = True
+            if isinstance(e, CircuitOpenError):
+                self.logger.warning("⚠️ 티커 서킷 차단 중, 이전 스냅샷 사용")
+            else:
+                self.logger.error(f"❌ 티커 스냅샷 갱신 실패: {str(e)}")
+            return False
+    
+    async def _fetch_klines_limited(self, api: BybitAPI, symbol: str, timeframe: str,
+                                    limit: int) -> List[List]:
+        """동시 요청 수 제한 하에 K-라인 조회"""
+        async with self._request_semaphore:
+            return await api.get_kline_data(symbol, timeframe, limit)
+    
+    async def _fetch_klines_full(self, api: BybitAPI, symbol: str, timeframe: str) -> List[List]:
+        """보관 개수만큼 전체 조회 (요청당 1000개 제한은 end 기준 페이지 조회)"""
+        total = self._candle_limit(timeframe)
+        klines: List[List] = []
+        end = None
+        
+        while len(klines) < total:
+            limit = min(1000, total - len(klines))
+            async with self._request_semaphore:
+                page = await api.get_kline_data(symbol, timeframe, limit=limit, end=end)
+            
+            klines.extend(page)
+            if len(page) < limit:
+                break
+            
+            # 최신순 응답이므로 마지막 원소가 가장 오래된 캔들
+            end = int(page[-1][0]) - 1
+        
+        return klines
+    
+    async def _fetch_klines_delta(self, api: BybitAPI, symbol: str, timeframe: str,
+                                  max_wait: Optional[float] = None) -> List[List]:
+        """마지막 저장 캔들 이후 구간만 조회 (갭 감지 시 전체 재조회, max_wait: 델타 요청 대기 한도)"""
+        last_ts = self.last_candle_ts.get((symbol, timeframe))
+        
+        if last_ts is None:
+            self.fetch_stats['full'] += 1
+            return await self._fetch_klines_full(api, symbol, timeframe)
+        
+        # 마지막 저장 캔들(진행 중일 수 있음)부터 현재 캔들까지의 개수
+        interval_ms = TIMEFRAME_MS[timeframe]
+        now_ms = self.api.clock.now_ms()
+        needed = (now_ms // interval_ms * interval_ms - last_ts) // interval_ms + 1
+        
+        # 보관 범위(또는 요청당 최대치)를 넘는 공백은 전체 재조회
+        if needed > min(self._candle_limit(timeframe), 1000):
+            self.fetch_stats['gaps'] += 1
+            self.fetch_stats['full'] += 1
+            return await self._fetch_klines_full(api, symbol, timeframe)
+        
+        async with self._request_semaphore:
+            kline_data = await api.get_kline_data(
+                symbol, timeframe, limit=int(max(needed, 1)), start=last_ts, max_wait=max_wait
+            )
+        self.fetch_stats['delta'] += 1
+        
+        # 응답이 마지막 저장 캔들과 이어지지 않으면 갭으로 판단 (최신순 응답)
+        if kline_data and int(kline_data[-1][0]) > last_ts:
+            self.logger.warning(f"⚠️ {symbol} {timeframe} 캔들 갭 감지, 전체 재조회")
+            self.fetch_stats['gaps'] += 1
+            self.fetch_stats['full'] += 1
+            return await self._fetch_klines_full(api, symbol, timeframe)
+        
+        return kline_data
+    
+    def _candle_limit(self, timeframe: str) -> int:
+        """시간대별 보관 캔들 수 (집계 기준 시간대는 최상위 캔들 1개를 덮을 만큼 보관)"""
+        if timeframe == self.base_timeframe and self.derived_timeframes:
+            base_ms = TIMEFRAME_MS[self.base_timeframe]
+            longest = max(TIMEFRAME_MS[tf] for tf in self.derived_timeframes)
+            return max(self.config.DATA_LIMIT, longest // base_ms)
+        
+        return self.config.DATA_LIMIT
+    
+    def _closed_only(self, timeframe: str) -> bool:
+        """마감된 캔들만 저장하는 시간대 여부 (마감 후 1회만 갱신하므로 진행 중 캔들은 그대로 굳음)"""
+        return timeframe not in self.scheduler.intrabar_timeframes and \
+            timeframe not in self.derived_timeframes
+    
+    def _drop_open_bar(self, timeframe: str, columns: Dict[str, np.ndarray],
+                       now_ms: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """진행 중 캔들(시작 시각 >= 현재 캔들 시작) 제외"""
+        now_ms = now_ms if now_ms is not None else self.api.clock.now_ms()
+        bar_start = RefreshScheduler.bar_start(timeframe, now_ms)
+        end = int(np.searchsorted(columns['timestamp'], bar_start, side='left'))
+        if end == len(columns['timestamp']):
+            return columns
+        return {name: values[:end] for name, values in columns.items()}
+    
+    def _has_closed_bar(self, symbol: str, timeframe: str) -> bool:
+        """직전에 마감된 캔들까지 저장됐는지 여부"""
+        last_ts = self.last_candle_ts.get((symbol, timeframe))
+        now_ms = self.api.clock.now_ms()
+        return last_ts is not None and \
+            last_ts >= RefreshScheduler.bar_start(timeframe, now_ms) - TIMEFRAME_MS[timeframe]
+    
+    def _apply_klines(self, symbol: str, timeframe: str, kline_data: List[List]):
+        """REST 응답 캔들을 저장소에 반영 (기준 시간대면 상위 시간대 재집계)"""
+        columns = decode_klines(kline_data)
+        if self._closed_only(timeframe):
+            columns = self._drop_open_bar(timeframe, columns)
+        self._merge_candles(symbol, timeframe, columns)
+        
+        if timeframe == self.base_timeframe and self.derived_timeframes and len(columns['timestamp']):
+            self._resample_derived(symbol, int(columns['timestamp'][0]))
+    
+    def _resample_derived(self, symbol: str, since_ts: int):
+        """since_ts 이후 바뀐 기준 캔들이 속한 상위 시간대 캔들 재계산"""
+        base = self.symbol_data.get(symbol, {}).get(self.base_timeframe)
+        if base is None or base.empty:
+            return
+        
+        first_ts = base.first_timestamp()
+        
+        for timeframe in self.derived_timeframes:
+            interval_ms = TIMEFRAME_MS[timeframe]
+            
+            # 기준 캔들이 버킷 시작부터 모두 있는 버킷만 집계 (부분 버킷은 거래소 값 유지)
+            first_full_bucket = -(-first_ts // interval_ms) * interval_ms
+            bucket_from = max(since_ts // interval_ms * interval_ms, first_full_bucket)
+            
+            window = base.since(bucket_from)
+            if len(window['timestamp']) == 0:
+                continue
+            
+            self._merge_candles(symbol, timeframe, resample_candles(window, interval_ms))
+            self.resample_stats['resampled'] += 1
+    
+    def _reconcile_due(self, symbol: str) -> bool:
+        """상위 시간대 대조 주기 도래 여부"""
+        interval = self.config.RESAMPLE_RECONCILE_INTERVAL
+        if not self.derived_timeframes or interval <= 0:
+            return False
+        
+        return time.time() - self.last_reconcile.get(symbol, 0) >= interval * 60
+    
+    async def _reconcile_derived(self, api: BybitAPI, symbol: str):
+        """로컬 집계 캔들을 거래소 캔들과 대조 (불일치 시 거래소 값 우선)"""
+        timeframes = self.derived_timeframes
+        results = await asyncio.gather(
+            *(self._fetch_klines_limited(api, symbol, timeframe, self.config.RESAMPLE_RECONCILE_BARS)
+              for timeframe in timeframes),
+            return_exceptions=True
+        )
+        
+        for timeframe, result in zip(timeframes, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"❌ {symbol} {timeframe} 캔들 대조 실패: {str(result)}")
+                continue
+            
+            # 진행 중 캔들은 로컬 집계가 더 최신이고 거래소 값과 항상 달라 대조/병합에서 제외
+            exchange = self._drop_open_bar(timeframe, decode_klines(result))
+            local = self.symbol_data.get(symbol, {}).get(timeframe)
+            
+            if local is not None and not local.empty and len(exchange['timestamp']):
+                local_ts = local.view('timestamp')
+                indices = np.minimum(np.searchsorted(local_ts, exchange['timestamp']), len(local_ts) - 1)
+                matched = local_ts[indices] == exchange['timestamp']
+                mismatched = matched & ~(
+                    np.isclose(local.view('close')[indices], exchange['close']) &
+                    np.isclose(local.view('volume')[indices], exchange['volume'])
+                )
+                mismatches = int(mismatched.sum())
+                if mismatches:
+                    self.logger.debug(f"🔍 {symbol} {timeframe} 집계 불일치 {mismatches}개 보정")
+                self.resample_stats['mismatches'] += mismatches
+            
+            self._merge_candles(symbol, timeframe, exchange)
+            self.resample_stats['reconciled'] += 1
+        
+        self.last_reconcile[symbol] = time.time()
+    
+    def _get_buffer(self, symbol: str, timeframe: str) -> CandleBuffer:
+        """(심볼, 시간대) 링 버퍼 조회 (없으면 생성)"""
+        buffers = self.symbol_data.setdefault(symbol, {})
+        buffer = buffers.get(timeframe)
+        if buffer is None:
+            buffer = CandleBuffer(self._candle_limit(timeframe))
+            buffers[timeframe] = buffer
+        return buffer
+    
+    def _merge_candles(self, symbol: str, timeframe: str, columns: Dict[str, np.ndarray]):
+        """신규 캔들을 링 버퍼에 병합 (겹치는 캔들은 제자리 덮어쓰기)"""
+        buffer = self._get_buffer(symbol, timeframe)
+        buffer.merge(columns)
+        
+        last_ts = buffer.last_timestamp()
+        if last_ts is not None:
+            self.last_candle_ts[(symbol, timeframe)] = last_ts
+            self.refreshed_at[(symbol, timeframe)] = time.time()
+    
+    def _fetched_timeframes(self) -> List[str]:
+        """거래소에서 직접 수신하는 시간대 (로컬 집계 시 기준 시간대만)"""
+        if self.derived_timeframes:
+            return [self.base_timeframe]
+        
+        return list(self.config.TIMEFRAMES)
+    
+    def _polled_timeframes(self) -> List[str]:
+        """REST 폴링이 필요한 시간대 목록"""
+        timeframes = self._fetched_timeframes()
+        if self.stream is None or not self.stream.is_connected:
+            return timeframes
+        
+        return [tf for tf in timeframes if tf not in self.streamed_timeframes]
+    
+    async def start_streaming(self, symbols: List[str] = None, timeframes: List[str] = None):
+        """웹소켓 캔들 스트림 시작 (마감 후 1회 갱신 시간대는 REST 폴링 유지)"""
+        symbols = symbols or self.symbols
+        timeframes = timeframes or [tf for tf in self._fetched_timeframes() if not self._closed_only(tf)]
+        
+        self._ensure_stream()
+        self.streamed_timeframes = list(timeframes)
+        await self.stream.subscribe([
+            f"kline.{timeframe}.{symbol}"
+            for symbol in symbols for timeframe in timeframes
+        ])
+        await self.stream.start()
+        
+        self.logger.info(f"📡 캔들 스트림 시작: {len(symbols)}개 심볼 × {len(timeframes)}개 시간대")
+    
+    def _ensure_stream(self) -> BybitPublicStream:
+        """퍼블릭 스트림 생성 (캔들/호가창 공용)"""
+        if self.stream is None:
+            url = self.config.WS_PUBLIC_URL or (
+                TESTNET_PUBLIC_URL if self.config.BYBIT_TESTNET else MAINNET_PUBLIC_URL
+            )
+            self.stream = BybitPublicStream(url, ping_interval=self.config.WS_PING_INTERVAL)
+            self.stream.add_handler('kline', self._on_kline_message)
+            self.stream.add_handler('orderbook', self._on_orderbook_message)
+            self.stream.add_handler('publicTrade', self.trade_tape.on_message)
+            self.stream.add_reconnect_callback(self._backfill_after_reconnect)
+        return self.stream
+    
+    async def start_order_books(self, symbols: List[str] = None):
+        """호가창 스트림 시작 (스냅샷 수신 후 델타로 갱신)"""
+        symbols = symbols or self.symbols
+        depth = self.config.ORDERBOOK_DEPTH
+        
+        for symbol in symbols:
+            if symbol not in self.order_books:
+                self.order_books[symbol] = OrderBook(symbol, self.config.ORDERBOOK_TOP_LEVELS)
+        
+        stream = self._ensure_stream()
+        await stream.subscribe([f"orderbook.{depth}.{symbol}" for symbol in symbols])
+        await stream.start()
+        
+        self.logger.info(f"📖 호가창 스트림 시작: {len(symbols)}개 심볼 (깊이 {depth})")
+    
+    def _on_orderbook_message(self, message: Dict[str, Any]):
+        """orderbook.{depth}.{symbol} 메시지 반영 (업데이트 ID 갭이면 재구독으로 스냅샷 재수신)"""
+        topic = message['topic']
+        symbol = topic.rsplit('.', 1)[1]
+        book = self.order_books.get(symbol)
+        if book is None:
+            return
+        
+        data = message.get('data', {})
+        if message.get('type') == 'snapshot':
+            book.apply_snapshot(data)
+            self._resyncing.discard(topic)
+            return
+        
+        if not book.apply_delta(data) and topic not in self._resyncing:
+            self.logger.warning(f"⚠️ {symbol} 호가창 시퀀스 갭, 스냅샷 재요청")
+            self._resyncing.add(topic)
+            self._spawn(self._resync_order_book(topic))
+    
+    async def _resync_order_book(self, topic: str):
+        """토픽 재구독 (바이비트는 구독 직후 스냅샷을 보냄, 스냅샷 수신 시 재요청 상태 해제)"""
+        requested = False
+        try:
+            await self.stream.unsubscribe([topic])
+            await self.stream.subscribe([topic])
+            requested = True
+        except Exception as e:
+            self.logger.error(f"❌ {topic} 재구독 실패: {str(e)}")
+        finally:
+            # 실패/취소 시 다음 갭에서 다시 재요청
+            if not requested:
+                self._resyncing.discard(topic)
+    
+    async def start_trade_tape(self, symbols: List[str] = None):
+        """체결 테이프 스트림 시작"""
+        symbols = symbols or self.symbols
+        for symbol in symbols:
+            self.trade_tape.add_symbol(symbol)
+        
+        stream = self._ensure_stream()
+        await stream.subscribe([f"publicTrade.{symbol}" for symbol in symbols])
+        await stream.start()
+        
+        self.logger.info(f"🧾 체결 테이프 시작: {len(symbols)}개 심볼")
+    
+    def get_order_flow(self, symbol: str, timeframe: str = None) -> Optional[Dict[str, np.ndarray]]:
+        """시간대별 주문 흐름 컬럼 (매수/매도 체결량, 델타, CVD, 체결 수, 대량 체결 수)"""
+        timeframe = timeframe or self.base_timeframe
+        if TIMEFRAME_MS[timeframe] % self.trade_tape.interval_ms:
+            return None
+        return self.trade_tape.get_arrays(symbol, TIMEFRAME_MS[timeframe])
+    
+    def get_derivatives_data(self, symbol: str, timeframe: str = None) -> Optional[Dict[str, np.ndarray]]:
+        """캔들 시각에 맞춘 펀딩비/미결제약정/롱숏 비율 컬럼 (캔들 마감 전 관측값만, 없으면 NaN)"""
+        timeframe = timeframe or '1'
+        buffer = self.symbol_data.get(symbol, {}).get(timeframe)
+        if buffer is None or buffer.empty:
+            return None
+        
+        timestamps = buffer.view('timestamp')
+        return self.derivatives.align(symbol, timestamps, TIMEFRAME_MS[timeframe])
+    
+    def get_order_book(self, symbol: str) -> Optional[OrderBook]:
+        """동기화된 호가창 조회 (스냅샷 전이거나 갭 복구 중이면 None)"""
+        book = self.order_books.get(symbol)
+        if book is None or not book.synced:
+            return None
+        return book
+    
+    def get_liquidity(self, symbol: str, quantity: float = 0.0, side: str = 'Buy') -> Optional[Dict[str, Any]]:
+        """스프레드/마이크로프라이스/잔량 불균형 및 수량 체결 슬리피지 추정"""
+        book = self.get_order_book(symbol)
+        if book is None:
+            return None
+        
+        liquidity = book.get_summary()
+        if quantity > 0:
+            liquidity['fill'] = book.estimate_fill(side, quantity)
+        return liquidity
+    
+    async def stop_streaming(self):
+        """웹소켓 캔들 스트림 종료"""
+        if self.stream:
+            await self.stream.stop()
+            self.stream = None
+        self.streamed_timeframes = []
+    
+    def _on_kline_message(self, message: Dict[str, Any]):
+        """kline.{interval}.{symbol} 메시지로 캔들 갱신"""
+        _, timeframe, symbol = message['topic'].split('.', 2)
+        
+        # 마감된 캔들만 저장하는 시간대는 진행 중 캔들(confirm=false) 무시
+        candles = message.get('data', [])
+        if self._closed_only(timeframe):
+            candles = [candle for candle in candles if candle.get('confirm')]
+            
+        for candle in candles:
+            self._upsert_candle(symbol, timeframe, [
+                candle['start'], candle['open'], candle['high'], candle['low'],
+                candle['close'], candle['volume'], candle['turnover']
+            ])
+        
+        if timeframe == self.base_timeframe and self.derived_timeframes and candles:
+            self._resample_derived(symbol, min(int(candle['start']) for candle in candles))
+        
+        self.last_update[symbol] = datetime.now()
+    
+    def _upsert_candle(self, symbol: str, timeframe: str, kline: List):
+        """캔들 1개 갱신 (진행 중 캔들은 덮어쓰기, 새 캔들은 추가) - O(1)"""
+        buffer = self._get_buffer(symbol, timeframe)
+        timestamp = int(kline[0])
+        buffer.upsert(timestamp, *(float(value) for value in kline[1:7]))
+        self.last_candle_ts[(symbol, timeframe)] = buffer.last_timestamp()
+        self.refreshed_at[(symbol, timeframe)] = time.time()
+    
+    async def _backfill_after_reconnect(self):
+        """재연결 후 끊긴 구간을 REST로 보충"""
+        jobs = []
+        for topic in self.stream.topics:
+            prefix, timeframe, symbol = topic.split('.', 2)
+            if prefix == 'kline':
+                jobs.append((symbol, timeframe))
+        
+        # 마지막 저장 캔들 이후 구간만 델타 조회
+        async with self.api as api:
+            results = await asyncio.gather(
+                *(self._fetch_klines_delta(api, symbol, timeframe)
+                  for symbol, timeframe in jobs),
+                return_exceptions=True
+            )
+        
+        filled = 0
+        for (symbol, timeframe), result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"❌ {symbol} {timeframe} 재연결 보충 실패: {str(result)}")
+                continue
+            self._apply_klines(symbol, timeframe, result)
+            filled += 1
+        
+        self.logger.info(f"🩹 재연결 후 캔들 보충 완료: {filled}/{len(jobs)}")
     
     def get_symbol_data(self, symbol: str, timeframe: str = None) -> Optional[pd.DataFrame]:
-        """심볼 데이터 조회"""
+        """심볼 데이터 조회 (링 버퍼를 복사 없이 감싼 DataFrame)"""
         if symbol not in self.symbol_data:
             return None
         
-        if timeframe:
-            return self.symbol_data[symbol].get(timeframe)
-        else:
-            # 기본적으로 1분봉 반환
-            return self.symbol_data[symbol].get('1')
+        # 기본적으로 1분봉 반환
+        buffer = self.symbol_data[symbol].get(timeframe or '1')
+        if buffer is None:
+            return None
+        
+        return buffer.to_dataframe()
+    
+    def get_candle_arrays(self, symbol: str, timeframe: str = '1') -> Optional[Dict[str, np.ndarray]]:
+        """캔들 컬럼 배열 조회 (읽기 전용 뷰, 다음 갱신 전까지 유효)"""
+        buffer = self.symbol_data.get(symbol, {}).get(timeframe)
+        if buffer is None:
+            return None
+        
+        return buffer.columns()
+    
+    def get_history_data(self, symbol: str, timeframe: str = None, start: Optional[int] = None,
+                         end: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """백필 아카이브 구간 조회 (밀리초 시각, 링 버퍼보다 긴 과거 구간용)"""
+        return self.history.get_symbol_data(symbol, timeframe, start, end)
+    
+    def get_market_data(self, symbol: str) -> Dict[str, pd.DataFrame]:
+        """지표 계산용 전체 시간대 데이터 조회 (갱신 실패 중이면 attrs['stale'] = True)"""
+        stale = self.is_stale(symbol)
+        market_data = {}
+        for timeframe, buffer in self.symbol_data.get(symbol, {}).items():
+            if buffer.empty:
+                continue
+            df = buffer.to_dataframe()
+            df.attrs['stale'] = stale
+            
+            # 체결 테이프가 있으면 같은 시간대 주문 흐름 첨부
+            order_flow = self.get_order_flow(symbol, timeframe)
+            if order_flow is not None:
+                df.attrs['order_flow'] = order_flow
+            
+            # 캔들 시각에 맞춘 파생 지표 첨부
+            derivatives = self.derivatives.align(symbol, buffer.view('timestamp'), TIMEFRAME_MS[timeframe])
+            if derivatives is not None:
+                df.attrs['derivatives'] = derivatives
+            market_data[timeframe] = df
+        return market_data
+    
+    def is_stale(self, symbol: str) -> bool:
+        """마지막 갱신이 실패해 이전 데이터를 제공 중인지 여부"""
+        return symbol in self.stale_since
     
     def get_ticker_data(self, symbol: str) -> Optional[Dict]:
         """티커 데이터 조회"""
@@ -355,45 +2368,51 @@ class DataCollector:
     
     def get_latest_price(self, symbol: str) -> Optional[float]:
         """최신 가격 조회"""
-        ticker = self.get_ticker_data(symbol)
-        if ticker:
-            return float(ticker.get('lastPrice', 0))
+        price = self.tickers.get(symbol, 'last_price')
+        if price is not None:
+            return price
         
         # 티커 데이터가 없으면 1분봉 데이터에서 조회
-        df = self.get_symbol_data(symbol, '1')
-        if df is not None and not df.empty:
-            return df.iloc[-1]['close']
+        buffer = self.symbol_data.get(symbol, {}).get('1')
+        if buffer is not None and not buffer.empty:
+            return float(buffer.view('close')[-1])
         
         return None
     
     def get_24h_change(self, symbol: str) -> Optional[Dict[str, float]]:
         """24시간 변화량 조회"""
-        ticker = self.get_ticker_data(symbol)
-        if ticker:
-            return {
-                'price_change': float(ticker.get('price24hPcnt', 0)) * 100,
-                'volume_24h': float(ticker.get('volume24h', 0)),
-                'high_24h': float(ticker.get('highPrice24h', 0)),
-                'low_24h': float(ticker.get('lowPrice24h', 0))
-            }
-        return None
+        i = self.tickers.index.get(symbol)
+        if i is None:
+            return None
+        
+        columns = self.tickers.columns
+        return {
+            'price_change': float(columns['price_change_pct'][i]) * 100,
+            'volume_24h': float(columns['volume_24h'][i]),
+            'high_24h': float(columns['high_24h'][i]),
+            'low_24h': float(columns['low_24h'][i])
+        }
     
-    async def health_check(self) -> bool:
-        """데이터 수집기 상태 점검"""
+    async def health_check(self, stale_series: Optional[List[Tuple[str, str]]] = None) -> bool:
+        """데이터 수집기 상태 점검 (최근 요청 결과 + 신선도, 유휴 시에만 능동 점검, stale_series: 샤드 워커가 보고한 신선도)"""
         try:
-            # API 연결 확인
-            if not await self.test_connection():
+            # 최근 요청이 없을 때만 점검 요청 전송
+            if self.api.health.idle_seconds() >= self.config.HEALTH_PROBE_IDLE:
+                self.api.health.stats['probes'] += 1
+                if not await self.test_connection():
+                    return False
+            elif not self.api.health.is_healthy():
+                status = self.api.health.get_status()
+                self.logger.warning(
+                    f"⚠️ API 상태 불량: 오류율 {status['error_rate']:.0%}, p95 {status['p95_latency_ms']:.0f}ms"
+                )
                 return False
             
-            # 데이터 최신성 확인 (5분 이내)
-            now = datetime.now()
-            for symbol in self.config.SYMBOLS:
-                if symbol not in self.last_update:
-                    return False
-                
-                if (now - self.last_update[symbol]) > timedelta(minutes=5):
-                    self.logger.warning(f"⚠️ {symbol} 데이터가 오래됨: {self.last_update[symbol]}")
-                    return False
+            # 데이터 최신성 확인 (시간대별 최근 캔들이 1개 넘게 밀리면 오래됨)
+            stale = self.get_stale_series() if stale_series is None else stale_series
+            if stale:
+                self.logger.warning(f"⚠️ 오래된 데이터 {len(stale)}개: {', '.join(f'{s} {tf}' for s, tf in stale[:5])}")
+                return False
             
             return True
             
@@ -401,13 +2420,66 @@ class DataCollector:
             self.logger.error(f"상태 점검 실패: {str(e)}")
             return False
     
+    def get_freshness(self, now_ms: Optional[int] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """(심볼, 시간대)별 신선도 인덱스 (현재 캔들 대비 밀린 캔들 수, 마지막 반영 후 경과 초)"""
+        now_ms = now_ms if now_ms is not None else self.api.clock.now_ms()
+        freshness: Dict[str, Dict[str, Dict[str, float]]] = {}
+        
+        for (symbol, timeframe), last_ts in self.last_candle_ts.items():
+            interval_ms = TIMEFRAME_MS[timeframe]
+            current_bar = now_ms // interval_ms * interval_ms
+            freshness.setdefault(symbol, {})[timeframe] = {
+                'lag_bars': max(0, (current_bar - last_ts) // interval_ms),
+                'age': round(time.time() - self.refreshed_at.get((symbol, timeframe), 0.0), 1)
+            }
+        
+        return freshness
+    
+    def get_stale_series(self, max_lag_bars: int = 1) -> List[Tuple[str, str]]:
+        """최근 캔들이 max_lag_bars개 넘게 밀린 (심볼, 시간대) 목록 (수집 대상이 없으면 전체)"""
+        now_ms = self.api.clock.now_ms()
+        stale = []
+        for symbol in self.active_symbols():
+            for timeframe in self.config.TIMEFRAMES:
+                last_ts = self.last_candle_ts.get((symbol, timeframe))
+                interval_ms = TIMEFRAME_MS[timeframe]
+                if last_ts is None or (now_ms // interval_ms * interval_ms - last_ts) // interval_ms > max_lag_bars:
+                    stale.append((symbol, timeframe))
+        return stale
+    
     def get_data_status(self) -> Dict[str, Any]:
         """데이터 상태 정보 반환"""
         status = {
             'initialized': self.is_initialized,
             'symbols_count': len(self.symbol_data),
+            'tickers_count': len(self.tickers),
             'last_updates': {},
-            'data_sizes': {}
+            'data_sizes': {},
+            'connection_stats': self.api.get_connection_stats(),
+            'request_coalescing': self.api.get_coalesce_stats(),
+            'stale_symbols': {
+                symbol: round(time.time() - since, 1) for symbol, since in self.stale_since.items()
+            },
+            'tickers_stale': self.tickers_stale,
+            'circuit_breakers': self.api.get_circuit_status(),
+            'api_health': self.api.health.get_status(),
+            'clock': self.api.clock.get_status(),
+            'freshness': self.get_freshness(),
+            'endpoint_metrics': self.api.get_metrics(),
+            'metadata_cache': {'entries': len(self.api.metadata), **self.api.metadata.stats},
+            'rate_limits': {
+                name: limiter.get_status() for name, limiter in self.api.rate_limiters.items()
+            },
+            'fetch_stats': dict(self.fetch_stats),
+            'resample_stats': dict(self.resample_stats),
+            'cache_stats': dict(self.cache_stats),
+            'stream': self.stream.get_status() if self.stream else None,
+            'order_books': {
+                symbol: {'synced': book.synced, 'update_id': book.update_id, **book.stats}
+                for symbol, book in self.order_books.items()
+            },
+            'trade_tape': self.trade_tape.get_status(),
+            'derivatives': self.derivatives.get_status()
         }
         
         for symbol in self.symbol_data:
@@ -415,15 +2487,32 @@ class DataCollector:
                 status['last_updates'][symbol] = self.last_update[symbol].isoformat()
             
             status['data_sizes'][symbol] = {}
-            for timeframe in self.symbol_data[symbol]:
-                df = self.symbol_data[symbol][timeframe]
-                status['data_sizes'][symbol][timeframe] = len(df) if df is not None else 0
+            for timeframe, buffer in self.symbol_data[symbol].items():
+                status['data_sizes'][symbol][timeframe] = len(buffer)
         
         return status
     
     async def close(self):
         """데이터 수집기 정리"""
         self.logger.info("🛑 데이터 수집기 종료 중...")
-        # 필요시 데이터 저장, 연결 정리 등
+        
+        # 백그라운드 작업(추가 심볼 초기 수집, 호가창 재구독) / 웹소켓 스트림 / 파생 지표 수집 정리
+        for task in list(self._background_tasks):
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await self.stop_streaming()
+        await self.derivatives.stop()
+        
+        # 다음 시작을 위한 캔들 캐시 저장
+        self.save_candle_cache()
+        
+        # 장기 HTTP 세션 정리
+        stats = self.api.get_connection_stats()
+        self.logger.info(
+            f"🔌 HTTP 세션 종료: 요청 {stats['requests']}회, "
+            f"핸드셰이크 {stats['handshakes']}회, 재사용 {stats['reused']}회"
+        )
+        await self.api.close()
+        
         self.is_initialized = False
         self.logger.info("✅ 데이터 수집기 종료 완료")
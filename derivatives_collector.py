@@ -0,0 +1,301 @@
+# derivatives_collector.py - 파생상품 지표 수집 모듈 (펀딩비, 미결제약정, 롱/숏 비율)
+import asyncio
+import logging
+import numpy as np
+from typing import Dict, List, Any, Optional, Tuple, Callable, Awaitable
+
+# 보관 지표
+DERIVATIVES_FIELDS = ['funding_rate', 'open_interest', 'long_short_ratio']
+
+# 바이비트 집계 기간 -> 밀리초
+PERIOD_MS: Dict[str, int] = {
+    '5min': 300_000,
+    '15min': 900_000,
+    '30min': 1_800_000,
+    '1h': 3_600_000,
+    '4h': 14_400_000,
+    '1d': 86_400_000
+}
+
+# 기본 펀딩 주기 (티커의 nextFundingTime이 없을 때)
+FUNDING_INTERVAL_MS = 8 * 3_600_000
+
+class SeriesBuffer:
+    """(시각, 값) 시계열 (시간 오름차순, 용량 초과분은 오래된 값부터 제거)"""
+    
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다!")
+            
+        self.capacity = capacity
+        
+        # 용량의 2배까지 이어 쓰고 가득 차면 최근 용량만큼 앞으로 당김 (분할 상환 O(1))
+        self._timestamps = np.zeros(capacity * 2, dtype=np.int64)
+        self._values = np.zeros(capacity * 2, dtype=np.float64)
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return min(self._size, self.capacity)
+    
+    def last_timestamp(self) -> Optional[int]:
+        """가장 최근 관측 시각"""
+        if self._size == 0:
+            return None
+        return int(self._timestamps[self._size - 1])
+    
+    def append(self, timestamp: int, value: float) -> None:
+        """관측값 추가 (같은 시각이면 덮어쓰기, 이전 시각은 무시)"""
+        last = self.last_timestamp()
+        if last is not None and timestamp <= last:
+            if timestamp == last:
+                self._values[self._size - 1] = value
+            return
+            
+        if self._size == self.capacity * 2:
+            self._timestamps[:self.capacity] = self._timestamps[self.capacity:]
+            self._values[:self.capacity] = self._values[self.capacity:]
+            self._size = self.capacity
+            
+        self._timestamps[self._size] = timestamp
+        self._values[self._size] = value
+        self._size += 1
+    
+    def merge(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        """관측값 일괄 병합 (같은 시각은 새 값 우선, 이력 적재용)"""
+        if len(timestamps) == 0:
+            return
+            
+        existing_ts, existing_values = self.arrays()
+        all_ts = np.concatenate([timestamps, existing_ts])
+        all_values = np.concatenate([values, existing_values])
+        
+        # np.unique는 첫 번째 항목을 남기므로 새 값이 앞에 오도록 연결
+        merged_ts, first = np.unique(all_ts, return_index=True)
+        merged_ts = merged_ts[-self.capacity:]
+        merged_values = all_values[first][-self.capacity:]
+        
+        self._size = len(merged_ts)
+        self._timestamps[:self._size] = merged_ts
+        self._values[:self._size] = merged_values
+    
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(시각, 값) 읽기 전용 뷰 (다음 갱신 전까지 유효)"""
+        start = max(0, self._size - self.capacity)
+        timestamps = self._timestamps[start:self._size]
+        values = self._values[start:self._size]
+        timestamps.flags.writeable = False
+        values.flags.writeable = False
+        return timestamps, values
+    
+    def align(self, timestamps: np.ndarray, interval_ms: int) -> np.ndarray:
+        """캔들 시각별 마지막 관측값 (캔들 마감 전에 알려진 값만 사용, 없으면 NaN)"""
+        series_ts, series_values = self.arrays()
+        positions = np.searchsorted(series_ts, timestamps + interval_ms - 1, side='right') - 1
+        
+        aligned = np.full(len(timestamps), np.nan)
+        known = positions >= 0
+        aligned[known] = series_values[positions[known]]
+        return aligned
+
+class DerivativesCollector:
+    """펀딩비/미결제약정/롱숏 비율 수집기 (메인 루프와 별도 주기, 심볼 간 요청 분산)"""
+    
+    def __init__(self, api, symbols: List[str], oi_interval: str = '5min',
+                 ratio_period: str = '5min', history_limit: int = 200,
+                 capacity: int = 2000, funding_settle_delay: float = 60.0):
+        self.api = api
+        self.symbols = list(symbols)
+        self.oi_interval = oi_interval
+        self.ratio_period = ratio_period
+        self.history_limit = history_limit
+        self.capacity = capacity
+        self.funding_settle_delay_ms = int(funding_settle_delay * 1000)
+        self.logger = logging.getLogger(__name__)
+        
+        # 심볼 -> 지표 -> 시계열
+        self.series: Dict[str, Dict[str, SeriesBuffer]] = {}
+        for symbol in self.symbols:
+            self._ensure_symbol(symbol)
+            
+        # 다음 펀딩 정산 시각 (티커 스냅샷 기준)
+        self.next_funding_time: Dict[str, int] = {}
+        
+        # 백그라운드 작업
+        self.is_running = False
+        self._tasks: List[asyncio.Task] = []
+        
+        # 통계
+        self.stats = {'requests': 0, 'failed': 0, 'oi_samples': 0}
+    
+    def _ensure_symbol(self, symbol: str) -> Dict[str, SeriesBuffer]:
+        """심볼 시계열 생성"""
+        if symbol not in self.series:
+            self.series[symbol] = {field: SeriesBuffer(self.capacity) for field in DERIVATIVES_FIELDS}
+        return self.series[symbol]
+    
+    def add_symbol(self, symbol: str):
+        """수집 심볼 추가 (다음 주기부터 조회)"""
+        if symbol not in self.symbols:
+            self.symbols.append(symbol)
+        self._ensure_symbol(symbol)
+    
+    def remove_symbol(self, symbol: str):
+        """수집 심볼 제거"""
+        if symbol in self.symbols:
+            self.symbols.remove(symbol)
+        self.series.pop(symbol, None)
+        self.next_funding_time.pop(symbol, None)
+    
+    def on_tickers(self, tickers, now_ms: int):
+        """전체 티커 스냅샷에서 미결제약정 표본 기록 (추가 요청 없음)"""
+        interval_ms = PERIOD_MS[self.oi_interval]
+        bucket = now_ms // interval_ms * interval_ms
+        
+        for symbol in self.symbols:
+            next_funding = tickers.get(symbol, 'next_funding_time')
+            if next_funding:
+                self.next_funding_time[symbol] = int(next_funding)
+                
+            # 구간이 바뀐 뒤 첫 스냅샷 값을 구간 시작 시각으로 기록 (바이비트 OI 이력과 같은 기준)
+            open_interest = tickers.get(symbol, 'open_interest')
+            buffer = self.series[symbol]['open_interest']
+            last = buffer.last_timestamp()
+            if open_interest is not None and (last is None or bucket > last):
+                buffer.append(bucket, open_interest)
+                self.stats['oi_samples'] += 1
+    
+    async def start(self):
+        """백그라운드 수집 시작"""
+        if self.is_running:
+            return
+            
+        self.is_running = True
+        self._tasks = [
+            asyncio.create_task(self._backfill_open_interest()),
+            asyncio.create_task(self._funding_loop()),
+            asyncio.create_task(self._ratio_loop())
+        ]
+        self.logger.info(f"📈 파생 지표 수집 시작: {len(self.symbols)}개 심볼")
+    
+    async def stop(self):
+        """백그라운드 수집 종료"""
+        self.is_running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+    
+    async def _staggered(self, symbols: List[str], fetch: Callable[[str], Awaitable[None]],
+                         window: float):
+        """심볼별 요청을 window초에 나눠 실행 (한 번에 몰리지 않도록)"""
+        spacing = window / max(len(symbols), 1)
+        for symbol in symbols:
+            if not self.is_running:
+                return
+                
+            try:
+                self.stats['requests'] += 1
+                await fetch(symbol)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats['failed'] += 1
+                self.logger.warning(f"⚠️ {symbol} 파생 지표 조회 실패: {str(e)}")
+            await asyncio.sleep(spacing)
+    
+    async def _backfill_open_interest(self):
+        """미결제약정 이력 1회 적재 (이후는 티커 스냅샷으로 갱신)"""
+        async def fetch(symbol: str):
+            rows = await self.api.get_open_interest(symbol, self.oi_interval, self.history_limit)
+            self._merge(symbol, 'open_interest', rows, 'timestamp', lambda row: float(row['openInterest']))
+            
+        await self._staggered(list(self.symbols), fetch, 30.0)
+    
+    async def _funding_loop(self):
+        """펀딩 정산 직후 심볼별 확정 펀딩비 조회 (최초 1회는 이력 적재)"""
+        next_fetch: Dict[str, int] = {}
+        loaded = set()
+        
+        async def fetch(symbol: str):
+            # 실패하면 1분 뒤 재시도
+            next_fetch[symbol] = self.api.clock.now_ms() + 60_000
+            limit = 1 if symbol in loaded else self.history_limit
+            rows = await self.api.get_funding_history(symbol, limit)
+            loaded.add(symbol)
+            self._merge(symbol, 'funding_rate', rows, 'fundingRateTimestamp',
+                        lambda row: float(row['fundingRate']))
+                        
+            # 다음 정산 시각은 티커 값 우선, 없으면 마지막 정산 + 8시간
+            last = self.series[symbol]['funding_rate'].last_timestamp()
+            settle_at = self.next_funding_time.get(symbol)
+            if settle_at is None or (last is not None and settle_at <= last):
+                settle_at = (last or self.api.clock.now_ms()) + FUNDING_INTERVAL_MS
+            next_fetch[symbol] = settle_at + self.funding_settle_delay_ms
+            
+        while self.is_running:
+            now_ms = self.api.clock.now_ms()
+            due = [symbol for symbol in self.symbols if next_fetch.get(symbol, 0) <= now_ms]
+            if due:
+                await self._staggered(due, fetch, 30.0)
+                
+            # 새로 추가된 심볼도 잡히도록 최대 5분 간격으로 확인
+            pending = [next_fetch.get(symbol, 0) for symbol in self.symbols]
+            wait_ms = min(pending, default=0) - self.api.clock.now_ms()
+            await asyncio.sleep(min(max(wait_ms / 1000, 1.0), 300.0))
+    
+    async def _ratio_loop(self):
+        """집계 구간마다 심볼별 롱/숏 비율 조회 (최초 1회는 이력 적재)"""
+        period_ms = PERIOD_MS[self.ratio_period]
+        limit = self.history_limit
+        
+        async def fetch(symbol: str):
+            rows = await self.api.get_long_short_ratio(symbol, self.ratio_period, limit)
+            self._merge(symbol, 'long_short_ratio', rows, 'timestamp',
+                        lambda row: float(row['buyRatio']) / max(float(row['sellRatio']), 1e-12))
+                        
+        while self.is_running:
+            # 구간 전반부에 나눠 조회
+            await self._staggered(list(self.symbols), fetch, period_ms / 2000)
+            limit = 1
+            
+            # 다음 구간이 집계될 때까지 대기
+            now_ms = self.api.clock.now_ms()
+            next_bucket = now_ms // period_ms * period_ms + period_ms
+            await asyncio.sleep((next_bucket - now_ms) / 1000 + 5.0)
+    
+    def _merge(self, symbol: str, field: str, rows: List[Dict], time_key: str,
+               parse: Callable[[Dict], float]):
+        """응답 목록(최신순)을 시계열에 병합"""
+        if not rows or symbol not in self.series:
+            return
+            
+        rows = rows[::-1]
+        timestamps = np.array([int(row[time_key]) for row in rows], dtype=np.int64)
+        values = np.array([parse(row) for row in rows], dtype=np.float64)
+        self.series[symbol][field].merge(timestamps, values)
+    
+    def get_arrays(self, symbol: str, field: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """지표 원본 시계열 (시각, 값)"""
+        buffers = self.series.get(symbol)
+        if buffers is None:
+            return None
+        return buffers[field].arrays()
+    
+    def align(self, symbol: str, timestamps: np.ndarray, interval_ms: int) -> Optional[Dict[str, np.ndarray]]:
+        """캔들 시각에 맞춘 지표 컬럼 (관측 없는 구간은 NaN)"""
+        buffers = self.series.get(symbol)
+        if buffers is None:
+            return None
+            
+        return {field: buffer.align(timestamps, interval_ms) for field, buffer in buffers.items()}
+    
+    def get_status(self) -> Dict[str, Any]:
+        """상태 반환"""
+        return {
+            'running': self.is_running,
+            **self.stats,
+            'series': {
+                symbol: {field: len(buffer) for field, buffer in buffers.items()}
+                for symbol, buffers in self.series.items()
+            }
+        }
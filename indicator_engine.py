@@ -228,6 +228,15 @@ class VolumeIndicator(BaseIndicator):
         else:
             signal_type, strength = 'NEUTRAL', 0.1
         
+        # 체결 테이프 주문 흐름이 있으면 공격적 매수/매도 우위로 확인
+        flow_ratio = self._flow_ratio(df)
+        if flow_ratio is not None and signal_type != 'NEUTRAL':
+            direction = 1 if signal_type == 'BUY' else -1
+            if flow_ratio * direction < 0:  # 가격 방향과 체결 우위가 반대면 약화
+                strength *= 0.5
+            else:
+                strength = min(1.0, strength * (1 + abs(flow_ratio)))
+        
         return IndicatorResult(
             name=self.name,
             value=volume_ratio,
@@ -236,6 +245,22 @@ class VolumeIndicator(BaseIndicator):
             timeframe=kwargs.get('timeframe', '1'),
             timestamp=int(df.iloc[-1]['timestamp'])
         )
+    
+    @staticmethod
+    def _flow_ratio(df: pd.DataFrame) -> Optional[float]:
+        """마지막 캔들의 체결 델타 비율 (-1 매도 우위 ~ +1 매수 우위, 주문 흐름 없으면 None)"""
+        order_flow = df.attrs.get('order_flow')
+        if order_flow is None or len(order_flow['timestamp']) == 0:
+            return None
+        
+        # 같은 캔들의 주문 흐름만 사용 (스트림 시작 전 캔들 등)
+        if int(order_flow['timestamp'][-1]) != int(df.iloc[-1]['timestamp']):
+            return None
+        
+        total = order_flow['buy_volume'][-1] + order_flow['sell_volume'][-1]
+        if total <= 0:
+            return None
+        return float(order_flow['delta'][-1] / total)
 
 class MovingAverageIndicator(BaseIndicator):
     """이동평균 지표"""
@@ -308,6 +333,10 @@ class IndicatorEngine:
         # 지표 결과 저장소
         self.indicator_results: Dict[str, Dict[str, List[IndicatorResult]]] = {}
         
+        # (심볼, 시간대)별 마지막 계산 입력 (같으면 이전 결과 재사용)
+        self._input_keys: Dict[Tuple[str, str], Tuple] = {}
+        self.calc_stats = {'calculated': 0, 'reused': 0}
+        
     def _initialize_indicators(self):
         """지표 인스턴스들 초기화"""
         # RSI 지표들
@@ -347,6 +376,14 @@ class IndicatorEngine:
             if df is None or df.empty:
                 continue
             
+            # 마감 시에만 갱신되는 시간대는 다음 마감까지 입력이 같으므로 재계산 생략
+            input_key = self._input_key(df)
+            previous = self.indicator_results.get(symbol, {}).get(timeframe)
+            if previous is not None and self._input_keys.get((symbol, timeframe)) == input_key:
+                results[timeframe] = previous
+                self.calc_stats['reused'] += 1
+                continue
+            
             timeframe_results = []
             
             # 각 지표별 계산
@@ -359,9 +396,31 @@ class IndicatorEngine:
                     self.logger.error(f"❌ {symbol} {timeframe} {indicator.name} 계산 실패: {str(e)}")
             
             results[timeframe] = timeframe_results
+            self._input_keys[(symbol, timeframe)] = input_key
+            self.calc_stats['calculated'] += 1
         
         return results
     
+    @staticmethod
+    def _input_key(df: pd.DataFrame) -> Tuple:
+        """지표 입력 식별값 (캔들 버퍼 버전, 캔들 수, 마지막 캔들 시각/종가/거래량, 주문 흐름 델타)"""
+        order_flow = df.attrs.get('order_flow')
+        flow_delta = float(order_flow['delta'][-1]) if order_flow is not None and len(order_flow['delta']) else None
+        return (
+            df.attrs.get('version'),
+            len(df),
+            int(df['timestamp'].iat[-1]),
+            float(df['close'].iat[-1]),
+            float(df['volume'].iat[-1]),
+            flow_delta
+        )
+    
+    def remove_symbol(self, symbol: str):
+        """제외된 심볼의 지표 결과 정리"""
+        self.indicator_results.pop(symbol, None)
+        for key in [key for key in self._input_keys if key[0] == symbol]:
+            del self._input_keys[key]
+    
     def update_indicators(self, symbol: str, results: Dict[str, List[IndicatorResult]]):
         """지표 결과 업데이트"""
         self.indicator_results[symbol] = results
@@ -1,6 +1,7 @@
 # main.py - 메인 실행 파일
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 import traceback
 from typing import Dict, List, Optional
@@ -11,6 +12,7 @@ from indicator_engine import IndicatorEngine
 from signal_generator import SignalGenerator
 from telegram_bot import TelegramBot
 from position_manager import PositionManager
+from sharding import ShardPool
 from utils.logger import setup_logger
 
 class TradingBotManager:
@@ -27,6 +29,18 @@ class TradingBotManager:
         self.telegram_bot = TelegramBot(self.config)
         self.position_manager = PositionManager(self.config)
         
+        # 포지션 매니저는 데이터 수집기의 API 세션을 공유
+        self.position_manager.set_api(self.data_collector.api)
+        
+        # 신호 생성기는 API 클라이언트의 심볼 규격 캐시로 가격/수량 반올림
+        self.signal_generator.set_instrument_provider(self.data_collector.api)
+        
+        # 심볼 샤딩 (활성화 시 수집/지표 계산은 워커 프로세스, 여기서는 유니버스/신호/포지션만)
+        self.shards = ShardPool(
+            self.config, self.config.SHARD_WORKERS, self.config.SHARD_REPLY_TIMEOUT
+        ) if self.config.SHARD_WORKERS > 0 else None
+        self.shard_stale = set()
+        
         # 상태 관리
         self.is_running = False
         self.last_signal_time = {}
@@ -37,14 +51,40 @@ class TradingBotManager:
         try:
             self.logger.info("🚀 트레이딩 봇 초기화 시작...")
             
-            # API 연결 테스트
+            # 장기 HTTP 세션 생성 후 API 연결 테스트
+            await self.data_collector.open_session()
             await self.data_collector.test_connection()
             await self.telegram_bot.initialize()
             await self.position_manager.initialize()
             
+            if self.shards:
+                # 티커/심볼 규격만 직접 수집, 캔들/스트림은 워커별 초기 수집 완료까지 대기
+                await asyncio.gather(self.data_collector.refresh_tickers(), self.data_collector.load_instruments())
+                await self.shards.start(self.data_collector.symbols)
+                
+                self.logger.info("✅ 초기화 완료!")
+                await self.telegram_bot.send_startup_message()
+                return
+            
             # 초기 데이터 수집
             await self.data_collector.fetch_initial_data()
             
+            # 파생 지표 백그라운드 수집 (활성화된 경우)
+            if self.config.DERIVATIVES_ENABLED:
+                await self.data_collector.derivatives.start()
+            
+            # 실시간 캔들 스트림 (활성화된 경우)
+            if self.config.WS_ENABLED:
+                await self.data_collector.start_streaming()
+            
+            # 호가창 스트림 (활성화된 경우)
+            if self.config.ORDERBOOK_ENABLED:
+                await self.data_collector.start_order_books()
+            
+            # 체결 테이프 스트림 (활성화된 경우)
+            if self.config.TRADES_ENABLED:
+                await self.data_collector.start_trade_tape()
+            
             self.logger.info("✅ 초기화 완료!")
             await self.telegram_bot.send_startup_message()
             
@@ -60,28 +100,40 @@ class TradingBotManager:
         while self.is_running:
             try:
                 loop_start = datetime.now()
+                stage_times = {}
                 
                 # 1. 실시간 데이터 업데이트
+                stage_start = time.perf_counter()
                 await self.update_market_data()
+                stage_times['data'] = time.perf_counter() - stage_start
                 
                 # 2. 기술적 지표 계산  
+                stage_start = time.perf_counter()
                 await self.calculate_indicators()
+                stage_times['indicators'] = time.perf_counter() - stage_start
                 
                 # 3. 신호 생성 및 전송
+                stage_start = time.perf_counter()
                 await self.generate_and_send_signals()
+                stage_times['signals'] = time.perf_counter() - stage_start
                 
                 # 4. 포지션 관리 (자동 관리 모드인 경우)
+                stage_start = time.perf_counter()
                 await self.manage_positions()
+                stage_times['positions'] = time.perf_counter() - stage_start
                 
                 # 5. 시스템 상태 체크
+                stage_start = time.perf_counter()
                 await self.system_health_check()
+                stage_times['health'] = time.perf_counter() - stage_start
                 
-                # 실행 시간 로깅
+                # 실행 시간 로깅 (단계별 내역 포함, API 상세는 get_data_status의 endpoint_metrics)
                 execution_time = (datetime.now() - loop_start).total_seconds()
-                self.logger.debug(f"⏱️ 루프 실행 시간: {execution_time:.2f}초")
+                breakdown = ', '.join(f"{name} {seconds:.2f}" for name, seconds in stage_times.items())
+                self.logger.debug(f"⏱️ 루프 실행 시간: {execution_time:.2f}초 ({breakdown})")
                 
-                # 다음 실행까지 대기 (1분 주기)
-                await asyncio.sleep(max(0, 60 - execution_time))
+                # 다음 1분봉 마감 직후까지 대기 (1분 주기)
+                await asyncio.sleep(self.data_collector.scheduler.seconds_until_next_close())
                 
             except Exception as e:
                 self.logger.error(f"❌ 메인 루프 오류: {str(e)}")
@@ -92,24 +144,84 @@ class TradingBotManager:
     async def update_market_data(self):
         """시장 데이터 업데이트"""
         try:
-            # TOP 10 코인 데이터 수집
-            for symbol in self.config.SYMBOLS:
-                await self.data_collector.update_symbol_data(symbol)
+            if self.shards:
+                await self.update_sharded_data()
+                return
+            
+            # 전체 심볼/시간대 동시 수집 (실패 심볼은 건너뜀, 초기 수집 중인 추가 심볼 제외)
+            symbols = self.data_collector.active_symbols()
+            status = await self.data_collector.update_all_symbols(symbols)
+            
+            if not any(status.values()):
+                # 마지막 정상 데이터가 있으면 stale로 계속 진행 (거래소 장애 시 점진적 저하)
+                if not any(self.data_collector.get_market_data(symbol) for symbol in symbols):
+                    raise Exception("모든 심볼 데이터 업데이트 실패")
+                self.logger.warning("⚠️ 모든 심볼 업데이트 실패, 마지막 정상 데이터 사용")
                 
         except Exception as e:
             self.logger.error(f"데이터 업데이트 실패: {str(e)}")
             raise
     
+    async def update_sharded_data(self):
+        """샤드 워커 1주기 실행 (유니버스 변경 반영 후 수집 + 지표 계산, 변경된 지표 결과만 병합)"""
+        await asyncio.gather(self.data_collector.refresh_tickers(), self.data_collector.refresh_instruments())
+        
+        # 유니버스 재구성은 부모가 담당, 추가/제외 심볼은 워커 간 재배치로 반영
+        universe = self.data_collector.universe
+        if universe and not self.data_collector.tickers_stale and \
+           universe.is_due(self.config.UNIVERSE_REFRESH_INTERVAL):
+            await self.data_collector.refresh_universe(hot_add=False)
+        await self.shards.rebalance(self.data_collector.symbols)
+        
+        status, self.shard_stale, indicators = await self.shards.run_cycle()
+        for symbol, timeframes in indicators.items():
+            self.indicator_engine.indicator_results.setdefault(symbol, {}).update(timeframes)
+        
+        if status and not any(status.values()):
+            if not self.indicator_engine.indicator_results:
+                raise Exception("모든 심볼 데이터 업데이트 실패")
+            self.logger.warning("⚠️ 모든 심볼 업데이트 실패, 마지막 정상 데이터 사용")
+    
+    def signal_symbols(self) -> List[str]:
+        """신호 생성 대상 심볼 (초기 수집 중/stale 심볼 제외)"""
+        if self.shards:
+            # 워커에서 지표 결과가 한 번이라도 온 심볼만 (추가 직후 초기 수집 중인 심볼 제외)
+            return [
+                symbol for symbol in self.data_collector.symbols
+                if symbol in self.indicator_engine.indicator_results and symbol not in self.shard_stale
+            ]
+        
+        return [
+            symbol for symbol in self.data_collector.active_symbols()
+            if not self.data_collector.is_stale(symbol)
+        ]
+    
     async def calculate_indicators(self):
         """기술적 지표 계산"""
         try:
-            for symbol in self.config.SYMBOLS:
-                market_data = self.data_collector.get_symbol_data(symbol)
+            # 유니버스에서 제외된 심볼 결과 정리
+            for symbol in list(self.indicator_engine.indicator_results):
+                if symbol not in self.data_collector.symbols:
+                    self.indicator_engine.remove_symbol(symbol)
+            
+            # 샤딩 시 지표는 워커가 계산해 update_sharded_data에서 병합됨
+            if self.shards:
+                return
+            
+            for symbol in self.data_collector.active_symbols():
+                # 갱신 실패 중인 심볼은 데이터가 그대로이므로 재계산 생략
+                if self.data_collector.is_stale(symbol):
+                    continue
+                
+                market_data = self.data_collector.get_market_data(symbol)
                 if market_data:
                     indicators = await self.indicator_engine.calculate_all_indicators(
                         symbol, market_data
                     )
                     self.indicator_engine.update_indicators(symbol, indicators)
+                
+                # 심볼이 많아도 스트림/네트워크 처리가 밀리지 않도록 이벤트 루프에 양보
+                await asyncio.sleep(0)
                     
         except Exception as e:
             self.logger.error(f"지표 계산 실패: {str(e)}")
@@ -118,7 +230,8 @@ class TradingBotManager:
     async def generate_and_send_signals(self):
         """신호 생성 및 전송"""
         try:
-            for symbol in self.config.SYMBOLS:
+            # 오래된(stale) 데이터로는 신규 신호를 내지 않음
+            for symbol in self.signal_symbols():
                 # 중복 신호 방지 (최소 15분 간격)
                 if self.should_skip_signal(symbol):
                     continue
@@ -161,7 +274,9 @@ class TradingBotManager:
         """시스템 상태 점검"""
         try:
             # API 연결 상태 체크
-            if not await self.data_collector.health_check():
+            # 샤딩 시 캔들은 워커가 수집하므로 워커가 보고한 신선도로 판단
+            stale_series = self.shards.stale_series if self.shards else None
+            if not await self.data_collector.health_check(stale_series):
                 self.logger.warning("⚠️ 데이터 수집 API 연결 불안정")
                 await self.telegram_bot.send_warning("데이터 수집 API 연결이 불안정합니다.")
             
@@ -178,6 +293,8 @@ class TradingBotManager:
         
         try:
             await self.telegram_bot.send_shutdown_message()
+            if self.shards:
+                await self.shards.stop()
             await self.data_collector.close()
             await self.telegram_bot.close()
             self.logger.info("✅ 정상 종료 완료")
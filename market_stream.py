@@ -0,0 +1,229 @@
+# market_stream.py - 바이비트 퍼블릭 웹소켓 스트림 모듈
+import asyncio
+import aiohttp
+import inspect
+import json
+import logging
+import time
+from typing import Dict, List, Callable, Any, Optional, Set
+
+# 바이비트 v5 퍼블릭 스트림 주소 (USDT 무기한)
+MAINNET_PUBLIC_URL = "wss://stream.bybit.com/v5/public/linear"
+TESTNET_PUBLIC_URL = "wss://stream-testnet.bybit.com/v5/public/linear"
+
+class BybitPublicStream:
+    """바이비트 v5 퍼블릭 웹소켓 클라이언트 (자동 재연결)"""
+    
+    # 구독 요청 1회당 최대 토픽 수
+    MAX_ARGS_PER_REQUEST = 10
+    
+    def __init__(self, url: str, ping_interval: float = 20.0,
+                 reconnect_delay: float = 1.0, max_reconnect_delay: float = 30.0):
+        self.url = url
+        self.ping_interval = ping_interval
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.logger = logging.getLogger(__name__)
+        
+        # 구독 및 핸들러
+        self.topics: Set[str] = set()
+        self.handlers: Dict[str, Callable] = {}  # 토픽 접두사 -> 핸들러
+        self.reconnect_callbacks: List[Callable] = []
+        
+        # 연결 상태
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self.is_running = False
+        self.connected = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._callback_task: Optional[asyncio.Task] = None
+        self._last_received = 0.0  # monotonic, pong 포함 마지막 수신 시각
+        
+        # 통계
+        self.stats = {
+            'messages': 0,
+            'connects': 0,
+            'reconnects': 0,
+            'stale_disconnects': 0,
+            'last_message_at': None
+        }
+    
+    def add_handler(self, prefix: str, handler: Callable):
+        """토픽 접두사별 메시지 핸들러 등록 (예: 'kline')"""
+        self.handlers[prefix] = handler
+    
+    def add_reconnect_callback(self, callback: Callable):
+        """재연결 직후 호출할 콜백 등록 (갭 보충 등)"""
+        self.reconnect_callbacks.append(callback)
+    
+    @property
+    def is_connected(self) -> bool:
+        """연결 여부"""
+        return self.ws is not None and not self.ws.closed
+    
+    async def subscribe(self, topics: List[str]):
+        """토픽 구독 (연결 전이면 연결 시 일괄 구독)"""
+        new_topics = [topic for topic in topics if topic not in self.topics]
+        self.topics.update(new_topics)
+        
+        if self.is_connected and new_topics:
+            await self._send_op('subscribe', new_topics)
+    
+    async def unsubscribe(self, topics: List[str]):
+        """토픽 구독 해제"""
+        removed = [topic for topic in topics if topic in self.topics]
+        self.topics.difference_update(removed)
+        
+        if self.is_connected and removed:
+            await self._send_op('unsubscribe', removed)
+    
+    async def start(self):
+        """스트림 시작"""
+        if self.is_running:
+            return
+            
+        self.is_running = True
+        self.session = aiohttp.ClientSession()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """스트림 종료"""
+        self.is_running = False
+        
+        if self.ws and not self.ws.closed:
+            await self.ws.close()
+            
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            
+        if self.session:
+            await self.session.close()
+            self.session = None
+            
+        self.connected.clear()
+    
+    async def _send_op(self, op: str, topics: List[str]):
+        """구독/해제 요청 전송 (요청당 토픽 수 제한 준수)"""
+        for i in range(0, len(topics), self.MAX_ARGS_PER_REQUEST):
+            await self.ws.send_json({
+                'op': op,
+                'args': topics[i:i + self.MAX_ARGS_PER_REQUEST]
+            })
+    
+    async def _run(self):
+        """연결 유지 루프 (끊기면 지수 백오프로 재연결)"""
+        delay = self.reconnect_delay
+        
+        while self.is_running:
+            ping_task = None
+            try:
+                async with self.session.ws_connect(self.url, autoping=True) as ws:
+                    self.ws = ws
+                    self._last_received = time.monotonic()
+                    is_reconnect = self.stats['connects'] > 0
+                    self.stats['connects'] += 1
+                    
+                    if self.topics:
+                        await self._send_op('subscribe', sorted(self.topics))
+                        
+                    self.connected.set()
+                    delay = self.reconnect_delay
+                    self.logger.info(f"📡 웹소켓 연결 완료 ({len(self.topics)}개 토픽)")
+                    
+                    ping_task = asyncio.create_task(self._ping_loop(ws))
+                    
+                    # 재연결 시 끊긴 구간 보충
+                    if is_reconnect:
+                        self.stats['reconnects'] += 1
+                        self._callback_task = asyncio.create_task(self._run_reconnect_callbacks())
+                        
+                    async for msg in ws:
+                        if msg.type == aiohttp.WSMsgType.TEXT:
+                            self._last_received = time.monotonic()
+                            await self._dispatch(msg.data)
+                        elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                            break
+                            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"⚠️ 웹소켓 연결 오류: {str(e)}")
+            finally:
+                if ping_task:
+                    ping_task.cancel()
+                self.ws = None
+                self.connected.clear()
+                
+            if self.is_running:
+                self.logger.info(f"🔄 웹소켓 재연결 대기 {delay:.1f}초")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+    
+    async def _ping_loop(self, ws: aiohttp.ClientWebSocketResponse):
+        """바이비트 하트비트 (20초마다 ping, 두 주기 동안 pong도 없으면 끊고 재연결)"""
+        while not ws.closed:
+            await asyncio.sleep(self.ping_interval)
+            if time.monotonic() - self._last_received > self.ping_interval * 2:
+                self.stats['stale_disconnects'] += 1
+                self.logger.warning("⚠️ 웹소켓 응답 없음, 재연결")
+                await ws.close()
+                return
+                
+            try:
+                await ws.send_json({'op': 'ping'})
+            except Exception:
+                return
+    
+    async def _run_reconnect_callbacks(self):
+        """재연결 콜백 실행"""
+        for callback in self.reconnect_callbacks:
+            try:
+                result = callback()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self.logger.error(f"❌ 재연결 콜백 실패: {str(e)}")
+    
+    async def _dispatch(self, raw: str):
+        """수신 메시지를 토픽 핸들러로 전달"""
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            return
+            
+        # 구독 응답 / pong
+        if 'op' in message:
+            if message.get('op') == 'subscribe' and not message.get('success', True):
+                self.logger.error(f"❌ 구독 실패: {message.get('ret_msg')}")
+            return
+            
+        topic = message.get('topic')
+        if not topic:
+            return
+            
+        self.stats['messages'] += 1
+        self.stats['last_message_at'] = time.time()
+        
+        handler = self.handlers.get(topic.split('.', 1)[0])
+        if handler is None:
+            return
+            
+        try:
+            result = handler(message)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self.logger.error(f"❌ {topic} 메시지 처리 실패: {str(e)}")
+    
+    def get_status(self) -> Dict[str, Any]:
+        """스트림 상태 반환"""
+        return {
+            'connected': self.is_connected,
+            'topics': len(self.topics),
+            **self.stats
+        }
@@ -0,0 +1,196 @@
+# order_book.py - 호가창(L2) 모듈
+import time
+from bisect import bisect_left
+from typing import Dict, List, Any, Optional, Tuple
+
+class BookSide:
+    """호가 한쪽 (가격 정렬 리스트 + 가격별 잔량, 최우선 호가가 0번)"""
+    
+    def __init__(self, descending: bool):
+        # 매수는 가격을 음수로 저장해 오름차순 정렬 하나로 처리
+        self._sign = -1.0 if descending else 1.0
+        self._keys: List[float] = []
+        self.sizes: Dict[float, float] = {}
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def clear(self):
+        self._keys.clear()
+        self.sizes.clear()
+    
+    def update(self, price: float, size: float):
+        """가격 레벨 갱신 (잔량 0이면 삭제) - 위치 탐색 O(log n), 리스트 삽입/삭제는 O(n) memmove (깊이 최대 500레벨)"""
+        if size == 0.0:
+            if self.sizes.pop(price, None) is not None:
+                key = price * self._sign
+                del self._keys[bisect_left(self._keys, key)]
+            return
+            
+        if price not in self.sizes:
+            key = price * self._sign
+            self._keys.insert(bisect_left(self._keys, key), key)
+        self.sizes[price] = size
+    
+    def levels(self, n: int) -> List[Tuple[float, float]]:
+        """상위 n개 레벨 [(가격, 잔량)]"""
+        return [(key * self._sign, self.sizes[key * self._sign]) for key in self._keys[:n]]
+
+class OrderBook:
+    """심볼별 L2 호가창 (스냅샷 + 델타, 업데이트 ID 연속성 검증)"""
+    
+    def __init__(self, symbol: str, top_levels: int = 10):
+        self.symbol = symbol
+        self.top_levels = top_levels
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        
+        # 시퀀스 상태 (스냅샷 수신 전이거나 갭 발생 시 False)
+        self.update_id: Optional[int] = None
+        self.seq: Optional[int] = None
+        self.synced = False
+        self.updated_at = 0.0
+        
+        # 갱신마다 계산해두는 상위 호가 요약 (조회 O(1))
+        self._summary: Dict[str, Any] = {}
+        
+        # 통계
+        self.stats = {'snapshots': 0, 'deltas': 0, 'gaps': 0}
+    
+    def apply_snapshot(self, data: Dict[str, Any]):
+        """스냅샷으로 호가창 초기화"""
+        self.bids.clear()
+        self.asks.clear()
+        self._apply_levels(data)
+        
+        self.update_id = int(data['u'])
+        self.seq = data.get('seq')
+        self.synced = True
+        self.stats['snapshots'] += 1
+        self._refresh()
+    
+    def apply_delta(self, data: Dict[str, Any]) -> bool:
+        """델타 적용 (업데이트 ID가 연속이 아니면 적용하지 않고 False)"""
+        update_id = int(data['u'])
+        
+        # 서비스 재시작 시 u=1로 전체 호가가 다시 옴
+        if update_id == 1:
+            self.apply_snapshot(data)
+            return True
+            
+        if not self.synced or update_id != self.update_id + 1:
+            if self.synced:
+                self.stats['gaps'] += 1
+            self.synced = False
+            return False
+            
+        self._apply_levels(data)
+        self.update_id = update_id
+        self.seq = data.get('seq')
+        self.stats['deltas'] += 1
+        self._refresh()
+        return True
+    
+    def _apply_levels(self, data: Dict[str, Any]):
+        """메시지의 매수/매도 레벨 반영"""
+        for price, size in data.get('b', []):
+            self.bids.update(float(price), float(size))
+        for price, size in data.get('a', []):
+            self.asks.update(float(price), float(size))
+    
+    def _refresh(self):
+        """상위 호가 요약 재계산 (상위 N개 레벨만 사용)"""
+        self.updated_at = time.time()
+        bids = self.bids.levels(self.top_levels)
+        asks = self.asks.levels(self.top_levels)
+        
+        if not bids or not asks:
+            self._summary = {'bids': bids, 'asks': asks}
+            return
+            
+        best_bid, bid_size = bids[0]
+        best_ask, ask_size = asks[0]
+        mid = (best_bid + best_ask) / 2
+        bid_depth = sum(size for _, size in bids)
+        ask_depth = sum(size for _, size in asks)
+        
+        self._summary = {
+            'bids': bids,
+            'asks': asks,
+            'best_bid': best_bid,
+            'best_ask': best_ask,
+            'mid': mid,
+            'spread': best_ask - best_bid,
+            'spread_bps': (best_ask - best_bid) / mid * 10000,
+            # 최우선 잔량 가중 가격 (잔량이 많은 쪽에서 먼 쪽으로 기움)
+            'microprice': (best_bid * ask_size + best_ask * bid_size) / (bid_size + ask_size),
+            'bid_depth': bid_depth,
+            'ask_depth': ask_depth,
+            # 상위 N개 레벨 잔량 불균형 (-1 매도 우위 ~ +1 매수 우위)
+            'imbalance': (bid_depth - ask_depth) / (bid_depth + ask_depth)
+        }
+    
+    def top(self, n: Optional[int] = None) -> Dict[str, List[Tuple[float, float]]]:
+        """상위 호가 (기본 top_levels개)"""
+        if n is None or n == self.top_levels:
+            return {'bids': self._summary.get('bids', []), 'asks': self._summary.get('asks', [])}
+        return {'bids': self.bids.levels(n), 'asks': self.asks.levels(n)}
+    
+    @property
+    def best_bid(self) -> Optional[float]:
+        return self._summary.get('best_bid')
+    
+    @property
+    def best_ask(self) -> Optional[float]:
+        return self._summary.get('best_ask')
+    
+    @property
+    def spread(self) -> Optional[float]:
+        return self._summary.get('spread')
+    
+    @property
+    def microprice(self) -> Optional[float]:
+        return self._summary.get('microprice')
+    
+    @property
+    def imbalance(self) -> Optional[float]:
+        return self._summary.get('imbalance')
+    
+    def estimate_fill(self, side: str, quantity: float) -> Optional[Dict[str, float]]:
+        """시장가 체결 시 평균가/슬리피지 추정 (side: 'Buy'는 매도호가 소진)"""
+        if not self.synced or 'mid' not in self._summary:
+            return None
+            
+        book = self.asks if side == 'Buy' else self.bids
+        remaining = quantity
+        cost = 0.0
+        for price, size in book.levels(len(book)):
+            filled = min(size, remaining)
+            cost += filled * price
+            remaining -= filled
+            if remaining <= 0:
+                break
+                
+        filled = quantity - remaining
+        if filled <= 0:
+            return None
+            
+        avg_price = cost / filled
+        mid = self._summary['mid']
+        return {
+            'avg_price': avg_price,
+            'filled': filled,
+            # 호가창 깊이를 넘는 수량이면 filled < quantity
+            'complete': remaining <= 0,
+            'slippage_bps': abs(avg_price - mid) / mid * 10000
+        }
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """호가 요약 반환 (레벨 목록 제외)"""
+        summary = {key: value for key, value in self._summary.items() if key not in ('bids', 'asks')}
+        summary.update({
+            'synced': self.synced,
+            'levels': (len(self.bids), len(self.asks)),
+            'age': round(time.time() - self.updated_at, 3) if self.updated_at else None
+        })
+        return summary
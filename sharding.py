@@ -0,0 +1,385 @@
+# sharding.py - 심볼 샤딩 멀티프로세스 모듈 (수집 + 지표 계산을 워커 프로세스로 분산)
+import asyncio
+import copy
+import logging
+import multiprocessing
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from indicator_engine import IndicatorEngine, IndicatorResult
+
+# 부모 <-> 워커 메시지: (명령, 인자)
+# 부모 -> 워커: ('cycle', None), ('assign', [심볼...]), ('status', None), ('stop', None)
+# 워커 -> 부모: ('ready', 심볼 목록), ('cycle', 결과), ('assign', 심볼 목록), ('status', 상태), ('error', 메시지)
+
+# 지표 결과 1개 = (name, value, signal, strength, timeframe, timestamp)
+PackedResult = Tuple[str, float, str, float, str, int]
+
+def pack_results(results: List[IndicatorResult]) -> List[PackedResult]:
+    """지표 결과를 튜플 목록으로 압축 (프로세스 간 전송용)"""
+    return [
+        (result.name, float(result.value), result.signal, float(result.strength),
+         result.timeframe, int(result.timestamp))
+        for result in results
+    ]
+
+def unpack_results(packed: List[PackedResult]) -> List[IndicatorResult]:
+    """튜플 목록을 지표 결과로 복원"""
+    return [IndicatorResult(*values) for values in packed]
+
+def partition(symbols: List[str], workers: int) -> List[List[str]]:
+    """심볼을 워커 수만큼 라운드 로빈 분할"""
+    shards: List[List[str]] = [[] for _ in range(workers)]
+    for i, symbol in enumerate(symbols):
+        shards[i % workers].append(symbol)
+    return shards
+
+def shard_config(config, symbols: List[str], workers: int):
+    """워커용 설정 (담당 심볼, 속도 제한 분할, 부모 전용 기능 비활성화)"""
+    worker_config = copy.copy(config)
+    worker_config.SYMBOLS = list(symbols)
+    
+    # 같은 IP를 공유하므로 퍼블릭 요청 한도를 부모 포함 (워커 수 + 1)로 나눔
+    worker_config.API_RATE_LIMIT = max(config.API_RATE_LIMIT // (workers + 1), 1)
+    worker_config.API_RATE_BURST = max(config.API_RATE_BURST // (workers + 1), 1)
+    
+    # 유니버스 순위는 부모가 관리, 메타데이터 캐시 파일은 부모만 기록
+    worker_config.UNIVERSE_ENABLED = False
+    worker_config.METADATA_CACHE_FILE = ''
+    return worker_config
+
+class ShardWorker:
+    """워커 프로세스 본체 (담당 심볼 수집 + 지표 계산, 변경된 결과만 부모로 전송)"""
+    
+    def __init__(self, shard_id: int, config):
+        from data_collector import DataCollector
+        
+        self.shard_id = shard_id
+        self.config = config
+        self.logger = logging.getLogger(f"{__name__}.shard{shard_id}")
+        self.data_collector = DataCollector(config)
+        self.indicator_engine = IndicatorEngine(config)
+        
+        # 시간대별 마지막 전송 결과 (재사용된 결과는 같은 객체이므로 다시 보내지 않음)
+        self._sent: Dict[Tuple[str, str], List[IndicatorResult]] = {}
+    
+    async def run(self, conn):
+        """명령 처리 루프"""
+        loop = asyncio.get_running_loop()
+        
+        await self.data_collector.open_session()
+        try:
+            await self.data_collector.fetch_initial_data()
+            if self.config.WS_ENABLED:
+                await self.data_collector.start_streaming()
+            if self.config.ORDERBOOK_ENABLED:
+                await self.data_collector.start_order_books()
+            if self.config.TRADES_ENABLED:
+                await self.data_collector.start_trade_tape()
+            if self.config.DERIVATIVES_ENABLED:
+                await self.data_collector.derivatives.start()
+            conn.send(('ready', list(self.data_collector.symbols)))
+            
+            while True:
+                # 수신 대기는 스레드에서 (이벤트 루프는 스트림/백그라운드 수집 계속 처리)
+                command, argument = await loop.run_in_executor(None, conn.recv)
+                if command == 'stop':
+                    break
+                    
+                try:
+                    if command == 'cycle':
+                        reply = await self.run_cycle()
+                    elif command == 'assign':
+                        reply = await self.assign(argument)
+                    elif command == 'status':
+                        reply = self.get_status()
+                    else:
+                        raise ValueError(f"알 수 없는 명령: {command}")
+                    conn.send((command, reply))
+                except Exception as e:
+                    self.logger.error(f"❌ 샤드 {self.shard_id} {command} 처리 실패: {str(e)}")
+                    conn.send(('error', str(e)))
+        finally:
+            await self.data_collector.close()
+    
+    async def run_cycle(self) -> Dict[str, Any]:
+        """데이터 갱신 + 지표 계산 1주기"""
+        symbols = self.data_collector.active_symbols()
+        status = await self.data_collector.update_all_symbols(symbols)
+        
+        stale = []
+        indicators: Dict[str, Dict[str, List[PackedResult]]] = {}
+        for symbol in symbols:
+            if self.data_collector.is_stale(symbol):
+                stale.append(symbol)
+                continue
+                
+            market_data = self.data_collector.get_market_data(symbol)
+            if not market_data:
+                continue
+                
+            results = await self.indicator_engine.calculate_all_indicators(symbol, market_data)
+            self.indicator_engine.update_indicators(symbol, results)
+            
+            changed = {}
+            for timeframe, timeframe_results in results.items():
+                if self._sent.get((symbol, timeframe)) is not timeframe_results:
+                    changed[timeframe] = pack_results(timeframe_results)
+                    self._sent[(symbol, timeframe)] = timeframe_results
+            if changed:
+                indicators[symbol] = changed
+                
+            await asyncio.sleep(0)
+            
+        return {
+            'status': status,
+            'stale': stale,
+            'stale_series': self.data_collector.get_stale_series(),
+            'indicators': indicators
+        }
+    
+    async def assign(self, symbols: List[str]) -> List[str]:
+        """담당 심볼 재지정 (제외 심볼은 캐시 저장 후 정리, 추가 심볼은 백그라운드 초기 수집)"""
+        for symbol in [symbol for symbol in self.data_collector.symbols if symbol not in symbols]:
+            await self.data_collector.remove_symbol(symbol)
+            self.indicator_engine.remove_symbol(symbol)
+            for key in [key for key in self._sent if key[0] == symbol]:
+                del self._sent[key]
+                
+        for symbol in symbols:
+            self.data_collector.add_symbol(symbol)
+        return list(self.data_collector.symbols)
+    
+    def get_status(self) -> Dict[str, Any]:
+        """워커 상태"""
+        return {
+            'symbols': len(self.data_collector.symbols),
+            'active': len(self.data_collector.active_symbols()),
+            'indicator_calc': dict(self.indicator_engine.calc_stats),
+            'rate_limits': {
+                name: limiter.get_status() for name, limiter in self.data_collector.api.rate_limiters.items()
+            }
+        }
+
+def _worker_main(shard_id: int, config, conn):
+    """워커 프로세스 진입점"""
+    from utils.logger import setup_logger
+    setup_logger(f"TradingBot.shard{shard_id}", config.LOG_LEVEL)
+    
+    try:
+        asyncio.run(ShardWorker(shard_id, config).run(conn))
+    except KeyboardInterrupt:
+        pass
+
+class ShardPool:
+    """부모 측 샤드 관리 (워커 프로세스 생성, 주기 실행, 심볼 재배치)"""
+    
+    def __init__(self, config, workers: int, reply_timeout: float = 120.0):
+        self.config = config
+        self.workers = workers
+        self.reply_timeout = reply_timeout
+        self.logger = logging.getLogger(__name__)
+        
+        # spawn: 부모의 이벤트 루프/HTTP 세션을 물려받지 않음
+        self._context = multiprocessing.get_context('spawn')
+        self._processes: List[Optional[multiprocessing.Process]] = [None] * workers
+        self._connections: List[Any] = [None] * workers
+        self._locks = [asyncio.Lock() for _ in range(workers)]
+        
+        # 샤드별 담당 심볼
+        self.assignment: List[List[str]] = [[] for _ in range(workers)]
+        
+        # 마지막 주기의 최근 캔들이 밀린 (심볼, 시간대) 목록 (부모 상태 점검용)
+        self.stale_series: List[Tuple[str, str]] = []
+        
+        # 통계
+        self.stats = {'cycles': 0, 'restarts': 0, 'moved': 0, 'results': 0}
+    
+    async def start(self, symbols: List[str]):
+        """워커 시작 (초기 수집 완료까지 대기)"""
+        self.assignment = partition(list(symbols), self.workers)
+        for shard_id in range(self.workers):
+            self._spawn(shard_id)
+            
+        await asyncio.gather(*(self._wait_ready(shard_id) for shard_id in range(self.workers)))
+        self.logger.info(
+            f"🧩 샤드 워커 {self.workers}개 시작 "
+            f"({', '.join(str(len(symbols)) for symbols in self.assignment)}개 심볼)"
+        )
+    
+    def _spawn(self, shard_id: int):
+        """워커 프로세스 생성"""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(shard_id, shard_config(self.config, self.assignment[shard_id], self.workers), child_conn),
+            name=f"shard-{shard_id}",
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        
+        self._processes[shard_id] = process
+        self._connections[shard_id] = parent_conn
+    
+    async def _receive(self, shard_id: int) -> Tuple[str, Any]:
+        """워커 응답 수신 (시간 초과 시 TimeoutError)"""
+        conn = self._connections[shard_id]
+        
+        def receive():
+            if not conn.poll(self.reply_timeout):
+                raise TimeoutError(f"샤드 {shard_id} 응답 시간 초과")
+            return conn.recv()
+            
+        return await asyncio.get_running_loop().run_in_executor(None, receive)
+    
+    async def _wait_ready(self, shard_id: int):
+        """워커 초기 수집 완료 대기"""
+        command, _ = await self._receive(shard_id)
+        if command != 'ready':
+            raise RuntimeError(f"샤드 {shard_id} 시작 실패")
+    
+    async def _request(self, shard_id: int, command: str, argument: Any = None) -> Any:
+        """명령 전송 후 응답 대기 (샤드별 직렬화, 워커가 죽었으면 재시작 후 예외)"""
+        async with self._locks[shard_id]:
+            try:
+                self._connections[shard_id].send((command, argument))
+                reply_command, reply = await self._receive(shard_id)
+            except (EOFError, OSError, TimeoutError) as e:
+                self.logger.error(f"❌ 샤드 {shard_id} 통신 실패, 재시작: {str(e) or type(e).__name__}")
+                await self._restart(shard_id)
+                raise
+                
+            if reply_command == 'error':
+                raise RuntimeError(f"샤드 {shard_id} {command} 실패: {reply}")
+            return reply
+    
+    async def _restart(self, shard_id: int):
+        """워커 재시작 (담당 심볼은 디스크 캐시에서 델타만 조회)"""
+        process = self._processes[shard_id]
+        if process is not None and process.is_alive():
+            process.terminate()
+        if process is not None:
+            await asyncio.get_running_loop().run_in_executor(None, process.join, 5.0)
+            
+        self.stats['restarts'] += 1
+        self._spawn(shard_id)
+        await self._wait_ready(shard_id)
+    
+    async def run_cycle(self) -> Tuple[Dict[str, bool], Set[str], Dict[str, Dict[str, List[IndicatorResult]]]]:
+        """전 샤드 동시 1주기 실행, (심볼별 갱신 성공, stale 심볼, 변경된 지표 결과) 반환"""
+        replies = await asyncio.gather(
+            *(self._request(shard_id, 'cycle') for shard_id in range(self.workers)),
+            return_exceptions=True
+        )
+        self.stats['cycles'] += 1
+        
+        status: Dict[str, bool] = {}
+        stale: Set[str] = set()
+        stale_series: List[Tuple[str, str]] = []
+        indicators: Dict[str, Dict[str, List[IndicatorResult]]] = {}
+        for shard_id, reply in enumerate(replies):
+            # 실패한 샤드의 심볼은 이번 주기 갱신 실패로 처리 (신선도도 확인 불가로 간주)
+            if isinstance(reply, BaseException):
+                self.logger.error(f"❌ 샤드 {shard_id} 주기 실패: {str(reply) or type(reply).__name__}")
+                status.update({symbol: False for symbol in self.assignment[shard_id]})
+                stale_series.extend(
+                    (symbol, timeframe) for symbol in self.assignment[shard_id]
+                    for timeframe in self.config.TIMEFRAMES
+                )
+                continue
+                
+            status.update(reply['status'])
+            stale.update(reply['stale'])
+            stale_series.extend(tuple(series) for series in reply['stale_series'])
+            for symbol, timeframes in reply['indicators'].items():
+                indicators[symbol] = {
+                    timeframe: unpack_results(packed) for timeframe, packed in timeframes.items()
+                }
+                self.stats['results'] += len(timeframes)
+                
+        self.stale_series = stale_series
+        return status, stale, indicators
+    
+    async def rebalance(self, symbols: List[str]):
+        """심볼 추가/제외 반영 (제외 먼저, 추가는 가장 적은 샤드로, 편차가 2 이상이면 이동)"""
+        target = set(symbols)
+        assignment = [[symbol for symbol in shard if symbol in target] for shard in self.assignment]
+        
+        assigned = {symbol for shard in assignment for symbol in shard}
+        for symbol in symbols:
+            if symbol not in assigned:
+                min(assignment, key=len).append(symbol)
+                
+        # 담당 수 편차를 1 이하로 맞춤 (최근 추가된 심볼부터 이동)
+        moved = []
+        while True:
+            largest = max(assignment, key=len)
+            smallest = min(assignment, key=len)
+            if len(largest) - len(smallest) <= 1:
+                break
+            symbol = largest.pop()
+            smallest.append(symbol)
+            moved.append(symbol)
+            
+        changed = [shard_id for shard_id in range(self.workers) if assignment[shard_id] != self.assignment[shard_id]]
+        if not changed:
+            return
+            
+        # 이동 심볼은 이전 샤드가 캐시를 저장한 뒤 새 샤드가 로드하도록 제외 먼저 적용
+        previous = self.assignment
+        self.assignment = assignment
+        removals = {
+            shard_id: [symbol for symbol in previous[shard_id] if symbol in assignment[shard_id]]
+            for shard_id in changed
+            if not set(previous[shard_id]) <= set(assignment[shard_id])
+        }
+        additions = {
+            shard_id: assignment[shard_id] for shard_id in changed
+            if not set(assignment[shard_id]) <= set(previous[shard_id])
+        }
+        for requests in (removals, additions):
+            replies = await asyncio.gather(
+                *(self._request(shard_id, 'assign', symbols) for shard_id, symbols in requests.items()),
+                return_exceptions=True
+            )
+            for reply in replies:
+                if isinstance(reply, BaseException):
+                    self.logger.error(f"❌ 샤드 재배치 실패: {str(reply) or type(reply).__name__}")
+                    
+        self.stats['moved'] += len(moved)
+        self.logger.info(
+            f"🧩 샤드 재배치: {', '.join(str(len(shard)) for shard in assignment)}개 심볼 "
+            f"(이동 {len(moved)}개)"
+        )
+    
+    async def get_status(self) -> List[Any]:
+        """샤드별 상태"""
+        replies = await asyncio.gather(
+            *(self._request(shard_id, 'status') for shard_id in range(self.workers)),
+            return_exceptions=True
+        )
+        return [
+            {'error': str(reply)} if isinstance(reply, BaseException) else reply
+            for reply in replies
+        ]
+    
+    async def stop(self):
+        """워커 종료"""
+        for shard_id, conn in enumerate(self._connections):
+            if conn is None:
+                continue
+            try:
+                conn.send(('stop', None))
+            except (OSError, EOFError):
+                pass
+                
+        loop = asyncio.get_running_loop()
+        for process in self._processes:
+            if process is None:
+                continue
+            await loop.run_in_executor(None, process.join, 10.0)
+            if process.is_alive():
+                process.terminate()
+                
+        self._processes = [None] * self.workers
+        self._connections = [None] * self.workers
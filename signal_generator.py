@@ -40,6 +40,9 @@ class TradingSignal:
     # 수익/손실 계산
     profit_scenarios: Dict[str, float]
     loss_scenarios: Dict[str, float]
+    
+    # 주문 수량 (거래소 수량 단위 기준, 규격 미확인 시 0)
+    recommended_qty: float = 0.0
 
 class PatternRecognizer:
     """차트 패턴 인식"""
@@ -119,9 +122,11 @@ class RiskCalculator:
     
     def __init__(self, config):
         self.config = config
+        self.instruments = None  # round_qty(symbol, qty)를 제공하는 객체 (BybitAPI)
     
     def calculate_position_size(self, signal_score: int, account_balance: float, 
-                              entry_price: float, stop_loss: float) -> Dict[str, float]:
+                              entry_price: float, stop_loss: float,
+                              symbol: str = None) -> Dict[str, float]:
         """포지션 사이즈 계산"""
         
         # 신호 강도에 따른 기본 리스크 조정
@@ -141,8 +146,14 @@ class RiskCalculator:
             max_loss / risk_distance  # 손절 거리 기반
         )
         
+        # 거래소 수량 단위로 내림한 주문 수량
+        quantity = 0.0
+        if self.instruments and symbol and entry_price > 0:
+            quantity = self.instruments.round_qty(symbol, position_value / entry_price) or 0.0
+        
         return {
             'position_value': position_value,
+            'quantity': quantity,
             'risk_amount': position_value * risk_distance,
             'risk_percentage': (position_value * risk_distance) / account_balance * 100
         }
@@ -179,6 +190,22 @@ class SignalGenerator:
             'successful': 0,
             'failed': 0
         }
+        
+        # 심볼 규격 제공자 (호가/수량 단위 반올림, set_instrument_provider로 설정)
+        self.instruments = None
+    
+    def set_instrument_provider(self, provider):
+        """심볼 규격 제공자 설정 (round_price/round_qty를 가진 객체, 예: BybitAPI)"""
+        self.instruments = provider
+        self.risk_calculator.instruments = provider
+    
+    def _round_price(self, symbol: str, price: float) -> float:
+        """호가 단위 반올림 (규격이 없으면 소수 4자리)"""
+        if self.instruments:
+            rounded = self.instruments.round_price(symbol, price)
+            if rounded is not None:
+                return rounded
+        return round(price, 4)
     
     async def generate_signal(self, symbol: str, indicators: List[IndicatorResult], 
                             market_data=None) -> Optional[TradingSignal]:
@@ -322,7 +349,7 @@ class SignalGenerator:
         volatility = self._calculate_volatility(market_data)
         
         # 진입 구간 설정
-        entry_zones = self._calculate_entry_zones(current_price, direction, volatility)
+        entry_zones = self._calculate_entry_zones(symbol, current_price, direction, volatility)
         
         # 손절/익절 계산
         stop_loss = self._calculate_stop_loss(current_price, direction, volatility)
@@ -332,7 +359,7 @@ class SignalGenerator:
         
         # 포지션 사이징
         position_info = self.risk_calculator.calculate_position_size(
-            score, self.config.TOTAL_CAPITAL, current_price, stop_loss
+            score, self.config.TOTAL_CAPITAL, current_price, stop_loss, symbol
         )
         
         # 수익/손실 시나리오
@@ -368,7 +395,8 @@ class SignalGenerator:
             expected_duration=self._estimate_duration(score, volatility),
             
             profit_scenarios=profit_scenarios,
-            loss_scenarios=loss_scenarios
+            loss_scenarios=loss_scenarios,
+            recommended_qty=position_info['quantity']
         )
     
     def _calculate_volatility(self, market_data) -> float:
@@ -393,7 +421,7 @@ class SignalGenerator:
         
         return atr / current_price if current_price > 0 else 0.02
     
-    def _calculate_entry_zones(self, current_price: float, direction: str, 
+    def _calculate_entry_zones(self, symbol: str, current_price: float, direction: str, 
                               volatility: float) -> List[Dict[str, float]]:
         """분할 진입 구간 계산"""
         zones = []
@@ -407,11 +435,20 @@ class SignalGenerator:
             else:  # SHORT
                 price = current_price * (1 + distance)
             
+            price = self._round_price(symbol, price)
+            amount = self.config.TOTAL_CAPITAL * self.config.MAX_POSITION_RATIO * ratio
+            
+            # 구간별 주문 수량 (수량 단위 내림)
+            quantity = 0.0
+            if self.instruments and price > 0:
+                quantity = self.instruments.round_qty(symbol, amount / price) or 0.0
+            
             zones.append({
                 'order': i + 1,
-                'price': round(price, 4),
+                'price': price,
                 'ratio': ratio,
-                'amount': self.config.TOTAL_CAPITAL * self.config.MAX_POSITION_RATIO * ratio
+                'amount': amount,
+                'quantity': quantity
             })
         
         return zones
@@ -348,7 +348,7 @@ class TelegramBot:
 
 📊 <b>모니터링 코인:</b>
 • BTC, ETH, SOL, BNB, XRP
-• DOGE, LINK, ADA, MATIC, SHIB
+• DOGE, LINK, ADA, POL, SHIB
 
 ⚙️ <b>설정:</b>
 • 최소 신호 점수: {min_score}점
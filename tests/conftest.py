@@ -0,0 +1,118 @@
+# conftest.py - 테스트 공용 설정/가짜 API
+import os
+import sys
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_collector import TIMEFRAME_MS
+
+# config.Config 기본값 중 수집기가 읽는 항목 (네트워크/디스크 기능은 꺼둠)
+DEFAULTS = {
+    'BYBIT_API_KEY': 'key',
+    'BYBIT_SECRET': 'secret',
+    'BYBIT_TESTNET': True,
+    'SYMBOLS': ['BTCUSDT', 'ETHUSDT'],
+    'UNIVERSE_ENABLED': False,
+    'UNIVERSE_SIZE': 50,
+    'UNIVERSE_MIN_TURNOVER': 5_000_000.0,
+    'UNIVERSE_VOLATILITY_WEIGHT': 0.3,
+    'UNIVERSE_RETIRE_BUFFER': 0.2,
+    'UNIVERSE_PINNED': ['BTCUSDT', 'ETHUSDT'],
+    'UNIVERSE_REFRESH_INTERVAL': 3600.0,
+    'TIMEFRAMES': ['1', '3', '5', '15', '30', '60', '240', 'D'],
+    'DATA_LIMIT': 200,
+    'INTRABAR_TIMEFRAMES': ['1', '3', '5', '15', '30', '60'],
+    'CANDLE_CLOSE_DELAY': 2.0,
+    'RESAMPLE_ENABLED': False,
+    'RESAMPLE_BASE_TIMEFRAME': '1',
+    'RESAMPLE_RECONCILE_INTERVAL': 60,
+    'RESAMPLE_RECONCILE_BARS': 5,
+    'API_RATE_LIMIT': 120,
+    'API_PRIVATE_RATE_LIMIT': 120,
+    'API_RATE_BURST': 30,
+    'REQUEST_TIMEOUT': 30,
+    'API_RECV_WINDOW': 5000,
+    'CLOCK_SYNC_INTERVAL': 600.0,
+    'API_MAX_RETRIES': 2,
+    'API_RETRY_BASE_DELAY': 0.5,
+    'API_RETRY_MAX_DELAY': 8.0,
+    'CIRCUIT_FAILURE_THRESHOLD': 5,
+    'CIRCUIT_RECOVERY_TIMEOUT': 30.0,
+    'HEALTH_WINDOW': 50,
+    'HEALTH_MAX_ERROR_RATE': 0.5,
+    'HEALTH_MAX_LATENCY_MS': 5000.0,
+    'HEALTH_PROBE_IDLE': 120.0,
+    'API_CACHE_TTL': 1.0,
+    'METADATA_CACHE_SIZE': 256,
+    'METADATA_CACHE_FILE': '',
+    'MAX_CONCURRENT_REQUESTS': 10,
+    'KLINE_MAX_QUEUE_WAIT': 10.0,
+    'WS_ENABLED': False,
+    'WS_PUBLIC_URL': '',
+    'WS_PING_INTERVAL': 20.0,
+    'ORDERBOOK_ENABLED': False,
+    'ORDERBOOK_DEPTH': 50,
+    'ORDERBOOK_TOP_LEVELS': 10,
+    'TRADES_ENABLED': False,
+    'TRADE_FLOW_CAPACITY': 1440,
+    'TRADE_LARGE_NOTIONAL': 100_000.0,
+    'DERIVATIVES_ENABLED': False,
+    'OPEN_INTEREST_INTERVAL': '5min',
+    'LONG_SHORT_PERIOD': '5min',
+    'DERIVATIVES_HISTORY_LIMIT': 200,
+    'DERIVATIVES_CAPACITY': 2000,
+    'CANDLE_CACHE_ENABLED': False,
+    'CANDLE_CACHE_DIR': 'data/candles',
+    'CANDLE_CACHE_SAVE_INTERVAL': 300,
+    'HTTP_POOL_SIZE': 100,
+    'HTTP_KEEPALIVE_TIMEOUT': 75.0,
+    'HTTP_DNS_CACHE_TTL': 300,
+    'HISTORY_DATA_DIR': 'data/history',
+    'RSI_PERIODS': [14, 21, 50],
+    'MA_PERIODS': [8, 21, 50, 200],
+    'EMA_PERIODS': [8, 21, 50, 200],
+    'MACD_FAST': 12,
+    'MACD_SLOW': 26,
+    'MACD_SIGNAL': 9,
+    'BB_PERIOD': 20,
+    'BB_STD': 2.0,
+    'SHARD_WORKERS': 0,
+    'SHARD_REPLY_TIMEOUT': 120.0,
+    'LOG_LEVEL': 'WARNING'
+}
+
+def make_config(**overrides) -> SimpleNamespace:
+    """테스트용 설정 (config.Config 속성 이름 그대로)"""
+    return SimpleNamespace(**{**DEFAULTS, **overrides})
+
+class FakeKlines:
+    """get_kline_data 대체 (start~현재 구간 캔들을 최신순으로 반환, 진행 중 캔들 포함)"""
+    
+    def __init__(self, now_ms: int):
+        self.now_ms = now_ms
+        self.calls: List[dict] = []
+    
+    async def __call__(self, symbol: str, interval: str, limit: int = 200,
+                       start: Optional[int] = None, end: Optional[int] = None,
+                       max_wait: Optional[float] = None) -> List[List[str]]:
+        self.calls.append({'symbol': symbol, 'interval': interval, 'limit': limit, 'start': start, 'end': end})
+        interval_ms = TIMEFRAME_MS[interval]
+        last = (self.now_ms if end is None else min(end, self.now_ms)) // interval_ms * interval_ms
+        first = last - (limit - 1) * interval_ms
+        if start is not None:
+            first = max(first, -(-start // interval_ms) * interval_ms)
+            
+        rows = []
+        for ts in range(last, first - 1, -interval_ms):
+            # 진행 중 캔들은 경과 시간에 비례한 거래량 (마감 캔들은 100)
+            volume = 100.0 * min(1.0, (self.now_ms - ts) / interval_ms)
+            rows.append([str(ts), '10', '11', '9', str(10 + ts % 7), str(volume), str(volume * 10)])
+        return rows
+
+@pytest.fixture
+def config():
+    return make_config()
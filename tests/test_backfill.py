@@ -0,0 +1,108 @@
+# test_backfill.py - 히스토리 백필 체크포인트 / 이어받기 테스트
+import asyncio
+import os
+import sys
+import time
+import types
+
+import numpy as np
+import pytest
+
+from conftest import FakeKlines, make_config
+
+# config.Config는 테스트 설정으로 대체 (backfill 모듈이 import 시 참조)
+sys.modules.setdefault('config', types.SimpleNamespace(Config=make_config))
+
+from backfill import HistoryBackfiller
+from candle_store import ARCHIVE_DTYPE
+
+MINUTE_MS = 60_000
+
+class FakeAPI:
+    """get_kline_data만 제공 (fail_after번째 호출부터 실패)"""
+    
+    def __init__(self, fail_after=None):
+        self.klines = FakeKlines(int(time.time() * 1000))
+        self.fail_after = fail_after
+    
+    async def get_kline_data(self, *args, **kwargs):
+        if self.fail_after is not None and len(self.klines.calls) >= self.fail_after:
+            raise ConnectionError('network down')
+        return await self.klines(*args, **kwargs)
+
+def make_backfiller(api, data_dir):
+    backfiller = HistoryBackfiller(api, str(data_dir))
+    backfiller.PAGE_LIMIT = 5
+    return backfiller
+
+def assert_contiguous(timestamps, start_ms):
+    assert timestamps[0] == -(-start_ms // MINUTE_MS) * MINUTE_MS
+    assert np.all(np.diff(timestamps) == MINUTE_MS)
+    assert timestamps[-1] < int(time.time() * 1000) // MINUTE_MS * MINUTE_MS
+
+def test_backfill_pages_until_target(tmp_path):
+    api = FakeAPI()
+    backfiller = make_backfiller(api, tmp_path)
+    start_ms = int(time.time() * 1000) - 23 * MINUTE_MS
+    
+    added = asyncio.run(backfiller.backfill_one('BTCUSDT', '1', start_ms))
+    
+    archive = backfiller.get_archive('BTCUSDT', '1')
+    timestamps = np.asarray(archive.records()['timestamp'])
+    assert added == len(timestamps) >= 22
+    assert_contiguous(timestamps, start_ms)
+    assert backfiller.stats['pages'] == len(api.klines.calls) == 5
+    
+    # 완료 후 임시 파일/체크포인트 정리
+    assert not os.path.exists(archive.path + '.part')
+    assert not os.path.exists(archive.path + '.checkpoint.json')
+
+def test_backfill_resumes_from_checkpoint(tmp_path):
+    start_ms = int(time.time() * 1000) - 23 * MINUTE_MS
+    failing = FakeAPI(fail_after=2)
+    backfiller = make_backfiller(failing, tmp_path)
+    
+    with pytest.raises(ConnectionError):
+        asyncio.run(backfiller.backfill_one('BTCUSDT', '1', start_ms))
+        
+    archive = backfiller.get_archive('BTCUSDT', '1')
+    checkpoint = backfiller._load_checkpoint(archive.path + '.checkpoint.json')
+    assert os.path.getsize(archive.path + '.part') == 10 * ARCHIVE_DTYPE.itemsize
+    assert len(archive) == 0
+    
+    # 두 페이지 이후 구간부터 이어받음
+    api = FakeAPI()
+    backfiller = make_backfiller(api, tmp_path)
+    added = asyncio.run(backfiller.backfill_one('BTCUSDT', '1', start_ms))
+    
+    assert backfiller.stats['resumed'] == 1
+    assert api.klines.calls[0]['end'] == checkpoint['end']
+    timestamps = np.asarray(archive.records()['timestamp'])
+    assert added == len(timestamps)
+    assert_contiguous(timestamps, start_ms)
+
+def test_backfill_skips_when_archive_is_current(tmp_path):
+    api = FakeAPI()
+    backfiller = make_backfiller(api, tmp_path)
+    start_ms = int(time.time() * 1000) - 8 * MINUTE_MS
+    asyncio.run(backfiller.backfill_one('BTCUSDT', '1', start_ms))
+    calls = len(api.klines.calls)
+    
+    assert asyncio.run(backfiller.backfill_one('BTCUSDT', '1', start_ms)) == 0
+    assert len(api.klines.calls) == calls
+
+def test_finalize_drops_duplicate_pages(tmp_path):
+    backfiller = make_backfiller(FakeAPI(), tmp_path)
+    archive = backfiller.get_archive('BTCUSDT', '1')
+    part_path = str(tmp_path / 'BTCUSDT_1.bin.part')
+    
+    # 체크포인트 직전 중단으로 같은 페이지가 두 번 기록된 경우
+    page = {name: np.arange(5, 10, dtype=np.float64) for name in ARCHIVE_DTYPE.names}
+    page['timestamp'] = np.arange(5, 10, dtype=np.int64)
+    older = {name: values - 5 for name, values in page.items()}
+    for columns in (page, page, older):
+        backfiller._append_part(part_path, columns)
+        
+    assert backfiller._finalize(archive, part_path) == 10
+    assert archive.records()['timestamp'].tolist() == list(range(10))
+    assert not os.path.exists(part_path)
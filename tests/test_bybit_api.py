@@ -0,0 +1,140 @@
+# test_bybit_api.py - 로컬 HTTP 대역으로 장기 세션 재사용 / 요청 병합 / 마이크로 TTL 캐시 테스트
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from data_collector import BybitAPI, RateLimiter, RequestDroppedError
+
+class LocalExchange:
+    """바이비트 REST 대역 (경로별 요청 수 기록, gate가 닫혀 있으면 응답 보류)"""
+    
+    def __init__(self):
+        self.hits = {}
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.app = web.Application()
+        self.app.router.add_get('/v5/market/{name}', self.handler)
+    
+    async def handler(self, request):
+        self.hits[request.path] = self.hits.get(request.path, 0) + 1
+        await self.gate.wait()
+        return web.json_response({
+            'retCode': 0,
+            'result': {'list': [{'symbol': 'BTCUSDT', 'lastPrice': '65000'}]}
+        })
+
+async def open_api(test_server, **kwargs) -> BybitAPI:
+    api = BybitAPI('key', 'secret', testnet=True, **kwargs)
+    api.base_url = str(test_server.make_url('')).rstrip('/')
+    await api.open()
+    return api
+
+def test_concurrent_identical_gets_share_one_request():
+    exchange = LocalExchange()
+    
+    async def run():
+        async with TestServer(exchange.app) as test_server:
+            api = await open_api(test_server)
+            results = await asyncio.gather(*(api.get_all_tickers() for _ in range(5)))
+            
+            assert exchange.hits == {'/v5/market/tickers': 1}
+            assert all(result == results[0] for result in results)
+            stats = api.get_coalesce_stats()
+            assert stats['upstream'] == 1
+            assert stats['coalesced'] == 4
+            assert stats['saved'] == 4
+            assert stats['inflight'] == 0
+            await api.close()
+            
+    asyncio.run(run())
+
+def test_cancelled_waiter_does_not_cancel_shared_request():
+    exchange = LocalExchange()
+    exchange.gate.clear()
+    
+    async def run():
+        async with TestServer(exchange.app) as test_server:
+            api = await open_api(test_server)
+            first = asyncio.ensure_future(api.get_all_tickers())
+            second = asyncio.ensure_future(api.get_all_tickers())
+            while not exchange.hits:
+                await asyncio.sleep(0.01)
+                
+            first.cancel()
+            await asyncio.gather(first, return_exceptions=True)
+            exchange.gate.set()
+            
+            assert (await second)[0]['symbol'] == 'BTCUSDT'
+            assert first.cancelled()
+            assert exchange.hits == {'/v5/market/tickers': 1}
+            await api.close()
+            
+    asyncio.run(run())
+
+def test_micro_ttl_cache_expires():
+    exchange = LocalExchange()
+    
+    async def run():
+        async with TestServer(exchange.app) as test_server:
+            api = await open_api(test_server, cache_ttl=0.1)
+            await api.get_all_tickers()
+            await api.get_all_tickers()
+            assert exchange.hits == {'/v5/market/tickers': 1}
+            assert api.get_coalesce_stats()['cache_hits'] == 1
+            
+            await asyncio.sleep(0.15)
+            await api.get_all_tickers()
+            assert exchange.hits == {'/v5/market/tickers': 2}
+            await api.close()
+            
+    asyncio.run(run())
+
+def test_unbounded_caller_does_not_inherit_drop_deadline():
+    exchange = LocalExchange()
+    
+    async def run():
+        async with TestServer(exchange.app) as test_server:
+            api = await open_api(test_server)
+            limiter = api.rate_limiters['public'] = RateLimiter(600, burst=1)  # 0.1초당 1개
+            await limiter.acquire()
+            
+            # 대기 한도가 있는 델타 조회가 먼저 시작해도 한도 없는 보충 조회는 끝까지 기다림
+            bounded = asyncio.ensure_future(api.get_kline_data('BTCUSDT', '1', max_wait=0.02))
+            unbounded = asyncio.ensure_future(api.get_kline_data('BTCUSDT', '1'))
+            
+            with pytest.raises(RequestDroppedError):
+                await bounded
+            assert (await unbounded)[0]['symbol'] == 'BTCUSDT'
+            assert exchange.hits == {'/v5/market/kline': 1}
+            await api.close()
+            
+    asyncio.run(run())
+
+def test_persistent_session_reuses_one_connection():
+    exchange = LocalExchange()
+    
+    async def run():
+        async with TestServer(exchange.app) as test_server:
+            api = await open_api(test_server)
+            session = api.session
+            
+            # 수집기 경로처럼 매번 async with로 감싸도 장기 세션 그대로 사용
+            for symbol in ('BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'XRPUSDT'):
+                async with api as client:
+                    assert client.session is session
+                    await client.get_kline_data(symbol, '1')
+            
+            stats = api.get_connection_stats()
+            assert exchange.hits == {'/v5/market/kline': 4}
+            assert stats['requests'] == 4
+            assert stats['handshakes'] == 1
+            assert stats['reused'] == 3
+            assert stats['reuse_ratio'] == 0.75
+            
+            await api.close()
+            assert session.closed
+            assert not api.is_open
+    
+    asyncio.run(run())
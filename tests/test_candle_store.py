@@ -0,0 +1,152 @@
+# test_candle_store.py - 캔들 링 버퍼 / 히스토리 아카이브 테스트
+import numpy as np
+
+from candle_store import ARCHIVE_DTYPE, CandleArchive, CandleBuffer, CANDLE_COLUMNS, HistoryStore
+
+def candles(timestamps, close=1.0):
+    """시각 목록으로 캔들 컬럼 생성"""
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    columns = {name: np.full(len(timestamps), close) for name in CANDLE_COLUMNS[1:]}
+    columns['timestamp'] = timestamps
+    return columns
+
+def test_version_changes_when_older_bar_is_corrected():
+    buffer = CandleBuffer(10)
+    buffer.merge(candles(range(0, 5)))
+    last_version = buffer.version
+    
+    # 마지막 캔들은 그대로 두고 과거 캔들만 보정
+    buffer.merge(candles([1], close=2.0))
+    assert buffer.view('close')[1] == 2.0
+    assert buffer.view('close')[-1] == 1.0
+    assert buffer.version != last_version
+    
+    df = buffer.to_dataframe()
+    assert df.attrs['version'] == buffer.version
+
+def test_version_changes_when_hole_is_filled():
+    buffer = CandleBuffer(10)
+    buffer.merge(candles([0, 1, 3, 4]))
+    last_version = buffer.version
+    
+    buffer.merge(candles([2]))
+    assert buffer.view('timestamp').tolist() == [0, 1, 2, 3, 4]
+    assert buffer.version != last_version
+
+def test_version_unchanged_without_writes():
+    buffer = CandleBuffer(10)
+    buffer.merge(candles(range(0, 5)))
+    last_version = buffer.version
+    
+    buffer.merge(candles([]))
+    buffer.columns()
+    assert buffer.version == last_version
+
+def test_append_wraps_around_and_keeps_latest():
+    buffer = CandleBuffer(4)
+    for ts in range(7):
+        buffer.append(ts, 1.0, 1.0, 1.0, float(ts), 1.0, 1.0)
+        
+    assert len(buffer) == 4
+    assert buffer.view('timestamp').tolist() == [3, 4, 5, 6]
+    assert buffer.view('close').tolist() == [3.0, 4.0, 5.0, 6.0]
+    assert buffer.first_timestamp() == 3
+    assert buffer.last_timestamp() == 6
+
+def test_upsert_updates_in_progress_bar():
+    buffer = CandleBuffer(4)
+    buffer.upsert(0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0)
+    buffer.upsert(0, 1.0, 2.0, 1.0, 2.0, 5.0, 1.0)
+    buffer.upsert(1, 2.0, 2.0, 2.0, 2.0, 1.0, 1.0)
+    
+    assert buffer.view('timestamp').tolist() == [0, 1]
+    assert buffer.view('volume').tolist() == [5.0, 1.0]
+
+def test_merge_overwrites_overlap_and_appends_after_wrap():
+    buffer = CandleBuffer(5)
+    buffer.merge(candles(range(0, 8)))
+    assert buffer.view('timestamp').tolist() == [3, 4, 5, 6, 7]
+    
+    # 겹치는 캔들은 덮어쓰기, 이후 캔들은 추가 (용량 초과분은 오래된 순 제거)
+    buffer.merge(candles([6, 7, 8, 9], close=2.0))
+    assert buffer.view('timestamp').tolist() == [5, 6, 7, 8, 9]
+    assert buffer.view('close').tolist() == [1.0, 2.0, 2.0, 2.0, 2.0]
+
+def test_merge_ignores_bars_older_than_full_buffer():
+    buffer = CandleBuffer(3)
+    buffer.merge(candles([10, 11, 12]))
+    
+    buffer.merge(candles([5, 11], close=3.0))
+    assert buffer.view('timestamp').tolist() == [10, 11, 12]
+    assert buffer.view('close').tolist() == [1.0, 3.0, 1.0]
+
+def test_views_are_read_only_and_contiguous():
+    buffer = CandleBuffer(3)
+    buffer.merge(candles(range(0, 5)))
+    
+    closes = buffer.view('close')
+    assert closes.flags['C_CONTIGUOUS']
+    assert not closes.flags.writeable
+    assert buffer.tail(2)['timestamp'].tolist() == [3, 4]
+    assert buffer.since(3)['timestamp'].tolist() == [3, 4]
+
+def test_save_and_load_round_trip(tmp_path):
+    buffer = CandleBuffer(5)
+    buffer.merge(candles(range(100, 105), close=7.5))
+    path = str(tmp_path / 'BTCUSDT_1.npy')
+    buffer.save(path)
+    
+    restored = CandleBuffer(5)
+    assert restored.load(path) == 5
+    assert restored.view('timestamp').tolist() == list(range(100, 105))
+    assert restored.view('close').tolist() == [7.5] * 5
+    
+    # 손상된 캐시는 무시
+    with open(path, 'wb') as f:
+        f.write(b'broken')
+    assert CandleBuffer(5).load(path) == 0
+
+def test_archive_appends_only_after_last_record(tmp_path):
+    archive = CandleArchive(str(tmp_path / 'BTCUSDT_1.bin'))
+    assert len(archive) == 0
+    assert archive.last_timestamp() is None
+    
+    assert archive.append(candles(range(0, 5))) == 5
+    assert archive.append(candles(range(3, 8), close=2.0)) == 3
+    assert archive.append(candles(range(0, 8))) == 0
+    
+    assert len(archive) == 8
+    assert archive.last_timestamp() == 7
+    assert archive.records()['close'].tolist() == [1.0] * 5 + [2.0] * 3
+
+def test_archive_repairs_truncated_record(tmp_path):
+    path = tmp_path / 'BTCUSDT_1.bin'
+    archive = CandleArchive(str(path))
+    archive.append(candles(range(0, 3)))
+    
+    # 쓰다 끊긴 레코드 조각 (레코드 경계가 아님)
+    with open(path, 'ab') as f:
+        f.write(b'\x00' * (ARCHIVE_DTYPE.itemsize // 2))
+    assert len(archive) == 3
+    
+    assert archive.append(candles(range(3, 5))) == 2
+    assert path.stat().st_size == 5 * ARCHIVE_DTYPE.itemsize
+    assert archive.records()['timestamp'].tolist() == [0, 1, 2, 3, 4]
+
+def test_archive_range_is_inclusive(tmp_path):
+    archive = CandleArchive(str(tmp_path / 'BTCUSDT_1.bin'))
+    archive.append(candles(range(0, 100, 10)))
+    
+    assert archive.range(20, 50)['timestamp'].tolist() == [20, 30, 40, 50]
+    assert archive.range(15, 25)['timestamp'].tolist() == [20]
+    assert archive.range(None, 10)['timestamp'].tolist() == [0, 10]
+    assert len(archive.range(200, None)['timestamp']) == 0
+
+def test_history_store_reads_range(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    assert store.get_symbol_data('BTCUSDT', '1') is None
+    
+    store.get_archive('BTCUSDT', '1').append(candles(range(0, 10)))
+    df = store.get_symbol_data('BTCUSDT', '1', start=2, end=4)
+    assert df['timestamp'].tolist() == [2, 3, 4]
+    assert list(df.columns) == list(CANDLE_COLUMNS)
@@ -0,0 +1,49 @@
+# test_circuit_breaker.py - 엔드포인트 서킷 브레이커 테스트
+from data_collector import CircuitBreaker
+
+def make_breaker(monkeypatch, now):
+    monkeypatch.setattr('data_collector.time.monotonic', lambda: now[0])
+    return CircuitBreaker(failure_threshold=3, recovery_timeout=30.0)
+
+def test_opens_after_consecutive_failures(monkeypatch):
+    now = [100.0]
+    breaker = make_breaker(monkeypatch, now)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.allow_request()
+    
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert not breaker.allow_request()
+    assert breaker.retry_after() == 30.0
+    assert breaker.get_status()['rejected'] == 1
+
+def test_success_resets_failure_count(monkeypatch):
+    breaker = make_breaker(monkeypatch, [100.0])
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    
+    assert breaker.state == 'closed'
+    assert breaker.failures == 1
+
+def test_half_open_probe_closes_or_reopens(monkeypatch):
+    now = [100.0]
+    breaker = make_breaker(monkeypatch, now)
+    for _ in range(3):
+        breaker.record_failure()
+        
+    # 복구 대기 후 시험 요청 1건 허용, 실패하면 바로 다시 차단
+    now[0] += 30.0
+    assert breaker.allow_request()
+    assert breaker.state == 'half_open'
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert breaker.stats['opened'] == 2
+    
+    now[0] += 30.0
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    assert breaker.retry_after() == 0.0
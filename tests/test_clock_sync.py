@@ -0,0 +1,69 @@
+# test_clock_sync.py - 서버 시각 오프셋 추정 / 동기화 백오프 테스트
+import asyncio
+
+import aiohttp
+import pytest
+
+from data_collector import BybitAPI, ClockSync
+
+def test_offset_uses_min_rtt_sample():
+    clock = ClockSync()
+    clock.add_sample(1_000.0, 1_100.0, 1_550.0)  # 왕복 100ms, 오프셋 500ms
+    clock.add_sample(2_000.0, 2_010.0, 2_305.0)  # 왕복 10ms, 오프셋 300ms
+    
+    assert clock.offset == 300.0
+    assert clock.min_rtt == 10.0
+    assert not clock.needs_sync()
+
+def test_failure_backs_off_then_retries(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr('data_collector.time.monotonic', lambda: now[0])
+    clock = ClockSync(sync_interval=600.0, retry_delay=30.0)
+    assert clock.needs_sync()
+    
+    clock.record_failure()
+    assert not clock.needs_sync()
+    now[0] += 30.0
+    assert clock.needs_sync()
+    
+    # 연속 실패마다 대기 2배 (최대 sync_interval)
+    clock.record_failure()
+    now[0] += 59.0
+    assert not clock.needs_sync()
+    now[0] += 1.0
+    assert clock.needs_sync()
+    
+    for _ in range(10):
+        clock.record_failure()
+    assert clock.retry_after() == 600.0
+    
+    clock.add_sample(0.0, 10.0, 5.0)
+    assert clock.failures == 0
+
+class FailingSession:
+    """모든 요청이 연결 오류인 세션"""
+    
+    def __init__(self):
+        self.requests = 0
+    
+    def get(self, url):
+        self.requests += 1
+        raise aiohttp.ClientConnectionError('down')
+
+def test_sync_clock_records_failure():
+    api = BybitAPI('key', 'secret')
+    api.session = FailingSession()
+    
+    async def run():
+        assert not await api.sync_clock(samples=5)
+        assert api.session.requests == 5
+        assert api.clock.failures == 1
+        assert not api.clock.needs_sync()
+        
+    asyncio.run(run())
+
+def test_sync_clock_requires_session():
+    api = BybitAPI('key', 'secret')
+    
+    with pytest.raises(RuntimeError):
+        asyncio.run(api.sync_clock())
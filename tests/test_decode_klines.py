@@ -0,0 +1,86 @@
+# test_decode_klines.py - K-라인 일괄 디코딩 테스트 / 1000개 캔들 처리량 측정
+import time
+
+import numpy as np
+import pandas as pd
+
+from candle_store import CANDLE_COLUMNS
+from data_collector import decode_klines
+
+def payload(count: int, start: int = 1_700_000_000_000):
+    """바이비트 응답 형식 (최신순 문자열 배열)"""
+    rows = []
+    for i in reversed(range(count)):
+        price = 65000 + (i * 37) % 500 + 0.25
+        rows.append([
+            str(start + i * 60_000), str(price), str(price + 12.5), str(price - 8.75),
+            str(price + 1.5), str(10 + i % 13 + 0.001), str((10 + i % 13) * price)
+        ])
+    return rows
+
+def legacy_decode(kline_data):
+    """이전 pandas 변환 경로 (행별 dict + float() 후 정렬)"""
+    df = pd.DataFrame([{
+        'timestamp': int(kline[0]),
+        'open': float(kline[1]),
+        'high': float(kline[2]),
+        'low': float(kline[3]),
+        'close': float(kline[4]),
+        'volume': float(kline[5]),
+        'turnover': float(kline[6])
+    } for kline in kline_data])
+    df = df.sort_values('timestamp').reset_index(drop=True)
+    return {name: df[name].to_numpy() for name in CANDLE_COLUMNS}
+
+def best_of(func, *args, repeat: int = 20) -> float:
+    """최소 실행 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def test_matches_legacy_pandas_path():
+    rows = payload(1000)
+    columns = decode_klines(rows)
+    expected = legacy_decode(rows)
+    
+    assert set(columns) == set(CANDLE_COLUMNS)
+    for name in CANDLE_COLUMNS:
+        assert columns[name].dtype == expected[name].dtype
+        assert np.array_equal(columns[name], expected[name])
+        assert columns[name].flags['C_CONTIGUOUS']
+
+def test_newest_first_payload_becomes_ascending():
+    columns = decode_klines([
+        ['1700000120000', '3', '3', '3', '3', '1', '3'],
+        ['1700000060000', '2', '2', '2', '2', '1', '2'],
+        ['1700000000000', '1', '1', '1', '1', '1', '1']
+    ])
+    
+    assert columns['timestamp'].dtype == np.int64
+    assert columns['timestamp'].tolist() == [1700000000000, 1700000060000, 1700000120000]
+    assert columns['close'].tolist() == [1.0, 2.0, 3.0]
+
+def test_empty_payload_has_typed_empty_columns():
+    columns = decode_klines([])
+    
+    assert set(columns) == set(CANDLE_COLUMNS)
+    assert all(len(values) == 0 for values in columns.values())
+    assert columns['timestamp'].dtype == np.int64
+    assert columns['close'].dtype == np.float64
+
+def test_decode_1000_bars_faster_than_pandas_path():
+    rows = payload(1000)
+    decoded = best_of(decode_klines, rows)
+    legacy = best_of(legacy_decode, rows)
+    
+    # 측정값 출력: PYTHONPATH=. python tests/test_decode_klines.py
+    assert decoded < legacy
+
+if __name__ == '__main__':
+    rows = payload(1000)
+    for name, func in (('decode_klines', decode_klines), ('pandas 경로', legacy_decode)):
+        seconds = best_of(func, rows, repeat=200)
+        print(f"{name}: 1000개 {seconds * 1000:.3f}ms ({1000 / seconds / 1e6:.2f}M 캔들/초)")
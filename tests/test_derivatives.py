@@ -0,0 +1,60 @@
+# test_derivatives.py - 파생상품 시계열 병합 / 캔들 정렬 테스트
+import numpy as np
+import pytest
+
+from derivatives_collector import SeriesBuffer
+
+def test_append_overwrites_same_timestamp_and_ignores_older():
+    series = SeriesBuffer(5)
+    series.append(100, 1.0)
+    series.append(200, 2.0)
+    series.append(200, 2.5)
+    series.append(150, 9.0)
+    
+    timestamps, values = series.arrays()
+    assert timestamps.tolist() == [100, 200]
+    assert values.tolist() == [1.0, 2.5]
+    assert not values.flags.writeable
+
+def test_append_keeps_latest_capacity_after_compaction():
+    series = SeriesBuffer(3)
+    for timestamp in range(10):
+        series.append(timestamp, float(timestamp))
+        
+    timestamps, values = series.arrays()
+    assert len(series) == 3
+    assert timestamps.tolist() == [7, 8, 9]
+    assert values.tolist() == [7.0, 8.0, 9.0]
+    assert series.last_timestamp() == 9
+
+def test_merge_prefers_new_values_and_trims_to_capacity():
+    series = SeriesBuffer(4)
+    for timestamp in (10, 20, 30):
+        series.append(timestamp, 1.0)
+        
+    series.merge(np.array([0, 20, 40]), np.array([5.0, 6.0, 7.0]))
+    timestamps, values = series.arrays()
+    assert timestamps.tolist() == [10, 20, 30, 40]
+    assert values.tolist() == [1.0, 6.0, 1.0, 7.0]
+    
+    # 병합 뒤에도 이어 쓰기 가능
+    series.append(50, 8.0)
+    assert series.arrays()[0].tolist() == [20, 30, 40, 50]
+
+def test_align_uses_values_known_before_candle_close():
+    series = SeriesBuffer(10)
+    series.merge(np.array([1_000, 2_500, 6_000]), np.array([1.0, 2.0, 3.0]))
+    
+    candles = np.array([0, 1_000, 2_000, 3_000, 4_000, 5_000, 6_000], dtype=np.int64)
+    aligned = series.align(candles, 1_000)
+    
+    # 0 구간 이전 관측 없음, 2_000 구간 안의 2_500은 그 캔들부터 반영
+    assert np.isnan(aligned[0])
+    assert aligned[1:].tolist() == [1.0, 2.0, 2.0, 2.0, 2.0, 3.0]
+
+def test_align_on_empty_series_is_nan():
+    aligned = SeriesBuffer(3).align(np.array([0, 60_000]), 60_000)
+    assert np.isnan(aligned).all()
+    
+    with pytest.raises(ValueError):
+        SeriesBuffer(0)
@@ -0,0 +1,87 @@
+# test_endpoint_metrics.py - 지연 히스토그램 백분위 / 엔드포인트 계측 노출 테스트
+import asyncio
+
+import numpy as np
+import pytest
+from aiohttp.test_utils import TestServer
+
+from conftest import make_config
+from data_collector import DataCollector, EndpointMetrics, LatencyHistogram
+from test_bybit_api import LocalExchange
+
+# 구간 간격 (상한이 실제 값보다 최대 이 비율만큼 큼)
+STEP = LatencyHistogram.BOUNDS[1] / LatencyHistogram.BOUNDS[0]
+
+def test_bucket_edges_are_inclusive_upper_bounds():
+    histogram = LatencyHistogram()
+    edge = LatencyHistogram.BOUNDS[10]
+    histogram.record(edge)
+    histogram.record(edge * 1.0001)
+    histogram.record(0.0)
+    histogram.record(120_000.0)  # 최대 구간 초과
+    
+    assert histogram.counts[10] == 1
+    assert histogram.counts[11] == 1
+    assert histogram.counts[0] == 1
+    assert histogram.counts[-1] == 1
+    assert histogram.count == 4
+    assert histogram.percentile(100) == 120_000.0
+
+def test_constant_distribution_is_exact():
+    histogram = LatencyHistogram()
+    for _ in range(100):
+        histogram.record(5.0)
+        
+    # 구간 상한은 최댓값으로 잘림
+    assert histogram.summary() == {'avg': 5.0, 'p50': 5.0, 'p95': 5.0, 'p99': 5.0, 'max': 5.0}
+
+@pytest.mark.parametrize('values', [
+    np.arange(1, 1001, dtype=np.float64),  # 균등 1~1000ms
+    np.random.default_rng(7).lognormal(np.log(50.0), 1.0, 5000)  # 긴 꼬리
+])
+def test_percentiles_within_one_bucket(values):
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(float(value))
+        
+    for q in (50, 95, 99):
+        exact = np.percentile(values, q, method='inverted_cdf')
+        estimate = histogram.percentile(q)
+        assert exact <= estimate <= exact * STEP
+
+def test_empty_histogram_reports_zero():
+    assert LatencyHistogram().summary() == {'avg': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+
+def test_endpoint_metrics_summary():
+    metrics = EndpointMetrics()
+    metrics.record(12.0, 2048, 0.5, 3.0)
+    metrics.record(20.0, 1024, 0.7, 0.0)
+    metrics.record_error(TimeoutError())
+    
+    summary = metrics.summary()
+    assert summary['requests'] == 2
+    assert summary['bytes'] == 3072
+    assert summary['avg_bytes'] == 1536.0
+    assert summary['errors'] == {'TimeoutError': 1}
+    assert summary['latency_ms']['max'] == 20.0
+    assert summary['rate_wait_ms']['avg'] == 1.5
+
+def test_data_status_exposes_endpoint_metrics():
+    exchange = LocalExchange()
+    
+    async def run():
+        async with TestServer(exchange.app) as test_server:
+            collector = DataCollector(make_config(SYMBOLS=['BTCUSDT'], API_CACHE_TTL=0.0))
+            collector.api.base_url = str(test_server.make_url('')).rstrip('/')
+            await collector.api.open()
+            await collector.api.get_all_tickers()
+            await collector.api.get_all_tickers()
+            await collector.api.close()
+            
+            metrics = collector.get_data_status()['endpoint_metrics']['/v5/market/tickers']
+            assert metrics['requests'] == 2
+            assert metrics['bytes'] > 0
+            assert 0 < metrics['latency_ms']['p50'] <= metrics['latency_ms']['p99'] <= metrics['latency_ms']['max']
+            assert metrics['errors'] == {}
+            
+    asyncio.run(run())
@@ -0,0 +1,84 @@
+# test_fan_out.py - 심볼/시간대 동시 수집 (동시 요청 상한, 심볼 단위 실패 격리) 테스트
+import asyncio
+
+from conftest import FakeKlines, make_config
+from data_collector import DataCollector, TIMEFRAME_MS
+
+NOW = 1_700_006_400_000 + 30_000
+SYMBOLS = ['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'XRPUSDT']
+
+class SlowKlines(FakeKlines):
+    """응답을 잠시 붙잡아 동시 요청 수를 기록, failing 심볼은 실패"""
+    
+    def __init__(self, now_ms: int):
+        super().__init__(now_ms)
+        self.failing = set()
+        self.attempts = 0
+        self.active = 0
+        self.peak = 0
+    
+    async def __call__(self, symbol, interval, *args, **kwargs):
+        self.attempts += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if symbol in self.failing:
+                raise ConnectionError(f"{symbol} 응답 없음")
+            return await super().__call__(symbol, interval, *args, **kwargs)
+        finally:
+            self.active -= 1
+
+def make_collector():
+    collector = DataCollector(make_config(
+        SYMBOLS=list(SYMBOLS), TIMEFRAMES=['1', '5', '15'], INTRABAR_TIMEFRAMES=['1', '5', '15'],
+        MAX_CONCURRENT_REQUESTS=2
+    ))
+    fake = SlowKlines(NOW)
+    collector.api.get_kline_data = fake
+    collector.api.clock.now_ms = lambda: fake.now_ms
+    collector.api.clock.needs_sync = lambda: False
+    
+    # 티커/심볼 규격은 이 테스트 범위 밖
+    async def ok(*args):
+        return True
+        
+    collector.refresh_tickers = ok
+    collector.refresh_instruments = ok
+    collector.load_instruments = ok
+    return collector, fake
+
+def test_initial_fetch_isolates_failed_symbol_and_caps_concurrency():
+    collector, fake = make_collector()
+    fake.failing.add('ETHUSDT')
+    
+    asyncio.run(collector.fetch_initial_data())
+    
+    # 12개 요청이 동시에 진행되지만 세마포어 상한(2)을 넘지 않음
+    assert fake.attempts == 12
+    assert fake.peak == 2
+    for symbol in ('BTCUSDT', 'SOLUSDT', 'XRPUSDT'):
+        for timeframe in ('1', '5', '15'):
+            assert collector.symbol_data[symbol][timeframe].last_timestamp() == \
+                NOW // TIMEFRAME_MS[timeframe] * TIMEFRAME_MS[timeframe]
+    assert not collector.symbol_data['ETHUSDT']
+
+def test_update_cycle_isolates_failed_symbol_and_caps_concurrency():
+    collector, fake = make_collector()
+    
+    async def run():
+        await collector.fetch_initial_data()
+        
+        fake.now_ms += TIMEFRAME_MS['1']
+        fake.failing.add('BTCUSDT')
+        fake.peak = 0
+        return await collector.update_all_symbols()
+        
+    status = asyncio.run(run())
+    
+    assert status == {'BTCUSDT': False, 'ETHUSDT': True, 'SOLUSDT': True, 'XRPUSDT': True}
+    assert fake.peak == 2
+    minute = NOW // 60_000 * 60_000
+    assert collector.symbol_data['SOLUSDT']['1'].last_timestamp() == minute + 60_000
+    assert collector.symbol_data['BTCUSDT']['1'].last_timestamp() == minute
+    assert 'BTCUSDT' in collector.stale_since
@@ -0,0 +1,45 @@
+# test_health_monitor.py - 요청 결과 기반 상태 판단 테스트
+from data_collector import HealthMonitor
+
+def test_healthy_without_samples():
+    monitor = HealthMonitor()
+    assert monitor.is_healthy()
+    assert monitor.idle_seconds() == float('inf')
+    assert monitor.get_status()['idle_seconds'] is None
+
+def test_error_rate_over_window():
+    monitor = HealthMonitor(window=4, max_error_rate=0.5)
+    for success in (False, False, False, True):
+        monitor.record(success, 10.0)
+    assert monitor.error_rate() == 0.75
+    assert not monitor.is_healthy()
+    
+    # 오래된 결과는 창 밖으로 밀려남
+    monitor.record(True, 10.0)
+    monitor.record(True, 10.0)
+    assert monitor.error_rate() == 0.25
+    assert monitor.is_healthy()
+
+def test_slow_successes_are_unhealthy():
+    monitor = HealthMonitor(window=20, max_latency_ms=1000.0)
+    for _ in range(18):
+        monitor.record(True, 50.0)
+    monitor.record(True, 4000.0)
+    monitor.record(True, 4000.0)
+    
+    assert monitor.p95_latency() > 1000.0
+    assert not monitor.is_healthy()
+
+def test_failed_latency_is_ignored(monkeypatch):
+    now = [500.0]
+    monkeypatch.setattr('data_collector.time.monotonic', lambda: now[0])
+    monitor = HealthMonitor(max_error_rate=1.0, max_latency_ms=1000.0)
+    monitor.record(True, 20.0)
+    monitor.record(False, 30_000.0)
+    
+    assert monitor.p95_latency() == 20.0
+    assert monitor.is_healthy()
+    
+    now[0] += 12.0
+    assert monitor.idle_seconds() == 12.0
+    assert monitor.last_success_at == 500.0
@@ -0,0 +1,43 @@
+# test_indicator_engine.py - 지표 결과 재사용 테스트
+import asyncio
+
+import numpy as np
+import pytest
+
+pytest.importorskip('talib')
+
+from candle_store import CandleBuffer, CANDLE_COLUMNS
+from conftest import make_config
+from indicator_engine import IndicatorEngine
+
+def make_buffer(count: int = 300) -> CandleBuffer:
+    columns = {name: np.linspace(10.0, 20.0, count) for name in CANDLE_COLUMNS[1:]}
+    columns['timestamp'] = np.arange(count, dtype=np.int64) * 60_000
+    buffer = CandleBuffer(count)
+    buffer.merge(columns)
+    return buffer
+
+def test_results_reused_until_buffer_changes():
+    engine = IndicatorEngine(make_config())
+    buffer = make_buffer()
+    
+    async def calculate():
+        results = await engine.calculate_all_indicators('BTCUSDT', {'240': buffer.to_dataframe()})
+        engine.update_indicators('BTCUSDT', results)
+        return results['240']
+    
+    async def run():
+        first = await calculate()
+        assert await calculate() is first
+        assert engine.calc_stats == {'calculated': 1, 'reused': 1}
+        
+        # 마지막 캔들은 그대로인 과거 캔들 보정도 재계산
+        correction = buffer.tail(10)
+        correction = {name: values[:1].copy() for name, values in correction.items()}
+        correction['close'][:] = 99.0
+        buffer.merge(correction)
+        
+        assert await calculate() is not first
+        assert engine.calc_stats == {'calculated': 2, 'reused': 1}
+        
+    asyncio.run(run())
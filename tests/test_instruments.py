@@ -0,0 +1,78 @@
+# test_instruments.py - 심볼 규격 캐시 만료 / 재조회 테스트
+import asyncio
+
+from conftest import make_config
+from data_collector import DataCollector
+
+INSTRUMENT = {
+    'symbol': 'BTCUSDT',
+    'priceFilter': {'tickSize': '0.1'},
+    'lotSizeFilter': {'qtyStep': '0.001', 'minOrderQty': '0.001'}
+}
+
+def make_collector(monkeypatch, now):
+    monkeypatch.setattr('data_collector.time.time', lambda: now[0])
+    collector = DataCollector(make_config(SYMBOLS=['BTCUSDT']))
+    calls = []
+    
+    async def fake_request(method, endpoint, params=None, sign_required=False, max_wait=None):
+        calls.append(endpoint)
+        return {'list': [INSTRUMENT]}
+        
+    collector.api._make_request = fake_request
+    return collector, calls
+
+def test_rounding_survives_metadata_ttl(monkeypatch):
+    now = [1_700_000_000.0]
+    collector, calls = make_collector(monkeypatch, now)
+    api = collector.api
+    
+    assert asyncio.run(collector.load_instruments())
+    assert api.round_price('BTCUSDT', 65000.123) == 65000.1
+    assert api.round_qty('BTCUSDT', 0.12345) == 0.123
+    assert not api.instruments_due()
+    
+    # TTL이 지나도 재조회 전까지 마지막 규격으로 반올림
+    now[0] += api.METADATA_TTLS['/v5/market/instruments-info'] + 1
+    assert api.instruments_due()
+    assert api.round_price('BTCUSDT', 65000.123) == 65000.1
+    assert api.round_qty('BTCUSDT', 0.12345) == 0.123
+    assert api.round_price('ETHUSDT', 3200.0) is None
+
+def test_refresh_instruments_only_when_due(monkeypatch):
+    now = [1_700_000_000.0]
+    collector, calls = make_collector(monkeypatch, now)
+    
+    async def run():
+        await collector.refresh_instruments()
+        await collector.refresh_instruments()
+        assert len(calls) == 1
+        
+        now[0] += collector.api.METADATA_TTLS['/v5/market/instruments-info'] + 1
+        await collector.refresh_instruments()
+        assert len(calls) == 2
+        assert not collector.api.instruments_due()
+        
+    asyncio.run(run())
+
+def test_update_cycle_refreshes_expired_instruments(monkeypatch):
+    now = [1_700_000_000.0]
+    collector, calls = make_collector(monkeypatch, now)
+    
+    async def ok(*args):
+        return True
+        
+    collector.refresh_tickers = ok
+    collector.update_symbol_data = ok
+    collector.api.clock.needs_sync = lambda: False
+    
+    async def run():
+        assert await collector.update_all_symbols() == {'BTCUSDT': True}
+        await collector.update_all_symbols()
+        assert calls == ['/v5/market/instruments-info']
+        
+        now[0] += collector.api.METADATA_TTLS['/v5/market/instruments-info'] + 1
+        await collector.update_all_symbols()
+        assert len(calls) == 2
+        
+    asyncio.run(run())
@@ -0,0 +1,157 @@
+# test_market_stream.py - 로컬 웹소켓 대역으로 캔들 스트림 / 재연결 보충 테스트
+import asyncio
+import json
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from conftest import FakeKlines, make_config
+from data_collector import DataCollector, TIMEFRAME_MS
+from market_stream import BybitPublicStream
+
+MINUTE = TIMEFRAME_MS['1']
+H4 = TIMEFRAME_MS['240']
+BOUNDARY = 1_700_006_400_000  # 4시간봉 경계
+
+def kline(timeframe, start, close, confirm):
+    """kline.{interval}.{symbol} 메시지"""
+    return {
+        'topic': f"kline.{timeframe}.BTCUSDT",
+        'data': [{
+            'start': start, 'open': '10', 'high': '30', 'low': '5', 'close': str(close),
+            'volume': '5', 'turnover': '50', 'confirm': confirm
+        }]
+    }
+
+class StandInServer:
+    """바이비트 퍼블릭 스트림 대역 (연결 순번별 메시지 전송 후 선택적으로 연결 끊기)"""
+    
+    def __init__(self, scripts=None, drop=(), reply_pong=True):
+        self.scripts = scripts or {}
+        self.drop = set(drop)
+        self.reply_pong = reply_pong
+        self.connections = 0
+        self.received = []
+        self.app = web.Application()
+        self.app.router.add_get('/ws', self.handler)
+    
+    async def handler(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        connection = self.connections
+        
+        async for msg in ws:
+            data = json.loads(msg.data)
+            self.received.append(data)
+            
+            if data['op'] == 'subscribe':
+                await ws.send_json({'op': 'subscribe', 'success': True})
+                for message in self.scripts.get(connection, []):
+                    await ws.send_json(message)
+                if connection in self.drop:
+                    await ws.close()
+            elif data['op'] == 'ping' and self.reply_pong:
+                await ws.send_json({'op': 'pong', 'success': True})
+        return ws
+
+async def wait_until(condition, timeout=5.0):
+    """조건이 참이 될 때까지 대기"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "시간 초과"
+        await asyncio.sleep(0.01)
+
+def make_collector(url):
+    collector = DataCollector(make_config(
+        SYMBOLS=['BTCUSDT'], TIMEFRAMES=['1', '240'], INTRABAR_TIMEFRAMES=['1'],
+        WS_PUBLIC_URL=url, WS_PING_INTERVAL=20.0
+    ))
+    collector._ensure_stream().reconnect_delay = 0.01
+    return collector
+
+def test_stream_upserts_klines_and_backfills_after_reconnect():
+    seeded_at = BOUNDARY - 10 * MINUTE
+    server = StandInServer(
+        scripts={1: [kline('1', seeded_at, 20, True), kline('1', seeded_at + MINUTE, 21, False)]},
+        drop=[1]
+    )
+    
+    async def run():
+        async with TestServer(server.app) as test_server:
+            collector = make_collector(str(test_server.make_url('/ws')))
+            fake = FakeKlines(seeded_at)
+            collector.api.get_kline_data = fake
+            collector.api.clock.now_ms = lambda: fake.now_ms
+            await collector.update_symbol_data('BTCUSDT')
+            
+            # 끊긴 동안 시간이 흘러 4시간봉 경계를 지남
+            fake.now_ms = BOUNDARY + 30_000
+            fake.calls.clear()
+            await collector.start_streaming()
+            
+            # 마감 후 1회 갱신 시간대는 구독하지 않음
+            assert collector.stream.topics == {'kline.1.BTCUSDT'}
+            
+            buffer = collector.symbol_data['BTCUSDT']['1']
+            await wait_until(lambda: collector.stream.stats['reconnects'] == 1 and fake.calls)
+            await wait_until(lambda: buffer.last_timestamp() == BOUNDARY)
+            
+            # 스트림 캔들 반영 후 마지막 저장 캔들 이후 구간만 REST로 보충
+            assert [call['interval'] for call in fake.calls] == ['1']
+            assert fake.calls[0]['start'] == seeded_at + MINUTE
+            timestamps = buffer.view('timestamp')
+            assert (timestamps[1:] - timestamps[:-1] == MINUTE).all()
+            assert buffer.view('close')[timestamps.tolist().index(seeded_at)] == 20.0
+            
+            subscribes = [message['args'] for message in server.received if message['op'] == 'subscribe']
+            assert subscribes == [['kline.1.BTCUSDT'], ['kline.1.BTCUSDT']]
+            assert collector.stream.is_connected
+            assert collector._polled_timeframes() == ['240']
+            await collector.stop_streaming()
+            
+    asyncio.run(run())
+
+def test_close_only_stream_ignores_unconfirmed_bars():
+    collector = make_collector('ws://127.0.0.1:1/ws')
+    collector._on_kline_message(kline('240', BOUNDARY, 42, False))
+    assert '240' not in collector.symbol_data.get('BTCUSDT', {})
+    
+    collector._on_kline_message(kline('240', BOUNDARY - H4, 41, True))
+    collector._on_kline_message(kline('1', BOUNDARY, 43, False))
+    assert collector.symbol_data['BTCUSDT']['240'].last_timestamp() == BOUNDARY - H4
+    assert collector.symbol_data['BTCUSDT']['1'].last_timestamp() == BOUNDARY
+
+def test_ping_keeps_connection_while_pongs_arrive():
+    server = StandInServer()
+    
+    async def run():
+        async with TestServer(server.app) as test_server:
+            stream = BybitPublicStream(str(test_server.make_url('/ws')), ping_interval=0.05)
+            await stream.subscribe(['kline.1.BTCUSDT'])
+            await stream.start()
+            await asyncio.sleep(0.4)
+            
+            assert sum(message['op'] == 'ping' for message in server.received) >= 3
+            assert stream.stats['connects'] == 1
+            assert stream.stats['stale_disconnects'] == 0
+            await stream.stop()
+            
+    asyncio.run(run())
+
+def test_silent_connection_is_dropped_and_reconnected():
+    server = StandInServer(reply_pong=False)
+    
+    async def run():
+        async with TestServer(server.app) as test_server:
+            stream = BybitPublicStream(str(test_server.make_url('/ws')), ping_interval=0.05,
+                                       reconnect_delay=0.01)
+            await stream.subscribe(['kline.1.BTCUSDT'])
+            await stream.start()
+            await wait_until(lambda: stream.stats['connects'] >= 2)
+            
+            assert stream.stats['stale_disconnects'] >= 1
+            assert server.connections >= 2
+            await stream.stop()
+            
+    asyncio.run(run())
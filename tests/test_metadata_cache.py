@@ -0,0 +1,50 @@
+# test_metadata_cache.py - 메타데이터 캐시 TTL / LRU / 파일 저장 테스트
+from data_collector import MetadataCache
+
+def test_entry_expires_after_ttl(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr('data_collector.time.time', lambda: now[0])
+    cache = MetadataCache()
+    cache.set('instruments', {'BTCUSDT': 0.1}, ttl=60.0)
+    
+    assert cache.get('instruments') == {'BTCUSDT': 0.1}
+    now[0] += 60.0
+    assert cache.get('instruments') is None
+    assert len(cache) == 0
+    assert cache.stats == {'hits': 1, 'misses': 1, 'evictions': 0}
+
+def test_least_recently_used_entry_is_evicted():
+    cache = MetadataCache(max_entries=2)
+    cache.set('a', 1, ttl=60.0)
+    cache.set('b', 2, ttl=60.0)
+    assert cache.get('a') == 1
+    
+    cache.set('c', 3, ttl=60.0)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats['evictions'] == 1
+
+def test_save_and_load_skip_expired_entries(tmp_path, monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr('data_collector.time.time', lambda: now[0])
+    path = str(tmp_path / 'cache' / 'metadata.json')
+    
+    cache = MetadataCache(path=path)
+    cache.set('short', 1, ttl=10.0)
+    cache.set('long', 2, ttl=100.0)
+    cache.save()
+    
+    now[0] += 50.0
+    restored = MetadataCache(path=path)
+    restored.load()
+    assert restored.get('long') == 2
+    assert restored.get('short') is None
+
+def test_load_ignores_corrupt_file(tmp_path):
+    path = tmp_path / 'metadata.json'
+    path.write_text('{broken')
+    
+    cache = MetadataCache(path=str(path))
+    cache.load()
+    assert len(cache) == 0
@@ -0,0 +1,132 @@
+# test_order_book.py - 호가창 스냅샷/델타/시퀀스 갭 테스트
+import asyncio
+import random
+
+from conftest import make_config
+from data_collector import DataCollector
+from order_book import BookSide, OrderBook
+
+TOPIC = 'orderbook.50.BTCUSDT'
+
+def snapshot(update_id: int):
+    return {'s': 'BTCUSDT', 'u': update_id, 'seq': update_id,
+            'b': [['100.0', '1'], ['99.5', '2'], ['99.0', '3']],
+            'a': [['100.5', '1'], ['101.0', '2']]}
+
+def delta(update_id: int, bids=(), asks=()):
+    return {'s': 'BTCUSDT', 'u': update_id, 'seq': update_id, 'b': list(bids), 'a': list(asks)}
+
+def test_snapshot_and_contiguous_deltas():
+    book = OrderBook('BTCUSDT', top_levels=2)
+    book.apply_snapshot(snapshot(10))
+    
+    assert book.best_bid == 100.0
+    assert book.best_ask == 100.5
+    
+    assert book.apply_delta(delta(11, bids=[['100.0', '0'], ['100.2', '4']], asks=[['100.4', '1']]))
+    assert book.top() == {'bids': [(100.2, 4.0), (99.5, 2.0)], 'asks': [(100.4, 1.0), (100.5, 1.0)]}
+    assert book.update_id == 11
+
+def test_gap_unsyncs_until_next_snapshot():
+    book = OrderBook('BTCUSDT')
+    book.apply_snapshot(snapshot(10))
+    
+    assert not book.apply_delta(delta(12, bids=[['98.0', '1']]))
+    assert not book.synced
+    assert book.stats['gaps'] == 1
+    
+    # 스냅샷 전 델타는 버림 (갭도 한 번만 계산)
+    assert not book.apply_delta(delta(13))
+    assert book.stats['gaps'] == 1
+    assert 98.0 not in book.bids.sizes
+    
+    book.apply_snapshot(snapshot(20))
+    assert book.synced
+    assert book.apply_delta(delta(21))
+
+def test_update_id_one_resets_book():
+    book = OrderBook('BTCUSDT')
+    book.apply_snapshot(snapshot(10))
+    
+    assert book.apply_delta({'u': 1, 'b': [['50.0', '1']], 'a': [['51.0', '1']]})
+    assert book.best_bid == 50.0
+    assert len(book.bids) == 1
+
+def test_book_side_matches_sorted_reference():
+    rng = random.Random(3)
+    bids = BookSide(descending=True)
+    asks = BookSide(descending=False)
+    reference = {}
+    
+    # 500레벨 깊이에서 추가/변경/삭제를 섞어 정렬 상태 유지 확인
+    for _ in range(5000):
+        price = 60000 + rng.randrange(500) * 0.5
+        size = rng.choice([0.0, 0.5, 1.0, 2.0])
+        bids.update(price, size)
+        asks.update(price, size)
+        if size == 0.0:
+            reference.pop(price, None)
+        else:
+            reference[price] = size
+            
+    assert len(bids) == len(asks) == len(reference)
+    assert bids.levels(10) == sorted(reference.items(), reverse=True)[:10]
+    assert asks.levels(10) == sorted(reference.items())[:10]
+
+class FakeStream:
+    """구독 요청만 기록하는 스트림"""
+    
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.requests = []
+    
+    async def unsubscribe(self, topics):
+        self.requests.append(('unsubscribe', topics))
+    
+    async def subscribe(self, topics):
+        if self.fail:
+            raise ConnectionError('closed')
+        self.requests.append(('subscribe', topics))
+
+def make_collector(stream: FakeStream) -> DataCollector:
+    collector = DataCollector(make_config(SYMBOLS=['BTCUSDT']))
+    collector.stream = stream
+    collector.order_books['BTCUSDT'] = OrderBook('BTCUSDT')
+    return collector
+
+def test_gap_resubscribes_once_until_snapshot():
+    stream = FakeStream()
+    collector = make_collector(stream)
+    
+    async def run():
+        collector._on_orderbook_message({'topic': TOPIC, 'type': 'snapshot', 'data': snapshot(10)})
+        collector._on_orderbook_message({'topic': TOPIC, 'type': 'delta', 'data': delta(12)})
+        collector._on_orderbook_message({'topic': TOPIC, 'type': 'delta', 'data': delta(13)})
+        await asyncio.sleep(0.01)
+        
+        assert stream.requests == [('unsubscribe', [TOPIC]), ('subscribe', [TOPIC])]
+        assert TOPIC in collector._resyncing
+        assert not collector._background_tasks
+        
+        collector._on_orderbook_message({'topic': TOPIC, 'type': 'snapshot', 'data': snapshot(30)})
+        assert TOPIC not in collector._resyncing
+        assert collector.order_books['BTCUSDT'].synced
+        
+    asyncio.run(run())
+
+def test_failed_resubscribe_retries_on_next_gap():
+    stream = FakeStream(fail=True)
+    collector = make_collector(stream)
+    
+    async def run():
+        collector._on_orderbook_message({'topic': TOPIC, 'type': 'snapshot', 'data': snapshot(10)})
+        collector._on_orderbook_message({'topic': TOPIC, 'type': 'delta', 'data': delta(12)})
+        await asyncio.sleep(0.01)
+        assert TOPIC not in collector._resyncing
+        
+        stream.fail = False
+        collector._on_orderbook_message({'topic': TOPIC, 'type': 'delta', 'data': delta(13)})
+        await asyncio.sleep(0.01)
+        assert ('subscribe', [TOPIC]) in stream.requests
+        
+    asyncio.run(run())
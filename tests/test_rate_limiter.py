@@ -0,0 +1,108 @@
+# test_rate_limiter.py - 토큰 버킷 / 우선순위 예약 / 서버 헤더 보정 테스트
+import asyncio
+import time
+
+import pytest
+
+from data_collector import (
+    PRIORITY_KLINE, PRIORITY_ORDER, RateLimiter, RequestDroppedError
+)
+
+def test_burst_passes_then_waits_for_refill():
+    async def run():
+        limiter = RateLimiter(6000, burst=5)  # 초당 100개
+        waits = [await limiter.acquire(priority=PRIORITY_ORDER) for _ in range(5)]
+        assert waits == [0.0] * 5
+        
+        # 버킷이 비면 한 토큰(10ms)만큼 대기
+        waited = await limiter.acquire(priority=PRIORITY_ORDER)
+        assert 0.005 <= waited < 0.5
+        assert limiter.stats['acquired'] == 6
+        assert limiter.stats['waited'] == 1
+        
+    asyncio.run(run())
+
+def test_low_priority_cannot_use_reserved_tokens():
+    async def run():
+        limiter = RateLimiter(60, burst=10)  # 캔들 하한 = 10 * (0.2 + 0.1 + 0.1)
+        assert limiter.floors[PRIORITY_KLINE] == pytest.approx(4.0)
+        assert limiter.floors[PRIORITY_ORDER] == 0.0
+        
+        for _ in range(6):
+            assert await limiter.acquire(priority=PRIORITY_KLINE) == 0.0
+            
+        # 캔들 요청은 예약분 앞에서 대기, 주문 요청은 즉시 통과
+        kline = asyncio.ensure_future(limiter.acquire(priority=PRIORITY_KLINE))
+        await asyncio.sleep(0.01)
+        assert not kline.done()
+        assert await limiter.acquire(priority=PRIORITY_ORDER) == 0.0
+        
+        kline.cancel()
+        await asyncio.gather(kline, return_exceptions=True)
+        
+    asyncio.run(run())
+
+def test_higher_priority_waiter_wakes_first():
+    async def run():
+        limiter = RateLimiter(1200, burst=1, reserves={})  # 초당 20개
+        await limiter.acquire(priority=PRIORITY_ORDER)
+        
+        order = []
+        
+        async def request(priority):
+            await limiter.acquire(priority=priority)
+            order.append(priority)
+            
+        kline = asyncio.ensure_future(request(PRIORITY_KLINE))
+        await asyncio.sleep(0)
+        urgent = asyncio.ensure_future(request(PRIORITY_ORDER))
+        await asyncio.gather(kline, urgent)
+        
+        assert order == [PRIORITY_ORDER, PRIORITY_KLINE]
+        
+    asyncio.run(run())
+
+def test_waiter_dropped_after_max_wait():
+    async def run():
+        limiter = RateLimiter(60, burst=1)  # 초당 1개
+        await limiter.acquire(priority=PRIORITY_ORDER)
+        
+        with pytest.raises(RequestDroppedError):
+            await limiter.acquire(priority=PRIORITY_KLINE, max_wait=0.05)
+            
+        assert limiter.stats['dropped'] == 1
+        assert limiter.class_stats['kline']['dropped'] == 1
+        assert limiter.get_status()['waiting'] == 0
+        
+    asyncio.run(run())
+
+def test_headers_lower_tokens_and_block_until_reset():
+    limiter = RateLimiter(600, burst=10)
+    
+    limiter.update_from_headers({'X-Bapi-Limit-Status': '3'})
+    assert limiter.tokens == pytest.approx(3.0, abs=0.1)
+    assert limiter.blocked_until == 0.0
+    
+    reset_ms = int((time.time() + 2.0) * 1000)
+    limiter.update_from_headers({
+        'X-Bapi-Limit-Status': '0',
+        'X-Bapi-Limit-Reset-Timestamp': str(reset_ms)
+    })
+    assert limiter.tokens == 0.0
+    assert 1.0 < limiter.blocked_until - time.monotonic() <= 2.0
+    assert limiter.stats['server_throttled'] == 1
+    
+    # 형식이 잘못된 헤더는 무시
+    limiter.update_from_headers({'X-Bapi-Limit-Status': 'n/a'})
+    assert limiter.stats['server_throttled'] == 1
+
+def test_malformed_reset_timestamp_is_ignored():
+    limiter = RateLimiter(600, burst=10)
+    
+    limiter.update_from_headers({
+        'X-Bapi-Limit-Status': '0',
+        'X-Bapi-Limit-Reset-Timestamp': 'soon'
+    })
+    assert limiter.tokens == 0.0
+    assert limiter.blocked_until == 0.0
+    assert limiter.stats['server_throttled'] == 0
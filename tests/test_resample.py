@@ -0,0 +1,72 @@
+# test_resample.py - 상위 시간대 로컬 집계 / 거래소 대조 테스트
+import asyncio
+
+import numpy as np
+
+from conftest import FakeKlines, make_config
+from data_collector import DataCollector, decode_klines, resample_candles, TIMEFRAME_MS
+
+M5 = TIMEFRAME_MS['5']
+BOUNDARY = 1_700_006_400_000
+
+def to_klines(columns):
+    """컬럼 배열을 바이비트 K-라인 응답 형식(최신순 문자열)으로 변환"""
+    rows = np.column_stack([columns[name] for name in
+                            ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover']])
+    return [[str(int(row[0]))] + [repr(float(value)) for value in row[1:]] for row in rows[::-1]]
+
+def make_collector(now_ms: int):
+    collector = DataCollector(make_config(SYMBOLS=['BTCUSDT'], TIMEFRAMES=['1', '5'],
+                                          INTRABAR_TIMEFRAMES=['1'], RESAMPLE_ENABLED=True))
+    minute = FakeKlines(now_ms)
+    
+    async def get_kline_data(symbol, interval, limit=200, start=None, end=None, max_wait=None):
+        if interval == '1':
+            return await minute(symbol, interval, limit, start, end, max_wait)
+            
+        # 거래소 5분봉 = 같은 1분봉 집계, 진행 중 캔들은 로컬보다 이후 체결이 반영된 값
+        base = decode_klines(await minute(symbol, '1', 1000))
+        columns = resample_candles(base, M5)
+        columns['volume'][-1] += 50.0
+        columns = {name: values[-limit:] for name, values in columns.items()}
+        return to_klines(columns)
+        
+    collector.api.get_kline_data = get_kline_data
+    collector.api.clock.now_ms = lambda: minute.now_ms
+    return collector
+
+def test_resampled_timeframe_follows_base_series():
+    collector = make_collector(BOUNDARY + 7 * 60_000 + 30_000)
+    
+    async def run():
+        await collector.update_symbol_data('BTCUSDT')
+        minute = collector.symbol_data['BTCUSDT']['1']
+        five = collector.symbol_data['BTCUSDT']['5']
+        
+        assert five.last_timestamp() == BOUNDARY + M5
+        
+        # 진행 중 5분봉 = 진행 중 1분봉까지 합산
+        window = minute.since(BOUNDARY + M5)
+        assert five.view('volume')[-1] == window['volume'].sum()
+        assert five.view('close')[-1] == window['close'][-1]
+        
+    asyncio.run(run())
+
+def test_reconcile_ignores_in_progress_bar():
+    collector = make_collector(BOUNDARY + 7 * 60_000 + 30_000)
+    
+    async def run():
+        # 첫 갱신에서 대조 주기가 도래해 1회 대조됨
+        await collector.update_symbol_data('BTCUSDT')
+        five = collector.symbol_data['BTCUSDT']['5']
+        local_volume = five.view('volume')[-1]
+        
+        async with collector.api as api:
+            await collector._reconcile_derived(api, 'BTCUSDT')
+            
+        # 마감된 캔들은 일치, 진행 중 캔들은 대조/병합 대상이 아님
+        assert collector.resample_stats['reconciled'] == 2
+        assert collector.resample_stats['mismatches'] == 0
+        assert five.view('volume')[-1] == local_volume
+        
+    asyncio.run(run())
@@ -0,0 +1,74 @@
+# test_scheduler.py - 캔들 마감 기반 스케줄러 / 델타 조회 테스트
+import asyncio
+
+from conftest import FakeKlines, make_config
+from data_collector import DataCollector, RefreshScheduler, TIMEFRAME_MS
+
+H4 = TIMEFRAME_MS['240']
+BOUNDARY = 1_700_006_400_000  # 4시간봉 경계
+
+def make_collector(now_ms: int):
+    collector = DataCollector(make_config(SYMBOLS=['BTCUSDT'], TIMEFRAMES=['1', '240'],
+                                          INTRABAR_TIMEFRAMES=['1']))
+    fake = FakeKlines(now_ms)
+    collector.api.get_kline_data = fake
+    collector.api.clock.now_ms = lambda: fake.now_ms
+    return collector, fake
+
+def test_close_only_timeframe_due_once_after_close_delay():
+    scheduler = RefreshScheduler(['1', '240'], ['1'], close_delay=2.0)
+    
+    assert scheduler.due_timeframes('BTCUSDT', now_ms=BOUNDARY + 1_000) == ['1']
+    assert scheduler.due_timeframes('BTCUSDT', now_ms=BOUNDARY + 2_000) == ['1', '240']
+    
+    scheduler.mark_refreshed('BTCUSDT', '240', now_ms=BOUNDARY + 2_000)
+    assert scheduler.due_timeframes('BTCUSDT', now_ms=BOUNDARY + H4 - 1) == ['1']
+    assert scheduler.due_timeframes('BTCUSDT', now_ms=BOUNDARY + H4 + 2_000) == ['1', '240']
+
+def test_close_only_timeframe_stores_closed_bars_only():
+    collector, fake = make_collector(BOUNDARY + 2_500)
+    
+    async def run():
+        await collector.update_symbol_data('BTCUSDT')
+        buffer = collector.symbol_data['BTCUSDT']['240']
+        
+        # 마감 직후 조회해도 진행 중(2.5초짜리) 캔들은 저장하지 않음
+        assert buffer.last_timestamp() == BOUNDARY - H4
+        assert buffer.view('volume')[-1] == 100.0
+        
+        # 진행 중 캔들을 쓰는 시간대는 현재 캔들까지 저장
+        assert collector.symbol_data['BTCUSDT']['1'].last_timestamp() == BOUNDARY
+        
+        # 다음 마감 전까지는 다시 조회하지 않고, 마감 후 델타로 새 마감 캔들만 추가
+        fake.now_ms = BOUNDARY + H4 - 60_000
+        await collector.update_symbol_data('BTCUSDT')
+        assert [call['interval'] for call in fake.calls].count('240') == 1
+        
+        fake.now_ms = BOUNDARY + H4 + 2_500
+        await collector.update_symbol_data('BTCUSDT')
+        assert [call for call in fake.calls if call['interval'] == '240'][-1]['start'] == BOUNDARY - H4
+        assert buffer.last_timestamp() == BOUNDARY
+        assert buffer.view('volume')[-1] == 100.0
+        assert len(buffer) == 200
+        
+    asyncio.run(run())
+
+def test_delta_fetch_starts_at_last_stored_bar():
+    collector, fake = make_collector(BOUNDARY + 30_000)
+    
+    async def run():
+        await collector.update_symbol_data('BTCUSDT')
+        minute = collector.symbol_data['BTCUSDT']['1']
+        assert minute.last_timestamp() == BOUNDARY
+        
+        fake.now_ms = BOUNDARY + 3 * 60_000 + 30_000
+        fake.calls.clear()
+        await collector.update_symbol_data('BTCUSDT')
+        
+        call = next(call for call in fake.calls if call['interval'] == '1')
+        assert call['start'] == BOUNDARY
+        assert call['limit'] == 4
+        assert minute.last_timestamp() == BOUNDARY + 3 * 60_000
+        assert collector.fetch_stats['delta'] == 1
+        
+    asyncio.run(run())
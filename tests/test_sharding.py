@@ -0,0 +1,109 @@
+# test_sharding.py - 심볼 샤딩 분할/재배치/주기 병합 테스트
+import asyncio
+
+import pytest
+
+pytest.importorskip('talib')
+
+from conftest import make_config
+from data_collector import DataCollector
+from indicator_engine import IndicatorResult
+from sharding import ShardPool, pack_results, partition, unpack_results
+
+def test_partition_round_robin():
+    assert partition(['A', 'B', 'C', 'D', 'E'], 2) == [['A', 'C', 'E'], ['B', 'D']]
+
+def test_pack_round_trip():
+    results = [IndicatorResult('RSI_14', 55.5, 'NEUTRAL', 0.2, '5', 1_700_000_000_000)]
+    assert unpack_results(pack_results(results)) == results
+
+def make_pool(workers: int, replies):
+    """워커 대신 replies(shard_id, command, argument)가 응답하는 풀"""
+    pool = ShardPool(make_config(), workers)
+    requests = []
+    
+    async def request(shard_id, command, argument=None):
+        requests.append((shard_id, command, argument))
+        reply = replies(shard_id, command, argument)
+        if isinstance(reply, BaseException):
+            raise reply
+        return reply
+        
+    pool._request = request
+    return pool, requests
+
+def test_rebalance_removes_before_adding_and_evens_load():
+    pool, requests = make_pool(3, lambda shard_id, command, argument: argument)
+    pool.assignment = [['A', 'D'], ['B', 'E'], ['C', 'F']]
+    
+    asyncio.run(pool.rebalance(['A', 'B', 'C', 'F', 'G', 'H', 'I']))
+    
+    # 추가 심볼은 가장 적은 샤드로, 제외 요청을 모두 보낸 뒤 추가 요청
+    assert pool.assignment == [['A', 'G', 'I'], ['B', 'H'], ['C', 'F']]
+    assert requests == [
+        (0, 'assign', ['A']),
+        (1, 'assign', ['B']),
+        (0, 'assign', ['A', 'G', 'I']),
+        (1, 'assign', ['B', 'H'])
+    ]
+
+def test_rebalance_moves_symbols_from_heaviest_shard():
+    pool, requests = make_pool(2, lambda shard_id, command, argument: argument)
+    pool.assignment = [['A', 'B', 'C', 'D'], ['E']]
+    
+    asyncio.run(pool.rebalance(['A', 'B', 'C', 'D', 'E']))
+    
+    # 이동 심볼은 이전 샤드가 먼저 내려놓음 (캐시 저장 후 새 샤드가 로드)
+    assert pool.assignment == [['A', 'B', 'C'], ['E', 'D']]
+    assert requests == [(0, 'assign', ['A', 'B', 'C']), (1, 'assign', ['E', 'D'])]
+    assert pool.stats['moved'] == 1
+
+def test_rebalance_without_changes_sends_nothing():
+    pool, requests = make_pool(2, lambda shard_id, command, argument: argument)
+    pool.assignment = [['A', 'C'], ['B']]
+    
+    asyncio.run(pool.rebalance(['A', 'B', 'C']))
+    assert requests == []
+
+def cycle_reply(symbols, stale_series=()):
+    return {'status': {symbol: True for symbol in symbols}, 'stale': [],
+            'stale_series': list(stale_series), 'indicators': {}}
+
+def make_parent() -> DataCollector:
+    """캔들을 직접 수집하지 않는 샤딩 부모 (최근 요청은 모두 성공)"""
+    collector = DataCollector(make_config(SYMBOLS=['A', 'B']))
+    for _ in range(5):
+        collector.api.health.record(True, 10.0)
+    return collector
+
+def test_sharded_cycle_with_healthy_workers_is_healthy():
+    pool, _ = make_pool(2, lambda shard_id, command, argument: cycle_reply(pool.assignment[shard_id]))
+    pool.assignment = [['A'], ['B']]
+    parent = make_parent()
+    
+    async def run():
+        status, stale, _ = await pool.run_cycle()
+        assert status == {'A': True, 'B': True}
+        assert pool.stale_series == []
+        assert await parent.health_check(pool.stale_series)
+        
+    asyncio.run(run())
+
+def test_sharded_cycle_reports_worker_staleness():
+    def replies(shard_id, command, argument):
+        if shard_id == 1:
+            return ConnectionError('worker exited')
+        return cycle_reply(['A'], [('A', '240')])
+        
+    pool, _ = make_pool(2, replies)
+    pool.assignment = [['A'], ['B']]
+    parent = make_parent()
+    
+    async def run():
+        status, _, _ = await pool.run_cycle()
+        assert status == {'A': True, 'B': False}
+        assert ('A', '240') in pool.stale_series
+        assert ('B', '1') in pool.stale_series
+        assert not await parent.health_check(pool.stale_series)
+        
+    asyncio.run(run())
@@ -0,0 +1,37 @@
+# test_ticker_table.py - 티커 스냅샷 테이블 테스트
+from data_collector import TickerTable
+
+TICKERS = [
+    {'symbol': 'BTCUSDT', 'lastPrice': '65000.5', 'turnover24h': '1200000000', 'fundingRate': '0.0001'},
+    {'symbol': 'ETHUSDT', 'lastPrice': '3200', 'turnover24h': '', 'bid1Price': '3199.9'}
+]
+
+def test_load_parses_columns_once():
+    table = TickerTable()
+    table.load(TICKERS)
+    
+    assert len(table) == 2
+    assert 'ETHUSDT' in table
+    assert table.symbols() == ['BTCUSDT', 'ETHUSDT']
+    assert table.columns['last_price'].tolist() == [65000.5, 3200.0]
+    assert table.raw['BTCUSDT'] is TICKERS[0]
+    assert table.updated_at is not None
+
+def test_missing_or_empty_fields_are_none():
+    table = TickerTable()
+    table.load(TICKERS)
+    
+    assert table.get('BTCUSDT', 'funding_rate') == 0.0001
+    assert table.get('ETHUSDT', 'bid_price') == 3199.9
+    assert table.get('ETHUSDT', 'turnover_24h') is None
+    assert table.get('ETHUSDT', 'funding_rate') is None
+    assert table.get('SOLUSDT', 'last_price') is None
+
+def test_reload_replaces_symbols():
+    table = TickerTable()
+    table.load(TICKERS)
+    table.load([{'symbol': 'SOLUSDT', 'lastPrice': '150'}])
+    
+    assert table.symbols() == ['SOLUSDT']
+    assert table.get('BTCUSDT', 'last_price') is None
+    assert table.get('SOLUSDT', 'last_price') == 150.0
@@ -0,0 +1,88 @@
+# test_trade_tape.py - 체결 집계 / 주문 흐름 재집계 테스트
+import numpy as np
+import pytest
+
+from trade_tape import FlowBuffer, FLOW_VALUES, TradeAccumulator, TradeTape, resample_flow
+
+def trade(timestamp, side, size, price=100.0):
+    """publicTrade 체결 1건"""
+    return {'T': timestamp, 'S': side, 'v': str(size), 'p': str(price)}
+
+def test_bar_closes_on_next_interval_trade():
+    acc = TradeAccumulator('BTCUSDT', interval_ms=1000, large_notional=500.0)
+    assert acc.add_trades([trade(100, 'Buy', 2), trade(900, 'Sell', 6)]) == 0
+    assert len(acc.bars) == 0
+    assert acc.current_bar()['delta'] == -4.0
+    
+    # 다음 구간 체결이 오면 이전 바 마감
+    assert acc.add_trades([trade(1500, 'Buy', 1), trade(2100, 'Buy', 3)]) == 2
+    bars = acc.bars.columns()
+    assert bars['timestamp'].tolist() == [0, 1000]
+    assert bars['buy_volume'].tolist() == [2.0, 1.0]
+    assert bars['sell_volume'].tolist() == [6.0, 0.0]
+    assert bars['trades'].tolist() == [2.0, 1.0]
+    assert bars['large_trades'].tolist() == [1.0, 0.0]  # 6 * 100 >= 500
+    assert acc.current_bar()['timestamp'] == 2000
+
+def test_cvd_accumulates_across_bars():
+    acc = TradeAccumulator('BTCUSDT', interval_ms=1000)
+    acc.add_trades([trade(0, 'Buy', 5), trade(1000, 'Sell', 2), trade(2000, 'Buy', 1)])
+    
+    bars = acc.bars.columns()
+    assert bars['delta'].tolist() == [5.0, -2.0]
+    assert bars['cvd'].tolist() == [5.0, 3.0]
+    assert acc.current_bar()['cvd'] == 4.0
+    assert acc.get_status()['cvd'] == 4.0
+    
+    # 진행 중 바 포함 여부
+    assert acc.get_arrays()['cvd'].tolist() == [5.0, 3.0, 4.0]
+    assert acc.get_arrays(include_current=False)['cvd'].tolist() == [5.0, 3.0]
+
+def test_late_trade_counts_toward_current_bar():
+    acc = TradeAccumulator('BTCUSDT', interval_ms=1000)
+    acc.add_trades([trade(500, 'Buy', 1), trade(1200, 'Buy', 1)])
+    
+    acc.add_trades([trade(900, 'Sell', 3)])
+    assert acc.late_trades == 1
+    assert len(acc.bars) == 1
+    assert acc.bars.columns()['sell_volume'].tolist() == [0.0]
+    assert acc.current_bar()['sell_volume'] == 3.0
+
+def test_resample_flow_sums_volume_and_keeps_last_cvd():
+    acc = TradeAccumulator('BTCUSDT', interval_ms=1000)
+    for second, side in enumerate(['Buy', 'Sell', 'Buy', 'Buy', 'Sell']):
+        acc.add_trades([trade(second * 1000, side, second + 1)])
+        
+    resampled = acc.get_arrays(interval_ms=3000)
+    assert resampled['timestamp'].tolist() == [0, 3000]
+    assert resampled['buy_volume'].tolist() == [4.0, 4.0]
+    assert resampled['sell_volume'].tolist() == [2.0, 5.0]
+    assert resampled['trades'].tolist() == [3.0, 2.0]
+    assert resampled['cvd'].tolist() == [2.0, 1.0]
+    
+    empty = resample_flow({name: values[:0] for name, values in resampled.items()}, 3000)
+    assert all(len(values) == 0 for values in empty.values())
+
+def test_flow_buffer_keeps_latest_bars():
+    buffer = FlowBuffer(3)
+    for timestamp in range(5):
+        buffer.append(timestamp, [timestamp] * len(FLOW_VALUES))
+        
+    columns = buffer.columns()
+    assert columns['timestamp'].tolist() == [2, 3, 4]
+    assert columns['cvd'].tolist() == [2.0, 3.0, 4.0]
+    assert not columns['delta'].flags.writeable
+    
+    with pytest.raises(ValueError):
+        FlowBuffer(0)
+
+def test_tape_routes_messages_by_topic():
+    tape = TradeTape(interval_ms=1000)
+    tape.add_symbol('BTCUSDT')
+    
+    tape.on_message({'topic': 'publicTrade.BTCUSDT', 'data': [trade(0, 'Buy', 1), trade(1000, 'Buy', 1)]})
+    tape.on_message({'topic': 'publicTrade.ETHUSDT', 'data': [trade(0, 'Buy', 1)]})
+    
+    assert tape.stats == {'messages': 1, 'trades': 2, 'bars_closed': 1}
+    assert tape.get_arrays('ETHUSDT') is None
+    assert np.array_equal(tape.get_arrays('BTCUSDT')['timestamp'], [0, 1000])
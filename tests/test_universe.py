@@ -0,0 +1,65 @@
+# test_universe.py - 심볼 유니버스 순위화 / 구성 갱신 테스트
+from data_collector import TickerTable
+from universe import UniverseManager
+
+TRADING = {'status': 'Trading', 'contractType': 'LinearPerpetual'}
+
+def ticker(symbol, turnover, high=110.0, low=90.0, last=100.0):
+    return {
+        'symbol': symbol, 'turnover24h': str(turnover), 'lastPrice': str(last),
+        'highPrice24h': str(high), 'lowPrice24h': str(low)
+    }
+
+def ranked(*symbols):
+    """순위 목록 (앞쪽이 높은 점수)"""
+    return [(symbol, 1.0 - i / 100) for i, symbol in enumerate(symbols)]
+
+def test_rank_filters_ineligible_and_orders_by_score():
+    table = TickerTable()
+    table.load([
+        ticker('BTCUSDT', 9e9, high=101.0, low=99.0),
+        ticker('ETHUSDT', 5e9, high=120.0, low=80.0),
+        ticker('DOGEUSDT', 1e3),
+        ticker('BTCUSDC', 9e9),
+        ticker('BTCUSDT-27DEC', 9e9),
+        ticker('OLDUSDT', 9e9)
+    ])
+    instruments = {
+        'BTCUSDT': TRADING, 'ETHUSDT': TRADING, 'DOGEUSDT': TRADING, 'BTCUSDC': TRADING,
+        'BTCUSDT-27DEC': {'status': 'Trading', 'contractType': 'LinearFutures'},
+        'OLDUSDT': {'status': 'Closed'}
+    }
+    manager = UniverseManager(size=5, min_turnover=1e6, volatility_weight=0.3)
+    
+    scores = manager.rank(table, instruments)
+    
+    # 거래대금 가중치가 더 크므로 BTC가 앞, 거래대금 미달/비대상 계약은 제외
+    assert [symbol for symbol, _ in scores] == ['BTCUSDT', 'ETHUSDT']
+    assert manager.listed == {'BTCUSDT', 'ETHUSDT', 'DOGEUSDT'}
+
+def test_select_keeps_members_within_retire_buffer():
+    manager = UniverseManager(size=2, retire_buffer=0.5, pinned=[])
+    manager.select(ranked('A', 'B', 'C', 'D'))
+    assert manager.members == ['A', 'B']
+    
+    # 3위(B)는 완충 순위(3) 안이라 유지, 4위(A)는 제외
+    added, retired = manager.select(ranked('C', 'D', 'B', 'A'))
+    assert manager.members == ['B', 'C']
+    assert added == ['C']
+    assert retired == ['A']
+    assert manager.stats == {'refreshes': 2, 'added': 3, 'retired': 1}
+
+def test_pinned_symbols_stay_while_listed():
+    manager = UniverseManager(size=2, retire_buffer=0.0, pinned=['BTCUSDT', 'GONEUSDT'])
+    manager.listed = {'BTCUSDT', 'A', 'B'}
+    
+    manager.select(ranked('A', 'B', 'BTCUSDT'))
+    assert manager.members == ['BTCUSDT', 'A']
+
+def test_empty_ranking_keeps_members():
+    manager = UniverseManager(size=2, pinned=[])
+    manager.select(ranked('A', 'B'))
+    
+    assert manager.select([]) == ([], [])
+    assert manager.members == ['A', 'B']
+    assert not manager.is_due(3600.0)
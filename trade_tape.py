@@ -0,0 +1,229 @@
+# trade_tape.py - 체결 테이프 집계 모듈
+import time
+import numpy as np
+from typing import Dict, List, Any, Optional
+
+# 주문 흐름 컬럼 (캔들과 같은 시작 시각 기준, 시간 오름차순)
+FLOW_COLUMNS = ['timestamp', 'buy_volume', 'sell_volume', 'delta', 'cvd', 'trades', 'large_trades']
+FLOW_VALUES = FLOW_COLUMNS[1:]
+
+class FlowBuffer:
+    """마감된 주문 흐름 바 고정 용량 링 버퍼 (미러링으로 항상 연속된 뷰 제공)"""
+    
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다!")
+            
+        self.capacity = capacity
+        self._timestamps = np.zeros(capacity * 2, dtype=np.int64)
+        self._values = np.zeros((len(FLOW_VALUES), capacity * 2), dtype=np.float64)
+        self._start = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, timestamp: int, values) -> None:
+        """바 추가 - O(1) (가득 차면 가장 오래된 바 제거)"""
+        if self._size < self.capacity:
+            position = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            position = self._start
+            self._start = (self._start + 1) % self.capacity
+            
+        mirror = position + self.capacity
+        self._timestamps[position] = self._timestamps[mirror] = timestamp
+        self._values[:, position] = values
+        self._values[:, mirror] = values
+    
+    def columns(self) -> Dict[str, np.ndarray]:
+        """컬럼별 읽기 전용 뷰 (다음 append 전까지 유효)"""
+        end = self._start + self._size
+        columns = {'timestamp': self._timestamps[self._start:end]}
+        for row, name in enumerate(FLOW_VALUES):
+            columns[name] = self._values[row, self._start:end]
+        for values in columns.values():
+            values.flags.writeable = False
+        return columns
+
+class TradeAccumulator:
+    """심볼 1개 체결 집계 (진행 중 바는 스칼라 누적, 마감 시 링 버퍼에 1회 기록)"""
+    
+    def __init__(self, symbol: str, interval_ms: int = 60_000, capacity: int = 1440,
+                 large_notional: float = 100_000.0):
+        self.symbol = symbol
+        self.interval_ms = interval_ms
+        self.large_notional = large_notional
+        self.bars = FlowBuffer(capacity)
+        
+        # 진행 중 바
+        self.bar_start: Optional[int] = None
+        self.buy_volume = 0.0
+        self.sell_volume = 0.0
+        self.trades = 0
+        self.large_trades = 0
+        
+        # 누적 거래량 델타 (테이프 시작 이후, 마감 바에는 바 종료 시점 값 기록)
+        self.cvd = 0.0
+        self.last_trade_at: Optional[int] = None
+        self.late_trades = 0
+    
+    def add_trades(self, trades: List[Dict[str, Any]]) -> int:
+        """publicTrade 메시지의 체결 목록 반영, 마감된 바 개수 반환"""
+        interval_ms = self.interval_ms
+        large_notional = self.large_notional
+        bar_start = self.bar_start
+        bar_end = bar_start + interval_ms if bar_start is not None else None
+        buy = self.buy_volume
+        sell = self.sell_volume
+        count = self.trades
+        large = self.large_trades
+        closed = 0
+        
+        # 체결마다 객체를 만들지 않도록 지역 변수로 누적 후 메시지 끝에서 한 번만 저장
+        for trade in trades:
+            timestamp = int(trade['T'])
+            
+            if bar_end is None or timestamp >= bar_end:
+                if bar_start is not None:
+                    self._close_bar(bar_start, buy, sell, count, large)
+                    closed += 1
+                bar_start = timestamp // interval_ms * interval_ms
+                bar_end = bar_start + interval_ms
+                buy = sell = 0.0
+                count = large = 0
+            elif timestamp < bar_start:
+                # 이미 마감된 바의 지연 체결은 진행 중 바에 합산
+                self.late_trades += 1
+                
+            size = float(trade['v'])
+            if trade['S'] == 'Buy':
+                buy += size
+            else:
+                sell += size
+            count += 1
+            if size * float(trade['p']) >= large_notional:
+                large += 1
+            self.last_trade_at = timestamp
+            
+        self.bar_start = bar_start
+        self.buy_volume = buy
+        self.sell_volume = sell
+        self.trades = count
+        self.large_trades = large
+        return closed
+    
+    def _close_bar(self, bar_start: int, buy: float, sell: float, count: int, large: int):
+        """진행 중 바 마감"""
+        delta = buy - sell
+        self.cvd += delta
+        self.bars.append(bar_start, (buy, sell, delta, self.cvd, count, large))
+    
+    def current_bar(self) -> Optional[Dict[str, float]]:
+        """진행 중 바 (아직 체결이 없으면 None)"""
+        if self.bar_start is None:
+            return None
+            
+        delta = self.buy_volume - self.sell_volume
+        return {
+            'timestamp': self.bar_start,
+            'buy_volume': self.buy_volume,
+            'sell_volume': self.sell_volume,
+            'delta': delta,
+            'cvd': self.cvd + delta,
+            'trades': self.trades,
+            'large_trades': self.large_trades
+        }
+    
+    def get_arrays(self, interval_ms: Optional[int] = None,
+                   include_current: bool = True) -> Dict[str, np.ndarray]:
+        """주문 흐름 컬럼 (interval_ms가 기본 간격의 배수면 재집계)"""
+        columns = self.bars.columns()
+        
+        current = self.current_bar() if include_current else None
+        if current is not None:
+            columns = {
+                name: np.append(values, current[name]) for name, values in columns.items()
+            }
+            
+        if interval_ms is None or interval_ms == self.interval_ms:
+            return columns
+        return resample_flow(columns, interval_ms)
+    
+    def get_status(self) -> Dict[str, Any]:
+        """상태 반환"""
+        return {
+            'bars': len(self.bars),
+            'cvd': round(self.cvd + self.buy_volume - self.sell_volume, 6),
+            'late_trades': self.late_trades,
+            'last_trade_at': self.last_trade_at
+        }
+
+def resample_flow(columns: Dict[str, np.ndarray], interval_ms: int) -> Dict[str, np.ndarray]:
+    """주문 흐름 바를 상위 간격으로 재집계 (거래량/건수는 합계, CVD는 마지막 값)"""
+    timestamps = columns['timestamp']
+    if len(timestamps) == 0:
+        return {name: values.copy() for name, values in columns.items()}
+        
+    buckets = timestamps // interval_ms * interval_ms
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+    
+    resampled = {'timestamp': buckets[starts]}
+    for name in FLOW_VALUES:
+        if name == 'cvd':
+            resampled[name] = columns[name][ends]
+        else:
+            resampled[name] = np.add.reduceat(columns[name], starts)
+    return resampled
+
+class TradeTape:
+    """publicTrade 스트림 심볼별 집계"""
+    
+    def __init__(self, interval_ms: int = 60_000, capacity: int = 1440,
+                 large_notional: float = 100_000.0):
+        self.interval_ms = interval_ms
+        self.capacity = capacity
+        self.large_notional = large_notional
+        self.accumulators: Dict[str, TradeAccumulator] = {}
+        
+        # 통계
+        self.stats = {'messages': 0, 'trades': 0, 'bars_closed': 0}
+        self.started_at = time.time()
+    
+    def add_symbol(self, symbol: str) -> TradeAccumulator:
+        """심볼 집계기 추가"""
+        if symbol not in self.accumulators:
+            self.accumulators[symbol] = TradeAccumulator(
+                symbol, self.interval_ms, self.capacity, self.large_notional
+            )
+        return self.accumulators[symbol]
+    
+    def on_message(self, message: Dict[str, Any]):
+        """publicTrade.{symbol} 메시지 반영"""
+        symbol = message['topic'].split('.', 1)[1]
+        accumulator = self.accumulators.get(symbol)
+        if accumulator is None:
+            return
+            
+        trades = message.get('data', [])
+        self.stats['bars_closed'] += accumulator.add_trades(trades)
+        self.stats['messages'] += 1
+        self.stats['trades'] += len(trades)
+    
+    def get_arrays(self, symbol: str, interval_ms: Optional[int] = None) -> Optional[Dict[str, np.ndarray]]:
+        """심볼 주문 흐름 컬럼"""
+        accumulator = self.accumulators.get(symbol)
+        if accumulator is None or accumulator.bar_start is None:
+            return None
+        return accumulator.get_arrays(interval_ms)
+    
+    def get_status(self) -> Dict[str, Any]:
+        """상태 반환"""
+        elapsed = max(time.time() - self.started_at, 1e-9)
+        return {
+            **self.stats,
+            'trades_per_second': round(self.stats['trades'] / elapsed, 1),
+            'symbols': {symbol: acc.get_status() for symbol, acc in self.accumulators.items()}
+        }
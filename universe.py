@@ -0,0 +1,109 @@
+# universe.py - 거래 심볼 유니버스 관리 모듈
+import time
+import numpy as np
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+class UniverseManager:
+    """전체 USDT 무기한 심볼을 24시간 거래대금/변동성으로 순위화해 상위 N개 유지"""
+    
+    def __init__(self, size: int = 50, min_turnover: float = 5_000_000.0,
+                 volatility_weight: float = 0.3, retire_buffer: float = 0.2,
+                 pinned: Optional[List[str]] = None):
+        self.size = size
+        self.min_turnover = min_turnover
+        self.volatility_weight = volatility_weight
+        self.retire_buffer = retire_buffer  # 기존 심볼은 size * (1 + buffer) 순위까지 유지 (잦은 교체 방지)
+        self.pinned = list(pinned or [])  # 순위와 무관하게 상장 중이면 항상 유지
+        
+        self.members: List[str] = []
+        self.listed: Set[str] = set()
+        self.scores: Dict[str, float] = {}
+        self.refreshed_at: Optional[float] = None
+        
+        # 통계
+        self.stats = {'refreshes': 0, 'added': 0, 'retired': 0}
+    
+    @staticmethod
+    def is_eligible(symbol: str, instrument: Optional[Dict]) -> bool:
+        """거래 중인 USDT 무기한 계약 여부 (만기 선물/USDC 계약 제외)"""
+        if instrument is None or not symbol.endswith('USDT'):
+            return False
+        return instrument.get('status') == 'Trading' and \
+            instrument.get('contractType', 'LinearPerpetual') == 'LinearPerpetual'
+    
+    def rank(self, tickers, instruments: Dict[str, Dict]) -> List[Tuple[str, float]]:
+        """티커 스냅샷 1회로 전체 심볼 점수화 (거래대금/변동성 백분위 가중합, 내림차순)"""
+        names = np.array(tickers.symbols())
+        if len(names) == 0:
+            return []
+            
+        eligible = np.array([self.is_eligible(symbol, instruments.get(symbol)) for symbol in names])
+        self.listed = set(names[eligible].tolist())
+        
+        columns = tickers.columns
+        turnover = columns['turnover_24h']
+        last_price = columns['last_price']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volatility = (columns['high_24h'] - columns['low_24h']) / last_price
+            
+        valid = eligible & (turnover >= self.min_turnover) & np.isfinite(volatility) & (last_price > 0)
+        count = int(valid.sum())
+        if count == 0:
+            return []
+            
+        # 백분위 순위 (0~1]로 척도 차이 제거
+        turnover_rank = (np.argsort(np.argsort(turnover[valid])) + 1) / count
+        volatility_rank = (np.argsort(np.argsort(volatility[valid])) + 1) / count
+        scores = (1 - self.volatility_weight) * turnover_rank + self.volatility_weight * volatility_rank
+        
+        order = np.argsort(-scores, kind='stable')
+        return list(zip(names[valid][order].tolist(), scores[order].tolist()))
+    
+    def select(self, ranked: List[Tuple[str, float]]) -> Tuple[List[str], List[str]]:
+        """순위로 구성 갱신, (추가 심볼, 제외 심볼) 반환 (순위가 비면 기존 구성 유지)"""
+        if not ranked:
+            return [], []
+        
+        positions = {symbol: i for i, (symbol, _) in enumerate(ranked)}
+        keep_limit = int(self.size * (1 + self.retire_buffer))
+        
+        # 고정 심볼 -> 완충 순위 안의 기존 심볼 -> 상위 순위 순으로 채움
+        selected = [symbol for symbol in self.pinned if symbol in self.listed]
+        selected += [
+            symbol for symbol in self.members
+            if symbol not in selected and positions.get(symbol, keep_limit) < keep_limit
+        ]
+        for symbol, _ in ranked:
+            if len(selected) >= self.size:
+                break
+            if symbol not in selected:
+                selected.append(symbol)
+                
+        added = [symbol for symbol in selected if symbol not in self.members]
+        retired = [symbol for symbol in self.members if symbol not in selected]
+        
+        self.members = selected
+        self.scores = dict(ranked)
+        self.refreshed_at = time.time()
+        self.stats['refreshes'] += 1
+        self.stats['added'] += len(added)
+        self.stats['retired'] += len(retired)
+        return added, retired
+    
+    def refresh(self, tickers, instruments: Dict[str, Dict]) -> Tuple[List[str], List[str]]:
+        """순위 재계산 후 구성 갱신"""
+        return self.select(self.rank(tickers, instruments))
+    
+    def is_due(self, interval: float) -> bool:
+        """재구성 주기 도래 여부"""
+        return self.refreshed_at is None or time.time() - self.refreshed_at >= interval
+    
+    def get_status(self) -> Dict[str, Any]:
+        """상태 반환"""
+        return {
+            'size': len(self.members),
+            'target': self.size,
+            'listed': len(self.listed),
+            'refreshed_at': self.refreshed_at,
+            **self.stats
+        }